@@ -15,7 +15,11 @@ from handleData import DataMissingError, NoSuchLabelError
 from decimal import Decimal as dec
 import decimal
 import traceback
-from math import pow, sqrt
+import operator
+from math import pow, sqrt, log
+from tables import LookupTable
+from bitfields import StatusDecoder, ByteCombiner
+import timing
 
 
 #===================================================================================================================
@@ -31,6 +35,11 @@ class DataConverter(object):
 	reader = None
 	outputter = None
 	suppress_range_check = False
+	raw_inputs = None				#raw labels process() reads, if not just raw_label (see inputs())
+	converted_inputs = ()			#conv labels of other fields process() reads from the outputter
+	memoize = True					#False if process() or respond() depends on anything but inputs() (see convert.py)
+	range_table = None				#the RangeTable that checks this converter's data with every other field's, if any...
+	range_index = None				#...and its index there (see ranges.py)
 #-------------------------------------------------------------------------------------------------------------------
 #													CONSTRUCTOR:
 # Initializes DataConverter object. Should be added to in subclass definitions.
@@ -38,6 +47,7 @@ class DataConverter(object):
 		self.raw_label = type(self).__name__
 		self.conv_label = type(self).__name__
 		self.last_val = Config.ERROR_VAL
+		self.last_inputs = None		#inputs last_val was converted from, if it can be reused for the same again
 		self.lower_bound = dec("-Infinity")
 		self.upper_bound = dec("Infinity")
 		self.status_error = False
@@ -45,6 +55,7 @@ class DataConverter(object):
 		self.process_error = False
 		self.dec_places_round = 4
 		self.report_out_of_range_data = True
+		self.timer = timing.PhaseTimer() if timing.CONVERTER_TIMING else None
 
 #-------------------------------------------------------------------------------------------------------------------
 #													UPDATE READER/OUTPUTTER:
@@ -72,11 +83,15 @@ class DataConverter(object):
 #													CHECK RANGE OF DATA:
 # Confirms that converted is within range specified in subclass definition. If not, alerts and replaces data with
 # error value. For some subclasses, it may be necessary to overwrite this with more complex logic, but in the case
-# where one of the bounds is not required, just use +/-infinity in __init__().
+# where one of the bounds is not required, just use +/-infinity in __init__(). A converter in a ConversionPlan's
+# RangeTable only hands its data over to the table here, to be checked at the end of the cycle with every other field.
 	def check_range(self,converteddata):
 		if type(converteddata) is str:
 			return converteddata
 
+		if self.range_table is not None:
+			return self.range_table.defer(self.range_index, converteddata)
+
 		if self.suppress_range_check:
 			return converteddata
 
@@ -100,24 +115,47 @@ class DataConverter(object):
 # overwritten in subclass definitions. The idea is that only this needs to be called and all relevant things will
 # be taken care of.
 	def safe_process(self):
+		self.process_safely(timing.untimed, 0)
+
+#-------------------------------------------------------------------------------------------------------------------
+#													TIMED SAFE_PROCESS:
+# safe_process, timing each of its phases into self.timer (see timing.py). Takes the place of safe_process when
+# Config.CONVERTER_TIMING is set. A phase that raises is timed up to the exception.
+	def timed_safe_process(self):
+		self.process_safely(self.timer.lap, timing.clock())
+
+#-------------------------------------------------------------------------------------------------------------------
+#													PROCESS SAFELY:
+# The body of safe_process and timed_safe_process. lap(phase, start) is called at the end of each phase with the
+# time it started, and returns the start of the next: PhaseTimer.lap, or timing.untimed, which does nothing.
+	def process_safely(self, lap, start):
+		phase = timing.GET
 		try:
 			if self.raw_label != "N/A": 
-				data = DataConverter.reader.get(self.raw_label)
+				data = DataConverter.reader.get_value(self.raw_label)
 			else:
 				data = Config.ERROR_VAL
+			start = lap(phase, start)
+			phase = timing.PROCESS
 			data = self.process(data)
+			start = lap(phase, start)
+			phase = timing.ROUND
 			if data != Config.ERROR_VAL:
 				try:
 					data = round(data, self.dec_places_round)
 				except TypeError:
 					pass #in cases of the data not being a number or no rounding desired
+			start = lap(phase, start)
+			phase = timing.CHECK_RANGE
 			data = self.check_range(data)
 			if self.process_error:
 				self.process_error = False
 				errors.error(self.conv_label + " process error resolved. Data processed successfully.")
+			start = lap(phase, start)
 		except DataMissingError as e:
 			errors.debug(e)
 			data = Config.ERROR_VAL
+			start = lap(phase, start)
 		except:
 			if not self.process_error:
 				errors.error("PROCESS ERROR: " + self.conv_label + " unable to process received data" + 
@@ -125,8 +163,11 @@ class DataConverter(object):
 					traceback.format_exc(Config.TRACEBACK_LIMIT))
 			self.process_error = True
 			data = Config.ERROR_VAL
+			start = lap(phase, start)
 		DataConverter.outputter.receive(self.conv_label, data)
+		start = lap(timing.RECEIVE, start)
 		self.respond(data)
+		lap(timing.RESPOND, start)
 		self.last_val = data
 
 #-------------------------------------------------------------------------------------------------------------------
@@ -136,8 +177,225 @@ class DataConverter(object):
 		self.process_error = False
 		self.range_error = False
 		self.status_error = False
+		self.last_inputs = None
+		if self.range_table is not None:
+			self.range_table.clear(self.range_index)
 		if self.suppress_range_check:
 			errors.info("Reminder: range check suppressed for " + self.conv_label)
+
+#-------------------------------------------------------------------------------------------------------------------
+#													INPUTS:
+# Returns the raw labels and the conv labels of other fields that this converter's data is converted from. By
+# default that is its raw_label alone. Subclasses whose process() reads anything else must list everything it reads
+# in raw_inputs and converted_inputs, so that convert.py can convert fields after the fields they depend on.
+	def inputs(self):
+		raw_inputs = self.raw_inputs
+		if raw_inputs is None:
+			raw_inputs = () if self.raw_label == "N/A" else (self.raw_label,)
+		return tuple(raw_inputs), tuple(self.converted_inputs)
+
+if timing.CONVERTER_TIMING:																	#see TIMED SAFE_PROCESS above
+	DataConverter.safe_process = DataConverter.__dict__["timed_safe_process"]
+
+#===================================================================================================================
+#													CONVERTER SPECS
+#===================================================================================================================
+# Most fields need nothing more than a chain of arithmetic on one raw value, with bounds and rounding. Rather than
+# writing a subclass for each, such a field is declared with spec(), which makes the subclass from a description of
+# the field. For example,
+#
+#	geiger_high_volts = spec("geiger_high_volts", ops=[("/", 1024), ("*", 5), ("*", 250)],
+#		lower_bound=800, upper_bound=900, dec_places_round=1)
+#
+# converts by ((dec(rawdata)/1024)*5)*250. A spec holds:
+#	label		the outgoing field, and the name of the subclass made (conv_label and raw_label default to it)
+#	formula		what is done to the raw value first: "dec" (Decimal, the default) or "int"
+#	ops			(operator, operand) pairs applied in order to the result, operator one of + - * /. Operands are used
+#				exactly as given, so write them as the equation would (dec("0.001"), not 0.001)
+#	decoder		in place of formula, a function of the raw value returning the converted value (eg, a status string)
+#	combiner	a ByteCombiner (see bitfields.py) whose bytes make up the raw value, in place of raw_label's
+#	and any of raw_label, conv_label, lower_bound, upper_bound, dec_places_round, report_out_of_range_data and
+#	suppress_range_check, which mean what they mean for any DataConverter.
+#	backend		"decimal" or "float": what a "dec" formula computes in. Defaults to NUMERIC_BACKEND, and may be
+#				overridden for any field by Config.CONVERTER_BACKENDS (see journal.compare_backends())
+# convert.py compiles every spec'd converter without a combiner into a ConversionPlan, which runs them in one loop
+# without calling their methods. Fields with their own process, respond or check_range logic are still written as
+# subclasses, as below.
+
+NUMERIC_BACKEND = getattr(Config, "NUMERIC_BACKEND", "decimal")							#what spec'd converters compute in unless told otherwise
+CONVERTER_BACKENDS = getattr(Config, "CONVERTER_BACKENDS", {})								#keys conv_label to the backend for that field, overriding the above and its spec
+
+BACKENDS = {"decimal": dec, "float": float}													#what a "dec" formula and its operands become in each backend
+SPEC_FORMULAS = {"dec": dec, "int": int}
+SPEC_OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.div}	#operator.div is / as written in this file
+SPEC_ATTRIBUTES = ["raw_label", "conv_label", "lower_bound", "upper_bound", "dec_places_round",
+	"report_out_of_range_data", "suppress_range_check", "backend"]
+
+class SpecConverter(DataConverter):
+	spec = {}																				#set by spec() for each subclass
+	def __init__(self):
+		DataConverter.__init__(self)
+		for attr in SPEC_ATTRIBUTES:
+			if attr in self.spec:
+				setattr(self, attr, self.spec[attr])
+		self.combiner = self.spec.get("combiner")
+		if self.combiner is not None:
+			self.raw_label = "N/A"
+			self.raw_inputs = self.combiner.labels
+		self.set_backend(CONVERTER_BACKENDS.get(self.conv_label, self.spec.get("backend", NUMERIC_BACKEND)))
+
+	def set_backend(self, backend):
+		"""
+		Makes this converter compute in backend, "decimal" or "float". Only a
+		"dec" formula is affected: its raw value and operands become floats.
+		A ConversionPlan made before this is called keeps the old backend.
+		"""
+		if backend not in BACKENDS:
+			raise ValueError("Unknown numeric backend " + repr(backend) + " for " + self.conv_label + ".")
+		self.backend = backend
+		self.last_inputs = None																#last_val may not be what this backend gives
+		numeric = self.spec["decoder"] is None and self.spec["formula"] == "dec"
+		if numeric:
+			self.formula = BACKENDS[backend]
+			self.ops = tuple((SPEC_OPS[op], BACKENDS[backend](operand)) for op, operand in self.spec["ops"])
+		else:
+			self.formula = self.spec["decoder"] or SPEC_FORMULAS[self.spec["formula"]]
+			self.ops = tuple((SPEC_OPS[op], operand) for op, operand in self.spec["ops"])
+
+	def process(self, rawdata):																#ConversionPlan does the same inline; this is for running one on its own
+		if self.combiner is not None:
+			rawdata = self.combiner.read(DataConverter.reader)
+		converted = self.formula(rawdata)
+		for op, operand in self.ops:
+			converted = op(converted, operand)
+		return converted
+
+def spec(label, formula="dec", ops=(), decoder=None, combiner=None, **attributes):
+	"""Returns a SpecConverter subclass named label that converts as described (see above)."""
+	if formula not in SPEC_FORMULAS:
+		raise ValueError("Spec for " + label + " has unknown formula " + repr(formula) + ".")
+	for op, operand in ops:
+		if op not in SPEC_OPS:
+			raise ValueError("Spec for " + label + " has unknown operator " + repr(op) + ".")
+	for attr in attributes:
+		if attr not in SPEC_ATTRIBUTES:
+			raise ValueError("Spec for " + label + " sets unknown attribute " + attr + ".")
+	backend = attributes.get("backend", NUMERIC_BACKEND)
+	if backend not in BACKENDS:
+		raise ValueError("Spec for " + label + " has unknown backend " + repr(backend) + ".")
+	settings = dict(attributes, formula=formula, ops=list(ops), decoder=decoder, combiner=combiner)
+	return type(label, (SpecConverter,), {"spec": settings})
+
+#===================================================================================================================
+#													STATUS BYTES
+#===================================================================================================================
+# A status byte that should be alerted to is declared with status(), giving the StatusDecoder (see bitfields.py) that
+# says what its bits mean and the name to alert by. It alerts when the byte first reports a condition, eg
+# 		Geiger status reported under voltage, high current
+# and again as each further condition begins while any persists, eg
+# 		Geiger status now also reports shutdown
+# Once the byte reports no condition, the next is alerted to anew. Its other attributes are as for spec().
+# A status byte that needs no alerts is just spec()'d with its decoder (see power_status).
+
+class StatusConverter(DataConverter):
+	decoder = None																			#set by status() for each subclass
+	alert_name = None
+	attributes = {}
+	def __init__(self):
+		DataConverter.__init__(self)
+		for attr in self.attributes:
+			setattr(self, attr, self.attributes[attr])
+		self.alerted = 0																	#conditions alerted to since the byte last reported none
+
+	def process(self, rawdata):
+		converted, conditions = self.decoder.decode(rawdata)
+		if not conditions:
+			self.status_error = False
+		elif not self.status_error:
+			errors.error(self.alert_name + " reported " + converted)
+			self.status_error = True
+			self.alerted = conditions
+		elif conditions & ~self.alerted:
+			errors.error(self.alert_name + " now also reports " + self.decoder.describe(conditions & ~self.alerted))
+			self.alerted |= conditions
+		return converted
+
+def status(label, decoder, alert_name, **attributes):
+	"""Returns a StatusConverter subclass named label that decodes by decoder and alerts as alert_name."""
+	for attr in attributes:
+		if attr not in SPEC_ATTRIBUTES or attr == "backend":
+			raise ValueError("Status spec for " + label + " sets unknown attribute " + attr + ".")
+	return type(label, (StatusConverter,), {"decoder": decoder, "alert_name": alert_name, "attributes": attributes})
+
+#===================================================================================================================
+#													LOOKUP TABLE FORMULAS
+#===================================================================================================================
+# The RTD and thermistor conversions below are slow in Decimal, so each is looked up in a LookupTable (see tables.py)
+# built from the formula here. Each formula takes the raw reading x, the number type to compute in (dec or float)
+# and a coefficient set, and computes exactly what the converters using it used to compute inline when given dec.
+# Each coefficient is (mantissa, power of ten), as in dec("1.0241")*dec(pow(10,-6)).
+# Each table's tolerance is half a unit in the last place its converters round to.
+
+CALLENDAR_RTD = (("-247.29", 0), ("2.3992", 0), ("0.00063962", 0), ("1.0241", -6))			#RTD resistance to degrees C: c0 + c1*r + c2*r**2 + c3*r**3
+TEMP_HEAD_THERMISTOR = (("0.001125308852122", 0), ("0.000234711863267", 0), ("0.000000085663516", 0))	#Steinhart-Hart a, b and c
+SOLAR_THERMISTOR = (("1.1292418", -3), ("2.341077", -4), ("8.775468", -8))
+
+def scaled(num, coefficient):
+	mantissa, exponent = coefficient
+	if exponent:
+		return num(mantissa)*num(pow(10,exponent))
+	return num(mantissa)
+
+def ln(x):
+	if isinstance(x, dec):
+		return x.ln()
+	return log(x)
+
+def callendar(r, num, c):
+	return scaled(num, c[0]) + (scaled(num, c[1])*r) + (scaled(num, c[2])*(r**2)) + (scaled(num, c[3])*(r**3))
+
+def steinhart_hart(r, num, c):
+	a, b, c = [scaled(num, coefficient) for coefficient in c]
+	lnr = ln(r)
+	return 1/(a + (b*lnr) + (c*(lnr**3)))
+
+def rtd_1k_combined(x, num, c):																#24-bit reading to degrees F (the dec(9/5) is 1, as it always has been)
+	r = (((num(x)/8388608)*num("2.5"))/num("0.0005"))/10
+	return (callendar(r, num, c)*num(9/5)) - num("459.67")
+
+def rtd_100_combined(x, num, c):
+	r = ((num(x)/8388608)*num("2.5"))/num("0.0005")
+	return (callendar(r, num, c)*num(9/5)) - num("459.67")
+
+def ten_rtd(x, num, c):
+	r = (((num(x)/65536)*num("4.096"))/num("0.0005"))/10
+	return (callendar(r, num, c)*num(9/5)) - num("459.67")
+
+def power_rtd(x, num, c):
+	r = ((num(x)/65536)*num("4.096"))*1000
+	return (callendar(r, num, c)*num(9/5)) - num("459.67")
+
+def soil_thermistor(x, num, c):
+	v = ((num(x)/524288)*num("4.096"))/10
+	r = (20000*v)/(num("4.096")-v)
+	return (callendar(r, num, c)*num(9/5)) - num("459.67")
+
+def temp_head_thermistor(x, num, c):
+	v = (num(x)/131072)*num("4.096")
+	r = (20000*v)/(num("4.096")-v)
+	return (steinhart_hart(r, num, c)*num(9/5)) - num("459.67")
+
+def solar_thermistor(x, num, c):															#result is in Kelvin
+	r = 24900*((5/((num(x)/65536)*5))-1)
+	return steinhart_hart(r, num, c)
+
+RTD_1K_TABLE = LookupTable("rtd_1k_combined", rtd_1k_combined, CALLENDAR_RTD, 24, 0.00005)	#also for RTD_Davis_combined and solar_globe_combined
+RTD_100_TABLE = LookupTable("rtd_100_combined", rtd_100_combined, CALLENDAR_RTD, 24, 0.00005)
+TEN_RTD_TABLE = LookupTable("ten_rtd", ten_rtd, CALLENDAR_RTD, 16, 0.005)
+POWER_RTD_TABLE = LookupTable("power_rtd", power_rtd, CALLENDAR_RTD, 16, 0.005)
+SOIL_TEMP_TABLE = LookupTable("soil_thermistor", soil_thermistor, CALLENDAR_RTD, 19, 0.0005)
+TEMP_HEAD_TABLE = LookupTable("temp_head_thermistor", temp_head_thermistor, TEMP_HEAD_THERMISTOR, 17, 0.0005)
+SOLAR_THERMISTOR_TABLE = LookupTable("solar_thermistor", solar_thermistor, SOLAR_THERMISTOR, 16, 0.0005)
 			
 #===================================================================================================================
 #...................................................................................................................
@@ -157,16 +415,7 @@ class DataConverter(object):
 # Typical background levels are around 100-120.
 # Requires no conversion or response.
 
-class geiger_ticks(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 5
-		self.upper_bound = 2000
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = int(rawdata)
-		return converted
+geiger_ticks = spec("geiger_ticks", formula="int", lower_bound=5, upper_bound=2000, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													VOLTS:
@@ -174,16 +423,8 @@ class geiger_ticks(DataConverter):
 # To convert from raw voltage, divide by 1024, multiply by 5, and multiply by 250.
 # The result is in volts.
 
-class geiger_high_volts(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 800
-		self.upper_bound = 900
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*5)*250
-		return converted
+geiger_high_volts = spec("geiger_high_volts", ops=[("/", 1024), ("*", 5), ("*", 250)],
+	lower_bound=800, upper_bound=900, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													AMPS:
@@ -191,31 +432,15 @@ class geiger_high_volts(DataConverter):
 # Each volt of raw data corresponds to 16.66 mA actual load current.
 # The result is in mA.
 
-class geiger_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 10
-		self.upper_bound = 55
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+geiger_current = spec("geiger_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound=10, upper_bound=55, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMPERATURE:
 # This is the temperature inside the geiger circuit in degrees F.
 
-class geiger_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -20
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)*dec("0.4"))-dec("273.16"))*dec("1.8"))+32
-		return converted
+geiger_temperature = spec("geiger_temperature", ops=[("*", dec("0.4")), ("-", dec("273.16")), ("*", dec("1.8")), ("+", 32)],
+	lower_bound=-20, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													STATUS:
@@ -225,65 +450,21 @@ class geiger_temperature(DataConverter):
 # 		2nd bit == 1 indicates high-current condition.
 # 		3rd bit == 1 indicates over-current condition and geiger high-voltage shutdown.
 
-class geiger_status(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 15
-		self.dec_places_round = "N/A"
-
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(4)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		converted = ""
-		if bit0:
-			converted += "under voltage, "
-		if bit1:
-			converted += "over voltage, "
-		if bit2:
-			converted += "high current, "
-		if bit3:
-			converted += "shutdown"
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Geiger status reported " + converted)
-			self.status_error = True
-		return converted
+GEIGER_STATUS = StatusDecoder([(0, "under voltage"), (1, "over voltage"), (2, "high current"), (3, "shutdown")])
+geiger_status = status("geiger_status", GEIGER_STATUS, "Geiger status",
+	lower_bound=0, upper_bound=15, dec_places_round="N/A")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													BURST COUNT:
 # Indicates max count of ticks within the last minute.
 
-class geiger_burst_count(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 25
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		return int(rawdata)
+geiger_burst_count = spec("geiger_burst_count", formula="int", lower_bound=0, upper_bound=25, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													BURST TIME:
 # Indicates a 3 second max count period packet within a minute.
 
-class geiger_burst_time(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 21
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		return int(rawdata)
+geiger_burst_time = spec("geiger_burst_time", formula="int", lower_bound=0, upper_bound=21, dec_places_round=1)
 
 #===================================================================================================================
 #													VORTEX BLOCK
@@ -293,43 +474,18 @@ class geiger_burst_time(DataConverter):
 #													AVERAGE SPEED:
 # Average windspeed over last minute measured by vortex anemometer. Result is in mph.
 
-class vortex_avg_speed(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 120
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*25)/600
-		return converted
+vortex_avg_speed = spec("vortex_avg_speed", ops=[("*", 25), ("/", 600)],
+	lower_bound=0, upper_bound=120, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													GUST:
 # Peak gust over last minute measured by vortex anemometer in mph.
-class vortex_wind_gust(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 120
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*25)/600
-		return converted
+vortex_wind_gust = spec("vortex_wind_gust", ops=[("*", 25), ("/", 600)],
+	lower_bound=0, upper_bound=120, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													CALCULATED WIND SPEED:
-class vortex_calc_mph(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 120
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec(600)
-		return converted
+vortex_calc_mph = spec("vortex_calc_mph", ops=[("/", dec(600))], lower_bound=0, upper_bound=120, dec_places_round=0)
 
 #===================================================================================================================
 #													RAIN GAUGE BLOCK
@@ -350,30 +506,12 @@ class rain_drip_code(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													INCHES OF RAIN:
 # Rain received in a day. Result is in inches.
-class rain_bucket(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 1500
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec(100)
-		return converted
+rain_bucket = spec("rain_bucket", ops=[("/", dec(100))], lower_bound=0, upper_bound=1500, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													INCHES OF RAIN:
 # Lower numbers indicate faster rainfall.
-class rain_rate(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 200
-		self.upper_bound = 65536
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = int(rawdata)
-		return converted
+rain_rate = spec("rain_rate", formula="int", lower_bound=200, upper_bound=65536, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													INCHES OF RAIN:
@@ -392,17 +530,8 @@ class rain_ten_min_dry(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													BATTERY VOLTAGE:
 # Result is in volts.
-class rain_battery_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.conv_label = "rain_battery_voltage"
-		self.lower_bound = 2.8
-		self.upper_bound = 4.6
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*dec("2.5"))*2
-		return converted
+rain_battery_voltage = spec("rain_battery_voltage", ops=[("/", 1024), ("*", dec("2.5")), ("*", 2)],
+	lower_bound=2.8, upper_bound=4.6, dec_places_round=2)
 
 
 #===================================================================================================================
@@ -411,161 +540,63 @@ class rain_battery_voltage(DataConverter):
 # 
 #-------------------------------------------------------------------------------------------------------------------
 #													RTD_1K_COMBINED
-class RTD_1K_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = -40
-		self.upper_bound = 105
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		upper = hex(int(DataConverter.reader.get("RTD_1K_upper")))
-		middle = hex(int(DataConverter.reader.get("RTD_1K_middle")))
-		lower = hex(int(DataConverter.reader.get("RTD_1K_lower")))
-		combined = int(upper[2:] + middle[2:] + lower[2:], base = 16)
-		r = dec(((((dec(combined) / 8388608)*dec("2.5"))/dec("0.0005"))/10))
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2))+ ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*dec((9/5))) - dec("459.67") 
-		return converted
+RTD_1K_combined = spec("RTD_1K_combined", decoder=RTD_1K_TABLE.convert,
+	combiner=ByteCombiner(["RTD_1K_upper", "RTD_1K_middle", "RTD_1K_lower"]),
+	lower_bound=-40, upper_bound=105, dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RTD_100_COMBINED
-class RTD_100_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = -40
-		self.upper_bound = 105
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		upper = hex(int(DataConverter.reader.get("RTD_100_upper")))
-		middle = hex(int(DataConverter.reader.get("RTD_100_middle")))
-		lower = hex(int(DataConverter.reader.get("RTD_100_lower")))
-		combined = int(upper[2:] + middle[2:] + lower[2:], base = 16)
-		r = dec((((dec(combined) / 8388608)*dec("2.5"))/dec("0.0005")))
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2))+ ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*dec((9/5))) - dec("459.67")
-		return converted
+RTD_100_combined = spec("RTD_100_combined", decoder=RTD_100_TABLE.convert,
+	combiner=ByteCombiner(["RTD_100_upper", "RTD_100_middle", "RTD_100_lower"]),
+	lower_bound=-40, upper_bound=105, dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RTD_DAVIS_COMBINED
-class RTD_Davis_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = -40
-		self.upper_bound = 105
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		upper = hex(int(DataConverter.reader.get("RTD_Davis_upper")))
-		middle = hex(int(DataConverter.reader.get("RTD_Davis_middle")))
-		lower = hex(int(DataConverter.reader.get("RTD_Davis_lower")))
-		combined = int(upper[2:] + middle[2:] + lower[2:], base = 16)
-		r = dec(((((dec(combined) / 8388608)*dec("2.5"))/dec("0.0005"))/10))
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2))+ ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*dec((9/5))) - dec("459.67")
-		return converted
+RTD_Davis_combined = spec("RTD_Davis_combined", decoder=RTD_1K_TABLE.convert,
+	combiner=ByteCombiner(["RTD_Davis_upper", "RTD_Davis_middle", "RTD_Davis_lower"]),
+	lower_bound=-40, upper_bound=105, dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RH_SENSOR_1:
 # Result is humidity in %. Sensor is HIH-5030.
-class RH_sensor_1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 15
-		self.upper_bound = 101
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("32.2") - dec("25.8") 
-		return converted
+RH_sensor_1 = spec("RH_sensor_1", ops=[("*", dec("32.2")), ("-", dec("25.8"))],
+	lower_bound=15, upper_bound=101, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RH_SENSOR_2:
 # Result is humidity in %. Sensor is HIH-5030.
-class RH_sensor_2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 15
-		self.upper_bound = 101
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("32.2") - dec("25.8") 
-		return converted
+RH_sensor_2 = spec("RH_sensor_2", ops=[("*", dec("32.2")), ("-", dec("25.8"))],
+	lower_bound=15, upper_bound=101, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													OUTER_SHIELD_LM335:
 # Result is in degrees Fahrenheit.
-class outer_shield_LM335(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 110
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/131072)*10)-dec("2.7316"))*180)+32
-		return converted
+outer_shield_LM335 = spec("outer_shield_LM335", ops=[("/", 131072), ("*", 10), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=-30, upper_bound=110, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													MIDDLE_SHIELD_LM335:
 # Result is in degrees Fahrenheit.
-class middle_shield_LM335(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 100
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/131072)*10)-dec("2.7316"))*180)+32
-		return converted
+middle_shield_LM335 = spec("middle_shield_LM335", ops=[("/", 131072), ("*", 10), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=-30, upper_bound=100, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													INNER_SHIELD_LM335:
 # Result is in degrees Fahrenheit.
-class inner_shield_LM335(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 100
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/131072)*10)-dec("2.7316"))*180)+32
-		return converted
+inner_shield_LM335 = spec("inner_shield_LM335", ops=[("/", 131072), ("*", 10), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=-30, upper_bound=100, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													BOWL_LM335:
 # Result is in degrees Fahrenheit.
-class bowl_LM335(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 100
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/131072)*10)-dec("2.7316"))*180)+32
-		return converted
+bowl_LM335 = spec("bowl_LM335", ops=[("/", 131072), ("*", 10), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=-30, upper_bound=100, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													AMBIENT_TEMP_LM335:
 # Result is in degrees Fahrenheit.
-class ambient_temp_LM335(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 100
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/131072)*10)-dec("2.7316"))*180)+32
-		return converted
+ambient_temp_LM335 = spec("ambient_temp_LM335", ops=[("/", 131072), ("*", 10), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=-30, upper_bound=100, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													IR_SNOW_DEPTH:
@@ -585,80 +616,35 @@ class IR_snow_depth(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_HEAD_FAN_AIRFLOW:
 # Result is in arbitrary units.
-class temp_head_fan_airflow(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0.1
-		self.upper_bound = 0.25
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/131072)*5
-		return converted
+temp_head_fan_airflow = spec("temp_head_fan_airflow", ops=[("/", 131072), ("*", 5)],
+	lower_bound=0.1, upper_bound=0.25, dec_places_round=4)
 
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_HEAD_FAN_VOLTAGE:
 # Result is in volts.
-class temp_head_fan_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.conv_label = "temp_head_fan_voltage"
-		self.lower_bound = 5
-		self.upper_bound = 13
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/131072)*5)*5
-		return converted
+temp_head_fan_voltage = spec("temp_head_fan_voltage", ops=[("/", 131072), ("*", 5), ("*", 5)],
+	lower_bound=5, upper_bound=13, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_HEAD_FAN_CURRENT:
 # Result is in volts.
-class temp_head_fan_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 200
-		self.upper_bound = 475
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/131072)*5)/6
-		return converted
+temp_head_fan_current = spec("temp_head_fan_current", ops=[("/", 131072), ("*", 5), ("/", 6)],
+	lower_bound=200, upper_bound=475, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PTB_CONVERTED:
 # Result is in inches of mercury.
-class PTB_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = 25
-		self.upper_bound = 32
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		upper = hex(int(DataConverter.reader.get("PTB_upper")))
-		middle = hex(int(DataConverter.reader.get("PTB_middle")))
-		lower = hex(int(DataConverter.reader.get("PTB_lower")))
-		combined = int(upper[2:] + middle[2:] + lower[2:], base = 16)
-		converted = (((dec(combined)/16777216)*600)+500)*dec("0.0295299831")
-		return converted
+PTB_combined = spec("PTB_combined", ops=[("/", 16777216), ("*", 600), ("+", 500), ("*", dec("0.0295299831"))],
+	combiner=ByteCombiner(["PTB_upper", "PTB_middle", "PTB_lower"]),
+	lower_bound=25, upper_bound=32, dec_places_round=4)
 
 
 #-------------------------------------------------------------------------------------------------------------------
 #													AD_TEMPERATURE:
 # Result is in degrees Fahrenheit.
-class AD_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 100
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (((((dec(rawdata)/131072)*10)-dec("2.7316"))*100)*dec("1.8"))+32
-		return converted
+AD_temperature = spec("AD_temperature", ops=[("/", 131072), ("*", 10), ("-", dec("2.7316")), ("*", 100), ("*", dec("1.8")), ("+", 32)],
+	lower_bound=0, upper_bound=100, dec_places_round=3)
 
 #===================================================================================================================
 #													FAN BLOCK
@@ -667,101 +653,43 @@ class AD_temperature(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													FAN_VOLTAGE:
 # Result is in volts.
-class fan_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 5
-		self.upper_bound = 13
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*5)*5
-		return converted
+fan_voltage = spec("fan_voltage", ops=[("/", 1024), ("*", 5), ("*", 5)],
+	lower_bound=5, upper_bound=13, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FAN_CURRENT:
 # Result is in milliamps.
-class fan_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 200
-		self.upper_bound = 475
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+fan_current = spec("fan_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound=200, upper_bound=475, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FAN_SPEED:
 # Result is in rpm.
-class fan_speed(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1200
-		self.upper_bound = 1900
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = int(rawdata) * 20
-		return converted
+fan_speed = spec("fan_speed", formula="int", ops=[("*", 20)], lower_bound=1200, upper_bound=1900, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TS4200_CURRENT:
 # Result is in mA.
-class TS4200_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 100
-		self.upper_bound = 150
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+TS4200_current = spec("TS4200_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound=100, upper_bound=150, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RF_LINK_CURRENT:
 # Result is in mA.
-class RF_link_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 100
-		self.upper_bound = 250
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+RF_link_current = spec("RF_link_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound=100, upper_bound=250, dec_places_round=1)
 
 
 #-------------------------------------------------------------------------------------------------------------------
 #													BOX_HUMIDITY:
 # Sensor directly outputs humidity 0-100%.
-class box_humidity(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 100
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+box_humidity = spec("box_humidity", lower_bound=0, upper_bound=100, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													GROUND_TEMPERATURE:
 # Result is in degrees Fahrenheit.
-class ground_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -45
-		self.upper_bound = 130
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/50)-dec("273.16"))*dec("1.8"))+32
-		return converted
+ground_temperature = spec("ground_temperature", ops=[("/", 50), ("-", dec("273.16")), ("*", dec("1.8")), ("+", 32)],
+	lower_bound=-45, upper_bound=130, dec_places_round=3)
 
 #===================================================================================================================
 #													TEN FOOT BLOCK
@@ -786,59 +714,25 @@ class snow_depth_sonic(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													BAROMETRIC_PRESSURE:
 # Long and complicated procedure
-class barometric_pressure(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 26
-		self.upper_bound = 32
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+barometric_pressure = spec("barometric_pressure", lower_bound=26, upper_bound=32, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													BAROMETRIC_TEMPERATURE:
 # Long and complicated procedure
-class barometric_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 110
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+barometric_temperature = spec("barometric_temperature", lower_bound=-30, upper_bound=110, dec_places_round=2)
 
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEN_ENCLOSURE_TEMP:
 # Result is in degrees Fahrenheit.
-class ten_enclosure_temp(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -20
-		self.upper_bound = 115
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)*4)/10)-dec("273.16"))*dec("1.8"))+32
-		return converted
+ten_enclosure_temp = spec("ten_enclosure_temp", ops=[("*", 4), ("/", 10), ("-", dec("273.16")), ("*", dec("1.8")), ("+", 32)],
+	lower_bound=-20, upper_bound=115, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEN_CIRCUIT_CURRENT:
 # Result is in mA.
-class ten_circuit_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 5
-		self.upper_bound = 40
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+ten_circuit_current = spec("ten_circuit_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound=5, upper_bound=40, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEN_RTD_TEMPERATURE
@@ -851,94 +745,40 @@ class ten_RTD_temperature(DataConverter):
 		self.dec_places_round = 2
 
 	def process(self, rawdata):
-		r = (((dec(rawdata)/65536)*dec("4.096"))/dec("0.0005"))/10
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + (dec("1.0241")*dec(pow(10,-6))*(r**3))
-		converted = (t*dec(9/5))-dec("459.67")
-		return converted
+		return TEN_RTD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RH_PRECON:
 # Result is humidity rounded to 1 decimal place.
-class RH_Precon(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 5
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/131072)*dec("4.0886"))*100)/5
-		return converted
+RH_Precon = spec("RH_Precon", ops=[("/", 131072), ("*", dec("4.0886")), ("*", 100), ("/", 5)],
+	lower_bound=5, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMPERATURE_PRECON:
 # Result is temperature (F) rounded to 1 decimal place.
-class Temperature_Precon(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -30
-		self.upper_bound = 120
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/131072)*dec("4.0886"))/dec("0.02137"))-22)*dec("0.818")
-		return converted
+Temperature_Precon = spec("Temperature_Precon", ops=[("/", 131072), ("*", dec("4.0886")), ("/", dec("0.02137")), ("-", 22), ("*", dec("0.818"))],
+	lower_bound=-30, upper_bound=120, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													RH_HONEYWELL:
 # Result is humidity rounded to 1 decimal place.
-class RH_Honeywell(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 5
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("32.2")) - dec("25.8")
-		return converted
+RH_Honeywell = spec("RH_Honeywell", ops=[("*", dec("32.2")), ("-", dec("25.8"))],
+	lower_bound=5, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEN_AVG_WIND_SPEED
 # Peet Bros.-time of 1 rotation of the cups, counts of 30.5 usec pulses
-class ten_avg_wind_speed(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "N/A"
-		self.upper_bound = "N/A"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+ten_avg_wind_speed = spec("ten_avg_wind_speed", lower_bound="N/A", upper_bound="N/A", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEN_INSTANT_WIND_SPEED
 # time that magnet sensor is closed, counts of 30.5 usec pulses
-class ten_instant_wind_speed(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "N/A"
-		self.upper_bound = "N/A"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+ten_instant_wind_speed = spec("ten_instant_wind_speed", lower_bound="N/A", upper_bound="N/A", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEN_WIND_DIRECTION
 # time that magnet sensor is closed, counts of 30.5 usec pulses
-class ten_wind_direction(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "N/A"
-		self.upper_bound = "N/A"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+ten_wind_direction = spec("ten_wind_direction", lower_bound="N/A", upper_bound="N/A", dec_places_round=1)
 
 #===================================================================================================================
 #													POWER SUPPLY BLOCK
@@ -947,539 +787,219 @@ class ten_wind_direction(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_100WA_VOLTAGE:
 # Result is in volts.
-class power_100WA_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_100WA_voltage = spec("power_100WA_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_100WA_CURRENT:
 # Result is in mA.
-class power_100WA_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 6000
-		self.dec_places_round = 0
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("167"))*dec("1000")
-		return converted
+power_100WA_current = spec("power_100WA_current", ops=[("-", dec("2500")), ("/", dec("167")), ("*", dec("1000"))],
+	lower_bound=0, upper_bound=6000, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_100WB_VOLTAGE:
 # Result is in volts.
-class power_100WB_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_100WB_voltage = spec("power_100WB_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_100WB_CURRENT:
 # Result is in mA.
-class power_100WB_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 6000
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("167"))*dec("1000")
-		return converted
+power_100WB_current = spec("power_100WB_current", ops=[("-", dec("2500")), ("/", dec("167")), ("*", dec("1000"))],
+	lower_bound=0, upper_bound=6000, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_50W_VOLTAGE:
 # Result is in volts.
-class power_50W_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_50W_voltage = spec("power_50W_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_50W_CURRENT:
 # Result is in mA.
-class power_50W_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 3100
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("185"))*dec("1000")
-		return converted
+power_50W_current = spec("power_50W_current", ops=[("-", dec("2500")), ("/", dec("185")), ("*", dec("1000"))],
+	lower_bound=0, upper_bound=3100, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_20WA_VOLTAGE:
 # Result is in volts.
-class power_20WA_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_20WA_voltage = spec("power_20WA_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_20WA_CURRENT:
 # Result is in mA.
-class power_20WA_current(DataConverter):
-	suppress_range_check = True
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 1400
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("185"))*dec("1000")
-		return converted
+power_20WA_current = spec("power_20WA_current", ops=[("-", dec("2500")), ("/", dec("185")), ("*", dec("1000"))],
+	lower_bound=0, upper_bound=1400, dec_places_round=0, suppress_range_check=True)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_LOAD_VOLTAGE:
 # Result is in volts.
-class power_load_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 15
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_load_voltage = spec("power_load_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=15, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_LOAD_CURRENT:
 # Result is in mA.
-class power_load_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 2
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("1.2")
-		return converted
+power_load_current = spec("power_load_current", ops=[("/", dec("1.2"))],
+	lower_bound=0, upper_bound=2, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_VOLTAGE:
 # Result is in volts.
-class power_battery_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_battery_voltage = spec("power_battery_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_CURRENT:
 # Result is in mA.
-class power_battery_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -15000
-		self.upper_bound = 2000
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("83"))*dec("1000")
-		return converted
+power_battery_current = spec("power_battery_current", ops=[("-", dec("2500")), ("/", dec("83")), ("*", dec("1000"))],
+	lower_bound=-15000, upper_bound=2000, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_SOLAR_VOLTAGE:
 # Result is in volts.
-class power_solar_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_solar_voltage = spec("power_solar_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_SOLAR_CURRENT:
 # Result is in mA.
-class power_solar_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 15000
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("83"))*dec("1000")
-		return converted  
+power_solar_current = spec("power_solar_current", ops=[("-", dec("2500")), ("/", dec("83")), ("*", dec("1000"))],
+	lower_bound=0, upper_bound=15000, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_20WB_VOLTAGE:
 # Result is in volts.
-class power_20WB_voltage(DataConverter):
-	
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 19
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/dec("1000")) * dec("5.02")
-		return converted
+power_20WB_voltage = spec("power_20WB_voltage", ops=[("/", dec("1000")), ("*", dec("5.02"))],
+	lower_bound=0, upper_bound=19, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_20WB_CURRENT:
 # Result is in mA.
-class power_20WB_current(DataConverter):
-	suppress_range_check = True
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 1400
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata) - dec("2500"))/dec("185"))*dec("1000")
-		return converted
+power_20WB_current = spec("power_20WB_current", ops=[("-", dec("2500")), ("/", dec("185")), ("*", dec("1000"))],
+	lower_bound=0, upper_bound=1400, dec_places_round=0, suppress_range_check=True)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_FAN_CURRENT_A:
 # Result is in mA.
-class power_fan_current_A(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 50
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("60")
-		return converted
+power_fan_current_A = spec("power_fan_current_A", ops=[("/", dec("60"))],
+	lower_bound=0, upper_bound=50, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_HEATER_CURRENT_A:
 # Result is in mA.
-class power_heater_current_A(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 650
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("6")
-		return converted
+power_heater_current_A = spec("power_heater_current_A", ops=[("/", dec("6"))],
+	lower_bound=0, upper_bound=650, dec_places_round=1)
 
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_TEMPERATURE_A:
 # Result is temperature in degrees Fahrenheit.
-class power_battery_temperature_A(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 50
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)-dec("2731.6"))*dec(".18")) + dec("32")
-		return converted
+power_battery_temperature_A = spec("power_battery_temperature_A", ops=[("-", dec("2731.6")), ("*", dec(".18")), ("+", dec("32"))],
+	lower_bound=50, upper_bound=100, dec_places_round=1)
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_CABINET_TEMPERATURE:
 # Result is temperature in degrees Fahrenheit.
-class power_cabinet_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 10
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)-dec("2731.6"))*dec(".18")) + dec("32")
-		return converted
+power_cabinet_temperature = spec("power_cabinet_temperature", ops=[("-", dec("2731.6")), ("*", dec(".18")), ("+", dec("32"))],
+	lower_bound=10, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_MPPT_TEMPERATURE:
 # Result is temperature in degrees Fahrenheit.
-class power_MPPT_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 10
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)-dec("2731.6"))*dec(".18")) + dec("32")
-		return converted
+power_MPPT_temperature = spec("power_MPPT_temperature", ops=[("-", dec("2731.6")), ("*", dec(".18")), ("+", dec("32"))],
+	lower_bound=10, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_5C_VOLTAGE:
 # Result is in volts.
-class power_5C_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 4.7
-		self.upper_bound = 5.1
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("500")
-		return converted
+power_5C_voltage = spec("power_5C_voltage", ops=[("/", dec("500"))],
+	lower_bound=4.7, upper_bound=5.1, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_5DAQ_VOLTAGE:
 # Result is in volts.
-class power_5DAQ_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 4.7
-		self.upper_bound = 5.1
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("500")
-		return converted
+power_5DAQ_voltage = spec("power_5DAQ_voltage", ops=[("/", dec("500"))],
+	lower_bound=4.7, upper_bound=5.1, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_5DAQ_CURRENT:
 # Result is in mA.
-class power_5DAQ_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 30
-		self.upper_bound = 1500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("6")
-		return converted
+power_5DAQ_current = spec("power_5DAQ_current", ops=[("/", dec("6"))],
+	lower_bound=30, upper_bound=1500, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_VTOP_VOLTAGE:
 # Result is in volts.
-class power_VTOP_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 8
-		self.upper_bound = 15
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/1000)*dec("5.02")
-		return converted
+power_VTOP_voltage = spec("power_VTOP_voltage", ops=[("/", 1000), ("*", dec("5.02"))],
+	lower_bound=8, upper_bound=15, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_VTOP_CURRENT:
 # Result is in mA.
-class power_VTOP_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 400
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("6")
-		return converted
+power_VTOP_current = spec("power_VTOP_current", ops=[("/", dec("6"))],
+	lower_bound=0, upper_bound=400, dec_places_round=0)
 
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_VAUX_VOLTAGE:
 # Result is in volts.
-class power_VAUX_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 8
-		self.upper_bound = 15
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/1000)*dec("5.02")
-		return converted
+power_VAUX_voltage = spec("power_VAUX_voltage", ops=[("/", 1000), ("*", dec("5.02"))],
+	lower_bound=8, upper_bound=15, dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_VAUX_CURRENT:
 # Result is in volts.
-class power_VAUX_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 400
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("6")
-		return converted
+power_VAUX_current = spec("power_VAUX_current", ops=[("/", dec("6"))],
+	lower_bound=0, upper_bound=400, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_DAQ_INPUT_CURRENT:
 # Result is in mA.
-class power_DAQ_input_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 500
-		self.upper_bound = 1500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("2")
-		return converted
+power_DAQ_input_current = spec("power_DAQ_input_current", ops=[("/", dec("2"))],
+	lower_bound=500, upper_bound=1500, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_TEMPERATURE_B:
 # Result is in degrees Fahrenheit.
-class power_battery_temperature_B(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 50
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/1024)*5)-dec("2.7316"))*180)+32
-		return converted
+power_battery_temperature_B = spec("power_battery_temperature_B", ops=[("/", 1024), ("*", 5), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=50, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BOX_TEMPERATURE:
 # Result is in degrees Fahrenheit.
-class power_box_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/1024)*5)-dec("2.7316"))*180)+32
-		return converted
+power_box_temperature = spec("power_box_temperature", ops=[("/", 1024), ("*", 5), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=0, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_HEATER_CURRENT_B:
 # Result is in mA.
-class power_heater_current_B(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 700
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+power_heater_current_B = spec("power_heater_current_B", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound=0, upper_bound=700, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_FAN_CURRENT_B:
 # Result is in mA.
-class power_fan_current_B(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 50
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+power_fan_current_B = spec("power_fan_current_B", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound=0, upper_bound=50, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_STATUS
 # the first bit of the power_status byte. 1 => fan is on
-class power_status(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.dec_places_round = "N/A"
-		self.raw_label = "power_status"
-
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(2)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		converted = ""
-		if ((bit0) and (bit1)):
-			converted += "heater on and fan on"
-		if ((not bit0) and (bit1)):
-			converted += "heater on and fan off"
-		if ((bit0) and (not bit1)):
-			converted += "fan on and heater off"
-		if ((not bit0) and (not bit1)):
-			converted += "fan off and heater off"
-		return converted 
+POWER_STATUS = StatusDecoder(values={0: "fan off and heater off", 1: "fan on and heater off",
+	2: "heater on and fan off", 3: "heater on and fan on"}, mask=3)
+power_status = spec("power_status", decoder=POWER_STATUS, dec_places_round="N/A")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_ENCLOSURE_HUMIDITY
 # Result is percent humidity.
-class power_enclosure_humidity(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 15
-		self.upper_bound = 40
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+power_enclosure_humidity = spec("power_enclosure_humidity", lower_bound=15, upper_bound=40, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_FAULT_STATUS
 # fault.0=top fault, .1=daq box fault, .2=aux fault, .3=20WB in circuit
-class power_fault_status(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.dec_places_round = "N/A"
-
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(4)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		converted = ""
-		if bit0:
-			converted += "top fault, "
-		if bit1:
-			converted += "DAQ box fault, "
-		if bit2:
-			converted += "AUX fault, "
-		if bit3:
-			converted += "20WB in circuit"
-		converted = converted.rstrip(", ")
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("power_fault_status reported " + converted)
-			self.status_error = True
-		return converted
+POWER_FAULT_STATUS = StatusDecoder([(0, "top fault"), (1, "DAQ box fault"), (2, "AUX fault"), (3, "20WB in circuit")])
+power_fault_status = status("power_fault_status", POWER_FAULT_STATUS, "power_fault_status", dec_places_round="N/A")
 
 #===================================================================================================================
 #													SOIL SENSORS BLOCK
@@ -1496,11 +1016,7 @@ class soil_temp_1_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_2_BELOW
@@ -1513,11 +1029,7 @@ class soil_temp_2_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_3_BELOW
@@ -1530,11 +1042,7 @@ class soil_temp_3_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_4_BELOW
@@ -1547,11 +1055,7 @@ class soil_temp_4_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_5_BELOW
@@ -1564,11 +1068,7 @@ class soil_temp_5_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_6_BELOW
@@ -1581,11 +1081,7 @@ class soil_temp_6_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_7_BELOW
@@ -1598,11 +1094,7 @@ class soil_temp_7_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_8_BELOW
@@ -1615,11 +1107,7 @@ class soil_temp_8_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_10_BELOW
@@ -1632,11 +1120,7 @@ class soil_temp_10_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_12_BELOW
@@ -1649,11 +1133,7 @@ class soil_temp_12_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_20_BELOW
@@ -1666,11 +1146,7 @@ class soil_temp_20_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_30_BELOW
@@ -1683,11 +1159,7 @@ class soil_temp_30_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_40_BELOW
@@ -1700,11 +1172,7 @@ class soil_temp_40_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_TEMP_48_BELOW
@@ -1717,11 +1185,7 @@ class soil_temp_48_below(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = ((dec(rawdata)/524288)*dec("4.096"))/10
-		r = (20000*v)/(dec("4.096")-v)
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return SOIL_TEMP_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_MOIST_B2
@@ -1926,14 +1390,7 @@ class temp_1_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_2_ABOVE
@@ -1946,14 +1403,7 @@ class temp_2_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_3_ABOVE
@@ -1966,14 +1416,7 @@ class temp_3_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_4_ABOVE
@@ -1986,14 +1429,7 @@ class temp_4_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_5_ABOVE
@@ -2006,14 +1442,7 @@ class temp_5_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_7_ABOVE
@@ -2026,14 +1455,7 @@ class temp_7_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_9_ABOVE
@@ -2046,14 +1468,7 @@ class temp_9_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_11_ABOVE
@@ -2066,14 +1481,7 @@ class temp_11_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_13_ABOVE
@@ -2086,14 +1494,7 @@ class temp_13_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TEMP_15_ABOVE
@@ -2106,72 +1507,36 @@ class temp_15_above(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		v = (dec(rawdata)/131072)*dec("4.096")
-		r = (20000*v)/(dec("4.096")-v)
-		a = dec("0.001125308852122")
-		b = dec("0.000234711863267")
-		c = dec("0.000000085663516")
-		t = 1/(a + (b*(r.ln())) + (c*((r.ln())**3)))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+		return TEMP_HEAD_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_FLUX
 # Result is in watts per meter squared
-class soil_flux(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0.15
-		self.upper_bound = 0.85
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/262144)*dec("4.096"))-dec("0.5026")
-		return converted
+soil_flux = spec("soil_flux", ops=[("/", 262144), ("*", dec("4.096")), ("-", dec("0.5026"))],
+	lower_bound=0.15, upper_bound=0.85, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_ELECTRONICS_TEMP
 # Result is in degrees F
-class soil_electronics_temp(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 20
-		self.upper_bound = 100
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/1024)*5)-dec("2.7316"))*180)+32
-		return converted
+soil_electronics_temp = spec("soil_electronics_temp", ops=[("/", 1024), ("*", 5), ("-", dec("2.7316")), ("*", 180), ("+", 32)],
+	lower_bound=20, upper_bound=100, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_ELECTRONICS_VREF
 # Result is in volts (may have to add some correction for a more accurate value)
-class soil_electronics_Vref(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 4.08
-		self.upper_bound = 4.1
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/1024)*5
-		return converted
+soil_electronics_Vref = spec("soil_electronics_Vref", ops=[("/", 1024), ("*", 5)],
+	lower_bound=4.08, upper_bound=4.1, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOIL_SPARE
 # For future use
-class soil_spare(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+soil_spare = spec("soil_spare", dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													OLD_WIND_CHILL
 class old_wind_chill(DataConverter):
+	converted_inputs = ("vortex_avg_speed", "Temperature_Precon")
+
 	def __init__(self):
 		DataConverter.__init__(self)
 		self.dec_places_round = 2
@@ -2190,6 +1555,8 @@ class old_wind_chill(DataConverter):
 #-------------------------------------------------------------------------------------------------------------------
 #													NEW_WIND_CHILL
 class new_wind_chill(DataConverter):
+	converted_inputs = ("vortex_avg_speed", "Temperature_Precon")
+
 	def __init__(self):
 		DataConverter.__init__(self)
 		self.dec_places_round = 2
@@ -2220,188 +1587,66 @@ class new_wind_chill(DataConverter):
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													MUX_CURRENT
-class mux_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 12
-		self.upper_bound = 490
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+mux_current = spec("mux_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound=12, upper_bound=490, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													MUX_TEMPERATURE
-class mux_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 2350
-		self.upper_bound = 3175
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/1024)*5)-dec("2.73"))*180)+32
-		return converted
+mux_temperature = spec("mux_temperature", ops=[("/", 1024), ("*", 5), ("-", dec("2.73")), ("*", 180), ("+", 32)],
+	lower_bound=2350, upper_bound=3175, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WIND_RATE
 # Needs formula
-class Peet_wind_rate(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_wind_rate = spec("Peet_wind_rate", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WIND_MUTL
-class Peet_wind_multl(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_wind_multl = spec("Peet_wind_multl", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WINDLO
-class Peet_windlo(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_windlo = spec("Peet_windlo", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WIND_MULTH
-class Peet_wind_multh(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_wind_multh = spec("Peet_wind_multh", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WINDHI
-class Peet_windhi(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_windhi = spec("Peet_windhi", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_VDUCE
-class Peet_vduce(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_vduce = spec("Peet_vduce", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WIND_SPEED
-class Peet_wind_speed(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_wind_speed = spec("Peet_wind_speed", raw_label="N/A", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WINDDIR
-class Peet_winddir(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_winddir = spec("Peet_winddir", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													PEET_WIND_DIRECTION
-class Peet_wind_direction(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+Peet_wind_direction = spec("Peet_wind_direction", raw_label="N/A",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													INSPEED_WIND_DIRECTION
-class Inspeed_wind_direction(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)-3277)/58982)*360
-		return converted
+Inspeed_wind_direction = spec("Inspeed_wind_direction", ops=[("-", 3277), ("/", 58982), ("*", 360)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_CURRENT
-class Hydreon_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/30)*1000
-		return converted
+Hydreon_current = spec("Hydreon_current", ops=[("/", 1024), ("*", 5), ("/", 30), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_TEMPERATURE
-class Hydreon_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 2350
-		self.upper_bound = 3175
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/1024)*5)-dec("2.73"))*180)+32
-		return converted
+Hydreon_temperature = spec("Hydreon_temperature", ops=[("/", 1024), ("*", 5), ("-", dec("2.73")), ("*", 180), ("+", 32)],
+	lower_bound=2350, upper_bound=3175, dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_RANGE_SETTING
@@ -2425,46 +1670,24 @@ class Hydreon_range_setting(DataConverter):
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_LOW_SENSE
-class Hydreon_low_sense(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.01")
-		return converted
+Hydreon_low_sense = spec("Hydreon_low_sense", ops=[("*", dec("0.01"))],
+	lower_bound=0, upper_bound="FIX", dec_places_round="FIX")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_MEDIUM_SENSE
-class Hydreon_medium_sense(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+Hydreon_medium_sense = spec("Hydreon_medium_sense", ops=[("*", dec("0.001"))],
+	lower_bound=0, upper_bound="FIX", dec_places_round="FIX")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_HIGH_SENSE
-class Hydreon_high_sense(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.0001")
-		return converted
+Hydreon_high_sense = spec("Hydreon_high_sense", ops=[("*", dec("0.0001"))],
+	lower_bound=0, upper_bound="FIX", dec_places_round="FIX")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													HYDREON_RAIN_AMOUNT
 class Hydreon_rain_amount(DataConverter):
+	raw_inputs = ("Hydreon_range_setting", "Hydreon_low_sense", "Hydreon_medium_sense", "Hydreon_high_sense")
+
 	def __init__(self):
 		DataConverter.__init__(self)
 		self.raw_label = "N/A"
@@ -2473,244 +1696,98 @@ class Hydreon_rain_amount(DataConverter):
 		self.dec_places_round = "FIX"
 
 	def process(self, rawdata):
-		rangesetting = DataConverter.reader.get("Hydreon_range_setting")
+		rangesetting = DataConverter.reader.get_value("Hydreon_range_setting")
 		if (rangesetting == 0):
-			converted = DataConverter.reader.get("Hydreon_low_sense")
+			converted = DataConverter.reader.get_value("Hydreon_low_sense")
 		if (rangesetting == 1):
-			converted = DataConverter.reader.get("Hydreon_medium_sense")
+			converted = DataConverter.reader.get_value("Hydreon_medium_sense")
 		if (rangesetting == 4):
-			converted = DataConverter.reader.get("Hydreon_high_sense")
+			converted = DataConverter.reader.get_value("Hydreon_high_sense")
 		else:
-			converted = converted = DataConverter.reader.get("Hydreon_low_sense")
+			converted = converted = DataConverter.reader.get_value("Hydreon_low_sense")
 		return converted
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_SENSOR_CURRENT
-class sky_sensor_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+sky_sensor_current = spec("sky_sensor_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_SWIPER_CW_CURRENT
-class sky_swiper_CW_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+sky_swiper_CW_current = spec("sky_swiper_CW_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_SWIPER_CCW_CURRENT
-class sky_swiper_CCW_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+sky_swiper_CCW_current = spec("sky_swiper_CCW_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_DARK_READING
-class sky_dark_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/65536)*5)*1000)/dec("3.399")
-		return converted
+sky_dark_reading = spec("sky_dark_reading", ops=[("/", 65536), ("*", 5), ("*", 1000), ("/", dec("3.399"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_BRIGHT_READING
-class sky_bright_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/65536)*5)/dec("0.003399")
-		return converted
+sky_bright_reading = spec("sky_bright_reading", ops=[("/", 65536), ("*", 5), ("/", dec("0.003399"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_IR_TEMPERATURE
-class sky_IR_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/50)-dec("2.7315"))*180)+32
-		return converted
+sky_IR_temperature = spec("sky_IR_temperature", ops=[("/", 50), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_SENSOR_STATUS
-class sky_sensor_status(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
-
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(8)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit7 = int(binary[binarylength-8])
-		converted = ""
-		if (not bit0):
-			converted += "home loop not overrun, "
-		if bit0:
-			converted += "error for >520 pulses, "
-		if bit1:
-			converted += "motor is running, "
-		if bit7:
-			converted += "swipe stop bit is set, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Sky sensor status reported " + converted)
-			self.status_error = True
-		return converted
+SKY_SENSOR_STATUS = StatusDecoder([(0, "error for >520 pulses"), (1, "motor is running"), (7, "swipe stop bit is set")],
+	clear_messages=[(0, "home loop not overrun")])
+sky_sensor_status = status("sky_sensor_status", SKY_SENSOR_STATUS, "Sky sensor status",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SKY_HALL_SENSOR
-class sky_Hall_sensor(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/1024)*5
-		return converted
+sky_Hall_sensor = spec("sky_Hall_sensor", ops=[("/", 1024), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X40_READING
-class sway_X40_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+sway_X40_reading = spec("sway_X40_reading", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X1_READING
-class sway_X1_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+sway_X1_reading = spec("sway_X1_reading", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y1_READING
-class sway_Y1_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+sway_Y1_reading = spec("sway_Y1_reading", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y40_READING
-class sway_Y40_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+sway_Y40_reading = spec("sway_Y40_reading", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_SENSOR_TEMPERATURE
-class sway_sensor_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)*dec("0.001"))-dec("2.7315"))*180)+32
-		return converted
+sway_sensor_temperature = spec("sway_sensor_temperature", ops=[("*", dec("0.001")), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_SENSOR_VSS
-class sway_sensor_Vss(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*2
-		return converted
+sway_sensor_Vss = spec("sway_sensor_Vss", ops=[("*", dec("0.001")), ("*", 2)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY-Z_OFFSET
-class sway_Z_offset(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+sway_Z_offset = spec("sway_Z_offset", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Z50_READING
-class sway_Z50_reading(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+sway_Z50_reading = spec("sway_Z50_reading", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #===================================================================================================================
 #													LIGHTNING
@@ -2718,42 +1795,17 @@ class sway_Z50_reading(DataConverter):
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_CURRENT
-class lightning_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+lightning_current = spec("lightning_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_UV_COUNT
-class lightning_UV_count(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+lightning_UV_count = spec("lightning_UV_count", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_HIGH_VOLTAGE
-class lightning_high_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*5)*214
-		return converted
+lightning_high_voltage = spec("lightning_high_voltage", ops=[("/", 1024), ("*", 5), ("*", 214)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_3001_LUX
@@ -2774,16 +1826,8 @@ class lightning_3001_lux(DataConverter):
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_SKYSCAN_CURRENT
-class lightning_Skyscan_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/30)*1000
-		return converted
+lightning_Skyscan_current = spec("lightning_Skyscan_current", ops=[("/", 1024), ("*", 5), ("/", 30), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_SKYSCAN_LEDS
@@ -2823,16 +1867,8 @@ class lightning_Skyscan_LEDs(DataConverter):
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_SKYSCAN_FLASH_TIME
-class lightning_Skyscan_flash_time(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+lightning_Skyscan_flash_time = spec("lightning_Skyscan_flash_time",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_SKYSCAN_ALARMS
@@ -2878,81 +1914,33 @@ class lightning_Skyscan_alarms(DataConverter):
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT101_BASELINE
-class lightning_OPT101_baseline(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+lightning_OPT101_baseline = spec("lightning_OPT101_baseline", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT101_NORTH
-class lightning_OPT101_north(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+lightning_OPT101_north = spec("lightning_OPT101_north", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT101_SOUTH
-class lightning_OPT101_south(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+lightning_OPT101_south = spec("lightning_OPT101_south", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT101_EAST
-class lightning_OPT101_east(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+lightning_OPT101_east = spec("lightning_OPT101_east", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT101_WEST
-class lightning_OPT101_west(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+lightning_OPT101_west = spec("lightning_OPT101_west", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT101_ZENITH
-class lightning_OPT101_zenith(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+lightning_OPT101_zenith = spec("lightning_OPT101_zenith", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #===================================================================================================================
 #													PIC CLUSTER
@@ -2960,16 +1948,8 @@ class lightning_OPT101_zenith(DataConverter):
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_THUNDER
-class lightning_thunder(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/1024
-		return converted
+lightning_thunder = spec("lightning_thunder", ops=[("/", 1024)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_FLAG
@@ -3000,29 +1980,13 @@ class lightning_flag(DataConverter):
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_UVA_UVB
-class lightning_UVA_UVB(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-1)*dec("8.2")
-		return converted
+lightning_UVA_UVB = spec("lightning_UVA_UVB", ops=[("*", dec("0.001")), ("-", 1), ("*", dec("8.2"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													LIGHTNING_OPT_TEMPERATURE
-class lightning_OPT_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)*dec("0.001"))-dec("2.7315"))*180)+32
-		return converted
+lightning_OPT_temperature = spec("lightning_OPT_temperature", ops=[("*", dec("0.001")), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #===================================================================================================================
 #													SOLAR DAQ
@@ -3030,122 +1994,46 @@ class lightning_OPT_temperature(DataConverter):
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_BOX_TEMPERATURE
-class solar_box_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/65536)*10)-dec("2.7315"))*180)+32
-		return converted
+solar_box_temperature = spec("solar_box_temperature", ops=[("/", 65536), ("*", 10), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_PYRAN_COMBINED:
-class solar_pyran_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = 0
-		self.upper_bound = 1200
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		upper = DataConverter.reader.get("solar_pyran_upper_byte")
-		middle = DataConverter.reader.get("solar_pyran_middle_byte")
-		lower = DataConverter.reader.get("solar_pyran_lower_byte")
-		combined = int(upper + middle + lower, base = 16)
-		converted = (((dec(combined)/16777216)*5)*5)*1000
-		return converted
+solar_pyran_combined = spec("solar_pyran_combined", ops=[("/", 16777216), ("*", 5), ("*", 5), ("*", 1000)],
+	combiner=ByteCombiner(["solar_pyran_upper_byte", "solar_pyran_middle_byte", "solar_pyran_lower_byte"], base=16),
+	lower_bound=0, upper_bound=1200, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_PAR_COMBINED:
-class solar_par_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = 0
-		self.upper_bound = 2100
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		upper = DataConverter.reader.get("solar_par_upper_byte")
-		middle = DataConverter.reader.get("solar_par_middle_byte")
-		lower = DataConverter.reader.get("solar_par_lower_byte")
-		combined = int(upper + middle + lower, base = 16)
-		converted = (((dec(combined)/16777216)*5)*5)*1000
-		return converted
+solar_par_combined = spec("solar_par_combined", ops=[("/", 16777216), ("*", 5), ("*", 5), ("*", 1000)],
+	combiner=ByteCombiner(["solar_par_upper_byte", "solar_par_middle_byte", "solar_par_lower_byte"], base=16),
+	lower_bound=0, upper_bound=2100, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_UV_COMBINED:
-class solar_UV_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = 0
-		self.upper_bound = 175
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		upper = DataConverter.reader.get("solar_UV_upper_byte")
-		middle = DataConverter.reader.get("solar_UV_middle_byte")
-		lower = DataConverter.reader.get("solar_UV_lower_byte")
-		combined = int(upper + middle + lower, base = 16)
-		converted = (((dec(combined)/16777216)*5)*dec("1.65"))*1000
-		return converted
+solar_UV_combined = spec("solar_UV_combined", ops=[("/", 16777216), ("*", 5), ("*", dec("1.65")), ("*", 1000)],
+	combiner=ByteCombiner(["solar_UV_upper_byte", "solar_UV_middle_byte", "solar_UV_lower_byte"], base=16),
+	lower_bound=0, upper_bound=175, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_GOLD_GRID_EAST
-class solar_gold_grid_east(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/65536)*5
-		return converted
+solar_gold_grid_east = spec("solar_gold_grid_east", ops=[("/", 65536), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_GOLD_GRID_WEST
-class solar_gold_grid_west(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/65536)*5
-		return converted
+solar_gold_grid_west = spec("solar_gold_grid_west", ops=[("/", 65536), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_DECAGON_HORIZONTAL
-class solar_Decagon_horizontal(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/65536)*5
-		return converted
+solar_Decagon_horizontal = spec("solar_Decagon_horizontal", ops=[("/", 65536), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_DECAGON_TILTED
-class solar_Decagon_tilted(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/65536)*5
-		return converted
+solar_Decagon_tilted = spec("solar_Decagon_tilted", ops=[("/", 65536), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_FROST
@@ -3157,12 +2045,7 @@ class solar_frost(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		r = 24900*((5/((dec(rawdata)/65536)*5))-1)
-		a = dec("1.1292418")*dec(pow(10,-3))
-		b = dec("2.341077")*dec(pow(10,-4))
-		c = dec("8.775468")*dec(pow(10,-8))
-		converted = (1/(a+(b*(r.ln())) + (c*((r.ln())**3))))
-		return converted
+		return SOLAR_THERMISTOR_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_BUD
@@ -3174,71 +2057,28 @@ class solar_bud(DataConverter):
 		self.dec_places_round = 3
 
 	def process(self, rawdata):
-		r = 24900*((5/((dec(rawdata)/65536)*5))-1)
-		a = dec("1.1292418")*dec(pow(10,-3))
-		b = dec("2.341077")*dec(pow(10,-4))
-		c = dec("8.775468")*dec(pow(10,-8))
-		converted = (1/(a+(b*(r.ln())) + (c*((r.ln())**3))))
-		return converted
+		return SOLAR_THERMISTOR_TABLE.convert(rawdata)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_GLOBE_COMBINED:
-class solar_globe_combined(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.raw_label = "N/A"
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		upper = DataConverter.reader.get("solar_globe_upper_byte")
-		middle = DataConverter.reader.get("solar_globe_middle_byte")
-		lower = DataConverter.reader.get("solar_globe_lower_byte")
-		combined = int(upper + middle + lower, base = 16)
-		r = (((dec(combined)/8388608)*dec("2.5"))/dec("0.0005"))/10
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*(dec(9/5))) - dec("459.67")
-		return converted
+solar_globe_combined = spec("solar_globe_combined", decoder=RTD_1K_TABLE.convert,
+	combiner=ByteCombiner(["solar_globe_upper_byte", "solar_globe_middle_byte", "solar_globe_lower_byte"], base=16),
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_CURRENT
-class solar_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/65536)*5)/30)*1000
-		return converted
+solar_current = spec("solar_current", ops=[("/", 65536), ("*", 5), ("/", 30), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_VOLTAGE
-class solar_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/65536)*5)*10
-		return converted
+solar_voltage = spec("solar_voltage", ops=[("/", 65536), ("*", 5), ("*", 10)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=4)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													SOLAR_IR_GROUND_TEMPERATURE
-class solar_IR_ground_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/50)-dec("2.7315"))*180)+32
-		return converted
+solar_IR_ground_temperature = spec("solar_IR_ground_temperature", ops=[("/", 50), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 
 #===================================================================================================================
 #													MET ONE ANEMOMETER
@@ -3246,42 +2086,17 @@ class solar_IR_ground_temperature(DataConverter):
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													METONE_LED_CURRENT
-class MetOne_LED_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 450
-		self.upper_bound = 700
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/600)*1000
-		return converted
+MetOne_LED_current = spec("MetOne_LED_current", ops=[("/", 1024), ("*", 5), ("/", 600), ("*", 1000)],
+	lower_bound=450, upper_bound=700, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													METONE_PULSEWIDTH
-class MetOne_pulsewidth(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+MetOne_pulsewidth = spec("MetOne_pulsewidth", lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													METONE_TICKS_COUNT
-class MetOne_ticks_count(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 1000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.059307"))+dec("0.5982")
-		return converted
+MetOne_ticks_count = spec("MetOne_ticks_count", ops=[("*", dec("0.059307")), ("+", dec("0.5982"))],
+	lower_bound=0, upper_bound=1000, dec_places_round=3)
 		
 #===================================================================================================================
 #													POWER DISTR. AND FUSING
@@ -3289,705 +2104,221 @@ class MetOne_ticks_count(DataConverter):
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_ARBCAM_CURRENT
-class fuses_Arbcam_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+fuses_Arbcam_current = spec("fuses_Arbcam_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_ARBCAM_VOLTAGE
-class fuses_Arbcam_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*5)*4
-		return converted
+fuses_Arbcam_voltage = spec("fuses_Arbcam_voltage", ops=[("/", 1024), ("*", 5), ("*", 4)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_5.6_VOLTAGE
-class fuses_5V6_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*5)*2
-		return converted
+fuses_5V6_voltage = spec("fuses_5V6_voltage", ops=[("/", 1024), ("*", 5), ("*", 2)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_MUX_CURRENT
-class fuses_mux_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+fuses_mux_current = spec("fuses_mux_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_LIGHTNING_CURRENT
-class fuses_lightning_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+fuses_lightning_current = spec("fuses_lightning_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_SOLAR_DAQ_CURRENT
-class fuses_solar_DAQ_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+fuses_solar_DAQ_current = spec("fuses_solar_DAQ_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_FLUXGATE_CURRENT
-class fuses_fluxgate_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+fuses_fluxgate_current = spec("fuses_fluxgate_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_TRIAXIAL_CURRENT
-class fuses_triaxial_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/60)*1000
-		return converted
+fuses_triaxial_current = spec("fuses_triaxial_current", ops=[("/", 1024), ("*", 5), ("/", 60), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_FUTURE_CURRENT
-class fuses_future_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+fuses_future_current = spec("fuses_future_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_FLAG
-class fuses_flag(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+FUSES_OVERLOAD = StatusDecoder([(0, "mux ovld"), (1, "lightning ovld"), (2, "solar ovld"), (3, "spare olvd"),
+	(4, "flux olvd"), (5, "triax olvd"), (6, "Arbcam overload")])
+fuses_flag = status("fuses_flag", FUSES_OVERLOAD, "Fuses flag",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(7)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		bit4 = int(binary[binarylength-5])
-		bit5 = int(binary[binarylength-6])
-		bit6 = int(binary[binarylength-7])
-		converted = ""
-		if bit0:
-			converted += "mux ovld, "
-		if bit1: 
-			converted += "lightning ovld, "
-		if bit2:
-			converted += "solar ovld, "
-		if bit3:
-			converted += "spare olvd, "
-		if bit4:
-			converted += "flux olvd, "
-		if bit5:
-			converted += "triax olvd, "
-		if bit6:
-			converted += "Arbcam overload, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Fuses flag reported " + converted)
-			self.status_error = True
-		return converted
-		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_WARN
-class fuses_warn(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+FUSES_WARN = StatusDecoder([(0, "mux warning"), (1, "lightning warning"), (2, "solar warning"), (3, "spare warning"),
+	(4, "flux warning"), (5, "triax warning"), (6, "Arbcam current high warning")])
+fuses_warn = status("fuses_warn", FUSES_WARN, "Fuses warn",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(7)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		bit4 = int(binary[binarylength-5])
-		bit5 = int(binary[binarylength-6])
-		bit6 = int(binary[binarylength-7])
-		converted = ""
-		if bit0:
-			converted += "mux warning, "
-		if bit1: 
-			converted += "lightning warning, "
-		if bit2:
-			converted += "solar warning, "
-		if bit3:
-			converted += "spare warning, "
-		if bit4:
-			converted += "flux warning, "
-		if bit5:
-			converted += "triax warning, "
-		if bit6:
-			converted += "Arbcam current high warning, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Fuses warn reported " + converted)
-			self.status_error = True
-		return converted
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_GO_UP
-class fuses_go_up(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+FUSES_GO_UP = StatusDecoder([(0, "mux rising"), (1, "lightning rising"), (2, "solar rising"), (3, "spare rising"),
+	(4, "flux rising"), (5, "triax rising"), (6, "Arbcam current above limit and rising")])
+fuses_go_up = status("fuses_go_up", FUSES_GO_UP, "Fuses go up",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(7)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		bit4 = int(binary[binarylength-5])
-		bit5 = int(binary[binarylength-6])
-		bit6 = int(binary[binarylength-7])
-		converted = ""
-		if bit0:
-			converted += "mux rising, "
-		if bit1: 
-			converted += "lightning rising, "
-		if bit2:
-			converted += "solar rising, "
-		if bit3:
-			converted += "spare rising, "
-		if bit4:
-			converted += "flux rising, "
-		if bit5:
-			converted += "triax rising, "
-		if bit6:
-			converted += "Arbcam current above limit and rising, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Fuses go up reported " + converted)
-			self.status_error = True
-		return converted
-		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_MONITOR
-class fuses_monitor(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+fuses_monitor = status("fuses_monitor", FUSES_OVERLOAD, "Fuses monitor",					#the same bits as fuses_flag
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(7)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		bit4 = int(binary[binarylength-5])
-		bit5 = int(binary[binarylength-6])
-		bit6 = int(binary[binarylength-7])
-		converted = ""
-		if bit0:
-			converted += "mux ovld, "
-		if bit1: 
-			converted += "lightning ovld, "
-		if bit2:
-			converted += "solar ovld, "
-		if bit3:
-			converted += "spare olvd, "
-		if bit4:
-			converted += "flux olvd, "
-		if bit5:
-			converted += "triax olvd, "
-		if bit6:
-			converted += "Arbcam overload, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Fuses monitor reported " + converted)
-			self.status_error = True
-		return converted
-		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_ARBCAM_MODE
-class fuses_Arbcam_mode(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+FUSES_ARBCAM_MODE = StatusDecoder([(0, "camera on with no heater"), (1, "camera on with heater")])
+fuses_Arbcam_mode = status("fuses_Arbcam_mode", FUSES_ARBCAM_MODE, "Fuses arbcam mode",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(2)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		converted = ""
-		if bit0:
-			converted += "camera on with no heater, "
-		if bit1: 
-			converted += "camera on with heater, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Fuses arbcam mode reported " + converted)
-			self.status_error = True
-		return converted
-		
 #-------------------------------------------------------------------------------------------------------------------
 #													FUSES_FAULT_STATUS
-class fuses_fault_status(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+FUSES_FAULT_STATUS = StatusDecoder([(0, "5.6 supply <5.4"), (1, "5.6 supply >5.8"), (2, "Arbcam undervoltage"),
+	(3, "Arbcam overvoltage")])
+fuses_fault_status = status("fuses_fault_status", FUSES_FAULT_STATUS, "Fuses fault status",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
-	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(4)
-		binarylength = len(binary)
-		bit0 = int(binary[binarylength-1])
-		bit1 = int(binary[binarylength-2])
-		bit2 = int(binary[binarylength-3])
-		bit3 = int(binary[binarylength-4])
-		converted = ""
-		if bit0:
-			converted += "5.6 supply <5.4, "
-		if bit1: 
-			converted += "5.6 supply >5.8, "
-		if bit2:
-			converted += "Arbcam undervoltage, "
-		if bit3:
-			converted += "Arbcam overvoltage, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Fuses fault status reported " + converted)
-			self.status_error = True
-		return converted
-		
 #===================================================================================================================
 #													POWER MONITORING
 #===================================================================================================================
 #
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_SOLAR_PANEL_CURRENT
-class power_solar_panel_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/1024)*5)/6)*1000
-		return converted
+power_solar_panel_current = spec("power_solar_panel_current", ops=[("/", 1024), ("*", 5), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_SOLAR_PANEL_VOLTAGE
-class power_solar_panel_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*10
-		return converted
+power_solar_panel_voltage = spec("power_solar_panel_voltage", ops=[("*", dec("0.001")), ("*", 10)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_CURRENT
-class pm_battery_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))/6)*1000
-		return converted
+pm_battery_current = spec("pm_battery_current", ops=[("*", dec("0.001")), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_VOLTAGE
-class pm_battery_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*10
-		return converted
+pm_battery_voltage = spec("pm_battery_voltage", ops=[("*", dec("0.001")), ("*", 10)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_CURRENT_INTO_5V6
-class power_current_into_5V6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))/6)*1000
-		return converted
+power_current_into_5V6 = spec("power_current_into_5V6", ops=[("*", dec("0.001")), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_VOLTAGE_INTO_5V6
-class power_voltage_into_5V6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*10
-		return converted
+power_voltage_into_5V6 = spec("power_voltage_into_5V6", ops=[("*", dec("0.001")), ("*", 10)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_5V6_LOAD_CURRENT
-class power_5V6_load_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))/6)*1000
-		return converted
+power_5V6_load_current = spec("power_5V6_load_current", ops=[("*", dec("0.001")), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_5V6_LOAD_VOLTAGE
-class power_5V6_load_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*2
-		return converted
+power_5V6_load_voltage = spec("power_5V6_load_voltage", ops=[("*", dec("0.001")), ("*", 2)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BOX_TEMPERATURE
-class pm_box_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)*dec("0.001"))-dec("2.7315"))*180)+32
-		return converted
+pm_box_temperature = spec("pm_box_temperature", ops=[("*", dec("0.001")), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_ARBCAM_DCDC_INPUT_CURRENT
-class power_Arbcam_dcdc_input_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))/6)*1000
-		return converted
+power_Arbcam_dcdc_input_current = spec("power_Arbcam_dcdc_input_current", ops=[("*", dec("0.001")), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_ARBCAM_DCDC_INPUT_VOLTAGE
-class power_Arbcam_dcdc_input_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*10
-		return converted
+power_Arbcam_dcdc_input_voltage = spec("power_Arbcam_dcdc_input_voltage", ops=[("*", dec("0.001")), ("*", 10)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_ARBCAM_CURRENT
-class power_Arbcam_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))/6)*1000
-		return converted
+power_Arbcam_current = spec("power_Arbcam_current", ops=[("*", dec("0.001")), ("/", 6), ("*", 1000)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_ARBCAM_VOLTAGE
-class power_Arbcam_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)*dec("0.001"))*4
-		return converted
+power_Arbcam_voltage = spec("power_Arbcam_voltage", ops=[("*", dec("0.001")), ("*", 4)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BATTERY_TEMPERATURE
-class power_battery_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)*dec("0.001"))-dec("2.7315"))*180)+32
-		return converted
+power_battery_temperature = spec("power_battery_temperature", ops=[("*", dec("0.001")), ("-", dec("2.7315")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_128K_BATTERY_VOLTAGE
-class power_128K_battery_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+power_128K_battery_voltage = spec("power_128K_battery_voltage", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
-#													POWER_RTC_BATTERY_VOLTAGE
-class power_RTC_battery_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
-				
-#-------------------------------------------------------------------------------------------------------------------
-#													POWER_RTD_30FT_TEMPERATURE
-class power_RTD_30ft_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		r = ((dec(rawdata)/65536)*dec("4.096"))*1000
-		t = dec("-247.29") + (dec("2.3992")*r) + (dec("0.00063962")*(r**2)) + ((dec("1.0241")*dec(pow(10,-6)))*(r**3))
-		converted = (t*dec(9/5))-dec("459.67") 
-		return converted
-				
-#-------------------------------------------------------------------------------------------------------------------
-#													POWER_HAIL_PEAK
-class power_hail_peak(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/1024)*5
-		return converted
-				
-#-------------------------------------------------------------------------------------------------------------------
-#													POWER_HAIL_AVERAGE
-class power_hail_average(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = (dec(rawdata)/1024)*5
-		return converted
+#													POWER_RTC_BATTERY_VOLTAGE
+power_RTC_battery_voltage = spec("power_RTC_battery_voltage", ops=[("*", dec("0.001"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 				
 #-------------------------------------------------------------------------------------------------------------------
-#													POWER_STATUS
-class pm_status(DataConverter):
+#													POWER_RTD_30FT_TEMPERATURE
+class power_RTD_30ft_temperature(DataConverter):
 	def __init__(self):
 		DataConverter.__init__(self)
 		self.lower_bound = "FIX"
 		self.upper_bound = "FIX"
-		self.dec_places_round = "FIX"
+		self.dec_places_round = 2
 
 	def process(self, rawdata):
-		binary = bin(int(rawdata))[2:].zfill(8)
-		binarylength = len(binary)
-		bit4 = int(binary[binarylength-5])
-		bit5 = int(binary[binarylength-6])
-		bit6 = int(binary[binarylength-7])
-		bit7 = int(binary[binarylength-8])
-		converted = ""
-		if bit4:
-			converted += "latched off mode, "
-		if bit5: 
-			converted += "V>5.9v, "
-		if bit6:
-			converted += "5.68<V<5.9v, "
-		if bit7:
-			converted += "voltage within limits, "
-		converted = converted.rstrip(', ')
-		if converted == "":
-			converted = "OK"
-			self.status_error = False
-		elif not self.status_error:
-			errors.error("Power status reported " + converted)
-			self.status_error = True
-		return converted
+		return POWER_RTD_TABLE.convert(rawdata)
+				
+#-------------------------------------------------------------------------------------------------------------------
+#													POWER_HAIL_PEAK
+power_hail_peak = spec("power_hail_peak", ops=[("/", 1024), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
+				
+#-------------------------------------------------------------------------------------------------------------------
+#													POWER_HAIL_AVERAGE
+power_hail_average = spec("power_hail_average", ops=[("/", 1024), ("*", 5)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=3)
+				
+#-------------------------------------------------------------------------------------------------------------------
+#													POWER_STATUS
+PM_STATUS = StatusDecoder([(4, "latched off mode"), (5, "V>5.9v"), (6, "5.68<V<5.9v"), (7, "voltage within limits")])
+pm_status = status("pm_status", PM_STATUS, "Power status",
+	lower_bound="FIX", upper_bound="FIX", dec_places_round="FIX")
 
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_OVP_CYCLES
-class power_OVP_cycles(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+power_OVP_cycles = spec("power_OVP_cycles", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													POVER_OVP_VOLTAGE
-class power_OVP_voltage(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/1024)*5)*2
-		return converted
+power_OVP_voltage = spec("power_OVP_voltage", ops=[("/", 1024), ("*", 5), ("*", 2)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_HAIL_SENSOR_TEMPERATURE
-class power_hail_sensor_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 1
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/1024)*5)-dec("2.73"))*180)+32
-		return converted
+power_hail_sensor_temperature = spec("power_hail_sensor_temperature", ops=[("/", 1024), ("*", 5), ("-", dec("2.73")), ("*", 180), ("+", 32)],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=1)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_HAIL_SENSOR_HITS
-class power_hail_sensor_hits(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 0
-		
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+power_hail_sensor_hits = spec("power_hail_sensor_hits", lower_bound="FIX", upper_bound="FIX", dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													POWER_BOX_HUMIDITY
-class power_box_humidity(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 15
-		self.upper_bound = 40
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+power_box_humidity = spec("power_box_humidity", lower_bound=15, upper_bound=40, dec_places_round=0)
 
 #===================================================================================================================
 #...................................................................................................................
@@ -4003,1043 +2334,403 @@ class power_box_humidity(DataConverter):
 #				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X1
-class sway_X1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X1 = spec("sway_X1", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X2
-class sway_X2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X2 = spec("sway_X2", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X3
-class sway_X3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X3 = spec("sway_X3", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X4
-class sway_X4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X4 = spec("sway_X4", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X5
-class sway_X5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X5 = spec("sway_X5", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X6
-class sway_X6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X6 = spec("sway_X6", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X7
-class sway_X7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X7 = spec("sway_X7", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X8
-class sway_X8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X8 = spec("sway_X8", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X9
-class sway_X9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X9 = spec("sway_X9", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X10
-class sway_X10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X10 = spec("sway_X10", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X11
-class sway_X11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X11 = spec("sway_X11", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X12
-class sway_X12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X12 = spec("sway_X12", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X13
-class sway_X13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X13 = spec("sway_X13", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X14
-class sway_X14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X14 = spec("sway_X14", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X15
-class sway_X15(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X15 = spec("sway_X15", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X16
-class sway_X16(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X16 = spec("sway_X16", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X17
-class sway_X17(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X17 = spec("sway_X17", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X18
-class sway_X18(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X18 = spec("sway_X18", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X19
-class sway_X19(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X19 = spec("sway_X19", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X20
-class sway_X20(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X20 = spec("sway_X20", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X21
-class sway_X21(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X21 = spec("sway_X21", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X22
-class sway_X22(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X22 = spec("sway_X22", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X23
-class sway_X23(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X23 = spec("sway_X23", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X24
-class sway_X24(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X24 = spec("sway_X24", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X25
-class sway_X25(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X25 = spec("sway_X25", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X26
-class sway_X26(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X26 = spec("sway_X26", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X27
-class sway_X27(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X27 = spec("sway_X27", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X28
-class sway_X28(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X28 = spec("sway_X28", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X29
-class sway_X29(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X29 = spec("sway_X29", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X30
-class sway_X30(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X30 = spec("sway_X30", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X31
-class sway_X31(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X31 = spec("sway_X31", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X32
-class sway_X32(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X32 = spec("sway_X32", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X33
-class sway_X33(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X33 = spec("sway_X33", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X34
-class sway_X34(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-		
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X34 = spec("sway_X34", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X35
-class sway_X35(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X35 = spec("sway_X35", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X36
-class sway_X36(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X36 = spec("sway_X36", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X37
-class sway_X37(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X37 = spec("sway_X37", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X38
-class sway_X38(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X38 = spec("sway_X38", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X39
-class sway_X39(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X39 = spec("sway_X39", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_X40
-class sway_X40(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_X40 = spec("sway_X40", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y1
-class sway_Y1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y1 = spec("sway_Y1", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y2
-class sway_Y2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y2 = spec("sway_Y2", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y3
-class sway_Y3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y3 = spec("sway_Y3", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y4
-class sway_Y4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y4 = spec("sway_Y4", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y5
-class sway_Y5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y5 = spec("sway_Y5", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y6
-class sway_Y6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y6 = spec("sway_Y6", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y7
-class sway_Y7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y7 = spec("sway_Y7", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y8
-class sway_Y8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y8 = spec("sway_Y8", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y9
-class sway_Y9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y9 = spec("sway_Y9", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y10
-class sway_Y10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y10 = spec("sway_Y10", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y11
-class sway_Y11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y11 = spec("sway_Y11", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y12
-class sway_Y12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y12 = spec("sway_Y12", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y13
-class sway_Y13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y13 = spec("sway_Y13", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y14
-class sway_Y14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-		
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y14 = spec("sway_Y14", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y15
-class sway_Y15(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y15 = spec("sway_Y15", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y16
-class sway_Y16(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y16 = spec("sway_Y16", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y17
-class sway_Y17(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y17 = spec("sway_Y17", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y18
-class sway_Y18(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y18 = spec("sway_Y18", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y19
-class sway_Y19(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y19 = spec("sway_Y19", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y20
-class sway_Y20(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y20 = spec("sway_Y20", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y21
-class sway_Y21(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y21 = spec("sway_Y21", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y22
-class sway_Y22(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y22 = spec("sway_Y22", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y23
-class sway_Y23(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y23 = spec("sway_Y23", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y24
-class sway_Y24(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y24 = spec("sway_Y24", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y25
-class sway_Y25(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y25 = spec("sway_Y25", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y26
-class sway_Y26(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y26 = spec("sway_Y26", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y27
-class sway_Y27(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y27 = spec("sway_Y27", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y28
-class sway_Y28(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y28 = spec("sway_Y28", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y29
-class sway_Y29(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y29 = spec("sway_Y29", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y30
-class sway_Y30(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y30 = spec("sway_Y30", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y31
-class sway_Y31(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y31 = spec("sway_Y31", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
-#													SWAY_Y32
-class sway_Y32(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
-				
-#-------------------------------------------------------------------------------------------------------------------
-#													SWAY_Y33
-class sway_Y33(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+#													SWAY_Y32
+sway_Y32 = spec("sway_Y32", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
+				
+#-------------------------------------------------------------------------------------------------------------------
+#													SWAY_Y33
+sway_Y33 = spec("sway_Y33", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y34
-class sway_Y34(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-		
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y34 = spec("sway_Y34", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y35
-class sway_Y35(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y35 = spec("sway_Y35", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y36
-class sway_Y36(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y36 = spec("sway_Y36", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y37
-class sway_Y37(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y37 = spec("sway_Y37", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y38
-class sway_Y38(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y38 = spec("sway_Y38", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y39
-class sway_Y39(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y39 = spec("sway_Y39", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													SWAY_Y40
-class sway_Y40(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 980
-		self.upper_bound = 2300
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)*dec("0.001"))-dec("1.65"))/dec("0.3")
-		return converted
+sway_Y40 = spec("sway_Y40", ops=[("*", dec("0.001")), ("-", dec("1.65")), ("/", dec("0.3"))],
+	lower_bound=980, upper_bound=2300, dec_places_round=3)
 		
 #===================================================================================================================
 #...................................................................................................................
@@ -5055,796 +2746,249 @@ class sway_Y40(DataConverter):
 #				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T1
-class fluxgate_T1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T1 = spec("fluxgate_T1", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X1
-class fluxgate_X1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X1 = spec("fluxgate_X1", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y1
-class fluxgate_Y1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y1 = spec("fluxgate_Y1", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z1
-class fluxgate_Z1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z1 = spec("fluxgate_Z1", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T2
-class fluxgate_T2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T2 = spec("fluxgate_T2", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X2
-class fluxgate_X2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X2 = spec("fluxgate_X2", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y2
-class fluxgate_Y2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y2 = spec("fluxgate_Y2", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z2
-class fluxgate_Z2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z2 = spec("fluxgate_Z2", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T3
-class fluxgate_T3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T3 = spec("fluxgate_T3", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X3
-class fluxgate_X3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X3 = spec("fluxgate_X3", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y3
-class fluxgate_Y3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y3 = spec("fluxgate_Y3", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z3
-class fluxgate_Z3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z3 = spec("fluxgate_Z3", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T4
-class fluxgate_T4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T4 = spec("fluxgate_T4", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X4
-class fluxgate_X4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X4 = spec("fluxgate_X4", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y4
-class fluxgate_Y4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y4 = spec("fluxgate_Y4", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z4
-class fluxgate_Z4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z4 = spec("fluxgate_Z4", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T5
-class fluxgate_T5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T5 = spec("fluxgate_T5", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X5
-class fluxgate_X5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X5 = spec("fluxgate_X5", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y5
-class fluxgate_Y5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y5 = spec("fluxgate_Y5", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z5
-class fluxgate_Z5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z5 = spec("fluxgate_Z5", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T6
-class fluxgate_T6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T6 = spec("fluxgate_T6", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X6
-class fluxgate_X6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X6 = spec("fluxgate_X6", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y6
-class fluxgate_Y6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y6 = spec("fluxgate_Y6", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z6
-class fluxgate_Z6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z6 = spec("fluxgate_Z6", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T7
-class fluxgate_T7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T7 = spec("fluxgate_T7", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X7
-class fluxgate_X7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X7 = spec("fluxgate_X7", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y7
-class fluxgate_Y7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y7 = spec("fluxgate_Y7", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z7
-class fluxgate_Z7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z7 = spec("fluxgate_Z7", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T8
-class fluxgate_T8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T8 = spec("fluxgate_T8", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X8
-class fluxgate_X8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X8 = spec("fluxgate_X8", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y8
-class fluxgate_Y8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y8 = spec("fluxgate_Y8", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z8
-class fluxgate_Z8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
-		
-#-------------------------------------------------------------------------------------------------------------------
-#													FLUXGATE_T9
-class fluxgate_T9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_Z8 = spec("fluxgate_Z8", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
+		
+#-------------------------------------------------------------------------------------------------------------------
+#													FLUXGATE_T9
+fluxgate_T9 = spec("fluxgate_T9", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X9
-class fluxgate_X9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X9 = spec("fluxgate_X9", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y9
-class fluxgate_Y9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y9 = spec("fluxgate_Y9", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z9
-class fluxgate_Z9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z9 = spec("fluxgate_Z9", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T10
-class fluxgate_T10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T10 = spec("fluxgate_T10", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X10
-class fluxgate_X10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X10 = spec("fluxgate_X10", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y10
-class fluxgate_Y10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y10 = spec("fluxgate_Y10", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z10
-class fluxgate_Z10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z10 = spec("fluxgate_Z10", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T11
-class fluxgate_T11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T11 = spec("fluxgate_T11", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X11
-class fluxgate_X11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X11 = spec("fluxgate_X11", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y11
-class fluxgate_Y11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y11 = spec("fluxgate_Y11", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z11
-class fluxgate_Z11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z11 = spec("fluxgate_Z11", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T12
-class fluxgate_T12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T12 = spec("fluxgate_T12", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X12
-class fluxgate_X12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X12 = spec("fluxgate_X12", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y12
-class fluxgate_Y12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y12 = spec("fluxgate_Y12", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z12
-class fluxgate_Z12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z12 = spec("fluxgate_Z12", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T13
-class fluxgate_T13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T13 = spec("fluxgate_T13", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X13
-class fluxgate_X13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X13 = spec("fluxgate_X13", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y13
-class fluxgate_Y13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y13 = spec("fluxgate_Y13", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z13
-class fluxgate_Z13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z13 = spec("fluxgate_Z13", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_T14
-class fluxgate_T14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 14
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+fluxgate_T14 = spec("fluxgate_T14", lower_bound=0, upper_bound=14, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_X14
-class fluxgate_X14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_X14 = spec("fluxgate_X14", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Y14
-class fluxgate_Y14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Y14 = spec("fluxgate_Y14", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_Z14
-class fluxgate_Z14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 1000
-		self.upper_bound = 12500
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*10
-		return converted
+fluxgate_Z14 = spec("fluxgate_Z14", ops=[("*", 10)], lower_bound=1000, upper_bound=12500, dec_places_round=0)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_CURRENT
-class fluxgate_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 125
-		self.upper_bound = 980
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/dec("1024"))*dec("5"))/dec("6"))*dec("1000")
-		return converted
+fluxgate_current = spec("fluxgate_current", ops=[("/", dec("1024")), ("*", dec("5")), ("/", dec("6")), ("*", dec("1000"))],
+	lower_bound=125, upper_bound=980, dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_TEMPERATURE
-class fluxgate_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 2350
-		self.upper_bound = 3175
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/dec("1024"))*dec("5"))-dec("2.73"))*dec("180"))+dec("32")
-		return converted
+fluxgate_temperature = spec("fluxgate_temperature", ops=[("/", dec("1024")), ("*", dec("5")), ("-", dec("2.73")), ("*", dec("180")), ("+", dec("32"))],
+	lower_bound=2350, upper_bound=3175, dec_places_round=2)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_XSET
-class fluxgate_xset(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 4000
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+fluxgate_xset = spec("fluxgate_xset", ops=[("*", dec("0.001"))], lower_bound=0, upper_bound=4000, dec_places_round=4)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_YSET
-class fluxgate_yset(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 4000
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+fluxgate_yset = spec("fluxgate_yset", ops=[("*", dec("0.001"))], lower_bound=0, upper_bound=4000, dec_places_round=4)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_ZSET
-class fluxgate_zset(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 4000
-		self.dec_places_round = 4
-
-	def process(self, rawdata):
-		converted = dec(rawdata)*dec("0.001")
-		return converted
+fluxgate_zset = spec("fluxgate_zset", ops=[("*", dec("0.001"))], lower_bound=0, upper_bound=4000, dec_places_round=4)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													FLUXGATE_FLAG
@@ -5887,1081 +3031,337 @@ class fluxgate_flag(DataConverter):
 #				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T1
-class triaxial_T1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T1 = spec("triaxial_T1", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X1
-class triaxial_X1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X1 = spec("triaxial_X1", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y1
-class triaxial_Y1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y1 = spec("triaxial_Y1", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z1
-class triaxial_Z1(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z1 = spec("triaxial_Z1", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T2
-class triaxial_T2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T2 = spec("triaxial_T2", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X2
-class triaxial_X2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X2 = spec("triaxial_X2", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y2
-class triaxial_Y2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y2 = spec("triaxial_Y2", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z2
-class triaxial_Z2(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z2 = spec("triaxial_Z2", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T3
-class triaxial_T3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T3 = spec("triaxial_T3", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X3
-class triaxial_X3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X3 = spec("triaxial_X3", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y3
-class triaxial_Y3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y3 = spec("triaxial_Y3", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z3
-class triaxial_Z3(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z3 = spec("triaxial_Z3", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T4
-class triaxial_T4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T4 = spec("triaxial_T4", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X4
-class triaxial_X4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X4 = spec("triaxial_X4", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y4
-class triaxial_Y4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y4 = spec("triaxial_Y4", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z4
-class triaxial_Z4(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z4 = spec("triaxial_Z4", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T5
-class triaxial_T5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T5 = spec("triaxial_T5", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X5
-class triaxial_X5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X5 = spec("triaxial_X5", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y5
-class triaxial_Y5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y5 = spec("triaxial_Y5", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z5
-class triaxial_Z5(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z5 = spec("triaxial_Z5", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T6
-class triaxial_T6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T6 = spec("triaxial_T6", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X6
-class triaxial_X6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X6 = spec("triaxial_X6", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y6
-class triaxial_Y6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y6 = spec("triaxial_Y6", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z6
-class triaxial_Z6(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z6 = spec("triaxial_Z6", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T7
-class triaxial_T7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T7 = spec("triaxial_T7", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X7
-class triaxial_X7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X7 = spec("triaxial_X7", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y7
-class triaxial_Y7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y7 = spec("triaxial_Y7", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z7
-class triaxial_Z7(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z7 = spec("triaxial_Z7", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T8
-class triaxial_T8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T8 = spec("triaxial_T8", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X8
-class triaxial_X8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X8 = spec("triaxial_X8", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y8
-class triaxial_Y8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y8 = spec("triaxial_Y8", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z8
-class triaxial_Z8(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z8 = spec("triaxial_Z8", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T9
-class triaxial_T9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T9 = spec("triaxial_T9", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X9
-class triaxial_X9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X9 = spec("triaxial_X9", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y9
-class triaxial_Y9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y9 = spec("triaxial_Y9", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z9
-class triaxial_Z9(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z9 = spec("triaxial_Z9", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T10
-class triaxial_T10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T10 = spec("triaxial_T10", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X10
-class triaxial_X10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X10 = spec("triaxial_X10", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y10
-class triaxial_Y10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y10 = spec("triaxial_Y10", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z10
-class triaxial_Z10(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z10 = spec("triaxial_Z10", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T11
-class triaxial_T11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T11 = spec("triaxial_T11", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X11
-class triaxial_X11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X11 = spec("triaxial_X11", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y11
-class triaxial_Y11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y11 = spec("triaxial_Y11", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z11
-class triaxial_Z11(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z11 = spec("triaxial_Z11", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T12
-class triaxial_T12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
-				
-#-------------------------------------------------------------------------------------------------------------------
-#													TRIAXIAL_X12
-class triaxial_X12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_T12 = spec("triaxial_T12", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
-#													TRIAXIAL_Y12
-class triaxial_Y12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+#													TRIAXIAL_X12
+triaxial_X12 = spec("triaxial_X12", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
+				
+#-------------------------------------------------------------------------------------------------------------------
+#													TRIAXIAL_Y12
+triaxial_Y12 = spec("triaxial_Y12", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z12
-class triaxial_Z12(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z12 = spec("triaxial_Z12", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T13
-class triaxial_T13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T13 = spec("triaxial_T13", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X13
-class triaxial_X13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X13 = spec("triaxial_X13", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y13
-class triaxial_Y13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y13 = spec("triaxial_Y13", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z13
-class triaxial_Z13(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z13 = spec("triaxial_Z13", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T14
-class triaxial_T14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T14 = spec("triaxial_T14", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X14
-class triaxial_X14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X14 = spec("triaxial_X14", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y14
-class triaxial_Y14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y14 = spec("triaxial_Y14", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z14
-class triaxial_Z14(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z14 = spec("triaxial_Z14", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T15
-class triaxial_T15(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T15 = spec("triaxial_T15", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X15
-class triaxial_X15(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X15 = spec("triaxial_X15", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y15
-class triaxial_Y15(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y15 = spec("triaxial_Y15", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z15
-class triaxial_Z15(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z15 = spec("triaxial_Z15", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T16
-class triaxial_T16(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T16 = spec("triaxial_T16", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X16
-class triaxial_X16(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X16 = spec("triaxial_X16", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y16
-class triaxial_Y16(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y16 = spec("triaxial_Y16", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z16
-class triaxial_Z16(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z16 = spec("triaxial_Z16", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T17
-class triaxial_T17(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T17 = spec("triaxial_T17", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X17
-class triaxial_X17(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X17 = spec("triaxial_X17", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y17
-class triaxial_Y17(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y17 = spec("triaxial_Y17", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z17
-class triaxial_Z17(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z17 = spec("triaxial_Z17", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T18
-class triaxial_T18(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T18 = spec("triaxial_T18", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X18
-class triaxial_X18(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X18 = spec("triaxial_X18", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y18
-class triaxial_Y18(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y18 = spec("triaxial_Y18", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z18
-class triaxial_Z18(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z18 = spec("triaxial_Z18", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T19
-class triaxial_T19(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T19 = spec("triaxial_T19", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X19
-class triaxial_X19(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X19 = spec("triaxial_X19", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y19
-class triaxial_Y19(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y19 = spec("triaxial_Y19", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z19
-class triaxial_Z19(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z19 = spec("triaxial_Z19", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_T20
-class triaxial_T20(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 20
-		self.dec_places_round = 0
-
-	def process(self, rawdata):
-		converted = dec(rawdata)
-		return converted
+triaxial_T20 = spec("triaxial_T20", lower_bound=0, upper_bound=20, dec_places_round=0)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_X20
-class triaxial_X20(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_X20 = spec("triaxial_X20", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Y20
-class triaxial_Y20(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Y20 = spec("triaxial_Y20", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_Z20
-class triaxial_Z20(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 0
-		self.upper_bound = 32000
-		self.dec_places_round = 3
-
-	def process(self, rawdata):
-		converted = dec(rawdata)/dec("62.48")
-		return converted
+triaxial_Z20 = spec("triaxial_Z20", ops=[("/", dec("62.48"))], lower_bound=0, upper_bound=32000, dec_places_round=3)
 		
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_CURRENT
-class triaxial_current(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = "FIX"
-		self.upper_bound = "FIX"
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = (((dec(rawdata)/dec("1024"))*dec("5"))/dec("300"))*dec("1000")
-		return converted
+triaxial_current = spec("triaxial_current", ops=[("/", dec("1024")), ("*", dec("5")), ("/", dec("300")), ("*", dec("1000"))],
+	lower_bound="FIX", upper_bound="FIX", dec_places_round=2)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_VOLTS
-class triaxial_volts(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = 4.8
-		self.upper_bound = 5.1
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((dec(rawdata)/dec("1024"))*dec("5"))*dec("2")
-		return converted
+triaxial_volts = spec("triaxial_volts", ops=[("/", dec("1024")), ("*", dec("5")), ("*", dec("2"))],
+	lower_bound=4.8, upper_bound=5.1, dec_places_round=2)
 				
 #-------------------------------------------------------------------------------------------------------------------
 #													TRIAXIAL_TEMPERATURE
-class triaxial_temperature(DataConverter):
-	def __init__(self):
-		DataConverter.__init__(self)
-		self.lower_bound = -40
-		self.upper_bound = 110
-		self.dec_places_round = 2
-
-	def process(self, rawdata):
-		converted = ((((dec(rawdata)/dec("1024"))*dec("5"))-dec("2.73"))*dec("180"))+dec("32")
-		return converted
+triaxial_temperature = spec("triaxial_temperature", ops=[("/", dec("1024")), ("*", dec("5")), ("-", dec("2.73")), ("*", dec("180")), ("+", dec("32"))],
+	lower_bound=-40, upper_bound=110, dec_places_round=2)
 
 #***************ADD NEW DATACONVERTERS TO CONVERT.PY WHEN DEFINED***************#
@@ -0,0 +1,353 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds ColumnArchive, which keeps every row saved as *
+#* columns of fixed width binary, a file per outdata.conf     *
+#* field plus one of timestamps, so that a day's data can be  *
+#* memory mapped and read with numpy (see load()) instead of  *
+#* parsing every row of 2UNIX_backup. Numbers are kept as     *
+#* float64, and fields that give text (the status fields) as  *
+#* int32 codes into a table of the texts seen. Each day's     *
+#* columns are kept in a directory of their own with a header *
+#* giving the archive version and every column's file, type   *
+#* and label, and a new one is started when the columns       *
+#* change (outdata.conf is changed, or a field first gives    *
+#* text), so that old days stay readable. It is a sink of the *
+#* write-ahead log (see wal.py), written every                *
+#* COLUMN_ARCHIVE_FLUSH_ROWS rows to files kept open, and     *
+#* synced to disk as often as OUTPUT_SYNC_ROWS and            *
+#* OUTPUT_SYNC_SECONDS say. Turned on by COLUMN_ARCHIVE_PATH  *
+#* in Config.py.                                              *
+#**************************************************************
+
+import Config
+from outfiles import OutputFile, OUTPUT_SYNC_ROWS, OUTPUT_SYNC_SECONDS
+
+from array import array
+import hashlib
+import os
+import sys
+import time
+
+try:																						#numpy is optional: only load() needs it
+	import numpy
+except ImportError:
+	numpy = None
+
+try:
+	import resource
+except ImportError:
+	resource = None
+
+COLUMN_ARCHIVE_PATH = getattr(Config, "COLUMN_ARCHIVE_PATH", None)							#directory (in the station's) the column archive is kept in. None keeps none
+COLUMN_ARCHIVE_FLUSH_ROWS = getattr(Config, "COLUMN_ARCHIVE_FLUSH_ROWS", 20)				#rows held in memory before they are written to the column files
+ARCHIVE_VERSION = 1																			#version of the layout below, the first line of every header
+
+FLOAT, TEXT = "float64", "int32"
+TYPECODES = {FLOAT: 'd', TEXT: 'i'}
+EXTENSIONS = {FLOAT: ".f8", TEXT: ".i4"}
+
+#===========================================================================================================
+#												COLUMNARCHIVE:
+#===========================================================================================================
+class ColumnArchive:
+	"""
+	Columns of every row given to add(), in directory. labels are the fields
+	kept and columns their column among the last width fields of a row (rows
+	are tab separated lines, as saved to 2UNIX, whose first field is the
+	time). Rows are numbered as in the write-ahead log: added is the number of
+	the last row taken, written the last written to the column files and
+	synced the last synced to disk, as often as OUTPUT_SYNC_ROWS and
+	OUTPUT_SYNC_SECONDS say.
+
+	A day's columns are kept in <directory>/<YYYYMMDD>-<schema>, a segment:
+	a header, a file of timestamps (time.f8) and a file for each field, each
+	value the same number of bytes in the machine's byte order, and a .txt
+	file of texts, one a line, for each int32 column. Values that are neither
+	numbers nor text (NULL) are nan. Every column is written and synced up to
+	the same row before time.f8, which is written and synced last, so the
+	rows of a segment are those in time.f8 and anything after them in the
+	other files is ignored. The latest segment's files are kept open.
+	"""
+	def __init__(self, directory, labels, columns, width, written):
+		self.directory = directory
+		self.labels = list(labels)
+		self.columns = list(columns)
+		self.width = width
+		self.added = written
+		self.written = written
+		self.synced = written
+		self.last_sync = time.time()
+		self.text = set()																	#indexes of the fields kept as text, the same from day to day
+		self.segment = None
+		self.seed_text()
+		if resource is not None:															#a segment keeps a file open for every column (and its texts)
+			try:
+				soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+				wanted = soft + 2*(len(self.labels) + 1)
+				if hard != resource.RLIM_INFINITY:
+					wanted = min(wanted, hard)
+				resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+			except (ValueError, resource.error):										#opening the files fails, and is alerted to, if too few are allowed
+				pass
+
+	def seed_text(self):
+		"""Starts with the fields the latest segment kept as text, so that a restart doesn't start another one."""
+		try:
+			headers = [os.path.join(self.directory, name, "header") for name in os.listdir(self.directory)]
+			latest = max((os.path.getmtime(header), header) for header in headers if os.path.exists(header))[1]
+		except (OSError, ValueError):														#no archive yet
+			return
+		kinds = dict((label, kind) for name, kind, label in read_header(os.path.dirname(latest))[1:])
+		self.text = set(index for index, label in enumerate(self.labels) if kinds.get(label) == TEXT)
+
+	def schema(self):
+		"""Returns (name, kind) for every column, time first."""
+		return [("time", FLOAT)] + [(label, TEXT if index in self.text else FLOAT) for index, label in enumerate(self.labels)]
+
+##ADD ROWS==================================================================================================
+	def add(self, rows, length):
+		"""
+		Takes (number, row) for rows after the last added, writing them out every
+		COLUMN_ARCHIVE_FLUSH_ROWS rows and when a new segment is started. Rows
+		should be length fields long, as those saved under the current
+		outdata.conf are. Returns the number of rows skipped as not fitting the
+		columns: those of another length (saved before outdata.conf was changed,
+		and given again from the log after a restart) or whose time isn't a
+		number. Raises IOError or OSError if they can't be written, forgetting
+		every row not written, to be added again.
+		"""
+		skipped = 0
+		try:
+			for seq, row in rows:
+				if seq <= self.added:
+					continue
+				fields = row.rstrip('\n').split('\t')
+				try:
+					if len(fields) != length:
+						raise ValueError("Row has " + str(len(fields)) + " fields, not " + str(length) + ".")
+					stamp = float(fields[0])
+					fields = fields[-self.width:]
+					values = [fields[column] for column in self.columns]
+				except (ValueError, IndexError):											#can't be put in these columns: left to 2UNIX and the backups
+					skipped += 1
+					self.added = seq
+					continue
+				for index, value in enumerate(values):
+					if index not in self.text:
+						try:
+							values[index] = float(value)
+						except ValueError:
+							if value == Config.NULL_VAL:
+								values[index] = float("nan")
+							else:															#a field giving text for the first time needs a column of its own
+								self.text.add(index)
+				name = time.strftime("%Y%m%d", time.localtime(stamp)) + "-" + schema_hash(self.schema())
+				if self.segment is None or self.segment.name != name:
+					if self.segment is not None:												#a new day or schema: the last segment is done with
+						self.segment.flush()
+						self.segment.sync()
+						self.segment.close()
+						self.segment = None
+						self.written = self.synced = self.added
+					self.segment = Segment(os.path.join(self.directory, name), self.schema())
+				self.segment.append(stamp, values)
+				self.added = seq
+			if self.segment is not None and self.segment.pending >= COLUMN_ARCHIVE_FLUSH_ROWS:
+				self.flush()
+		except (IOError, OSError):
+			if self.segment is not None:													#opened afresh from disk next time, which has what was synced at least
+				self.segment.close()
+				self.segment = None
+			self.added = self.written = self.synced
+			raise
+		return skipped
+
+	def flush(self):
+		"""
+		Writes out every row added, and syncs them to disk as often as
+		OUTPUT_SYNC_ROWS and OUTPUT_SYNC_SECONDS say. Raises IOError or OSError
+		as add() does.
+		"""
+		if self.segment is not None:
+			self.segment.flush()
+		self.written = self.added
+		if (OUTPUT_SYNC_ROWS and self.written - self.synced >= OUTPUT_SYNC_ROWS) or \
+			(OUTPUT_SYNC_SECONDS and time.time() - self.last_sync >= OUTPUT_SYNC_SECONDS):
+			self.sync()
+
+	def sync(self):
+		if self.segment is not None:
+			self.segment.sync()
+		self.synced = self.written
+		self.last_sync = time.time()
+
+	def close(self):
+		"""Writes out and syncs every row added, and closes the files. Raises IOError or OSError as add() does."""
+		try:
+			self.flush()
+			self.sync()
+		except (IOError, OSError):
+			self.added = self.written = self.synced
+			raise
+		finally:
+			if self.segment is not None:
+				self.segment.close()
+				self.segment = None
+
+#===========================================================================================================
+#												SEGMENT:
+#===========================================================================================================
+class Segment:
+	"""
+	One directory of the archive: the columns of one day, for one schema
+	((name, kind) for every column). Its files are kept open and appended to,
+	after cutting off anything left past the last whole row by a crash or a
+	failed write when it is opened.
+	"""
+	def __init__(self, path, schema):
+		self.path = path
+		self.name = os.path.basename(path)
+		self.schema = schema
+		self.files = [os.path.join(path, "%04d" % index + EXTENSIONS[kind]) for index, (name, kind) in enumerate(schema)]
+		self.files[0] = os.path.join(path, "time.f8")
+		self.buffers = [array(TYPECODES[kind]) for name, kind in schema]
+		self.codes = {}																		#keys each column kept as text to a dict keying each text to its code
+		self.texts = {}																		#the texts of each such column not yet written
+		if not os.path.exists(os.path.join(path, "header")):
+			self.create()
+		self.rows = self.recover()															#rows written
+		self.last_time = None																#time of the last row written, below which rows are taken to be written already
+		if self.rows:
+			with open(self.files[0], 'rb') as stamps:
+				stamps.seek(8*(self.rows - 1))
+				self.last_time = array('d', stamps.read(8))[0]
+		for index, (name, kind) in enumerate(schema):
+			if kind == TEXT:
+				self.load_texts(index)
+		self.outputs = [OutputFile(path, sync_rows=0, sync_seconds=0) for path in self.files]		#synced by ColumnArchive.sync()
+		self.text_outputs = dict((index, OutputFile(self.files[index] + ".txt", sync_rows=0, sync_seconds=0)) for index in self.codes)
+		self.pending = 0																	#rows held, not yet written
+
+	def create(self):
+		"""Makes the directory and writes the header, by way of a new file renamed, so that a header is never seen half written."""
+		if not os.path.exists(self.path):
+			os.makedirs(self.path)
+		lines = ["column archive " + str(ARCHIVE_VERSION), "schema " + schema_hash(self.schema), "byteorder " + sys.byteorder,
+			"error_value " + str(Config.ERROR_VAL)]
+		lines += ["\t".join([os.path.basename(path), kind, name]) for path, (name, kind) in zip(self.files, self.schema)]
+		with open(os.path.join(self.path, "header.new"), 'w') as header:
+			header.write("\n".join(lines) + "\n")
+		os.rename(os.path.join(self.path, "header.new"), os.path.join(self.path, "header"))
+		for path, (name, kind) in zip(self.files, self.schema):
+			open(path, 'ab').close()
+			if kind == TEXT:
+				open(path + ".txt", 'ab').close()
+
+	def recover(self):
+		"""Returns the number of rows every column holds, cutting each column off after them."""
+		sizes = [os.path.getsize(path) if os.path.exists(path) else 0 for path in self.files]
+		rows = min(size//buffer.itemsize for size, buffer in zip(sizes, self.buffers))
+		for path, size, buffer in zip(self.files, sizes, self.buffers):
+			if size > rows*buffer.itemsize:
+				cut(path, rows*buffer.itemsize)
+		return rows
+
+	def load_texts(self, index):
+		codes = {}
+		size = 0
+		path = self.files[index] + ".txt"
+		if os.path.exists(path):
+			with open(path, 'rb') as texts:
+				for line in texts:
+					if not line.endswith('\n'):
+						break
+					codes.setdefault(line[:-1], len(codes))
+					size += len(line)
+			if os.path.getsize(path) > size:												#a text cut short
+				cut(path, size)
+		self.codes[index] = codes
+		self.texts[index] = []
+
+	def append(self, stamp, values):
+		"""Holds a row: its time and its values, floats for the columns kept as float64 and text for the rest."""
+		if self.last_time is not None:
+			if stamp <= self.last_time:														#written before a crash, ahead of its checkpoint
+				return
+			self.last_time = None
+		self.buffers[0].append(stamp)
+		for index, value in enumerate(values, 1):
+			if index in self.codes:
+				codes = self.codes[index]
+				if value not in codes:
+					codes[value] = len(codes)
+					self.texts[index].append(value)
+				self.buffers[index].append(codes[value])
+			else:
+				self.buffers[index].append(value)
+		self.pending += 1
+
+	def flush(self):
+		"""
+		Appends the rows held to every column, texts first and time last. If a
+		write fails, the segment must be opened afresh (see recover()) before
+		anything more is written to it.
+		"""
+		if not self.pending:
+			return
+		for index in self.texts:
+			if self.texts[index]:
+				self.text_outputs[index].write("".join(value + '\n' for value in self.texts[index]))
+				self.texts[index] = []
+		for index in range(len(self.files) - 1, -1, -1):
+			self.outputs[index].write(self.buffers[index].tostring())
+		self.rows += self.pending
+		self.pending = 0
+		self.buffers = [array(buffer.typecode) for buffer in self.buffers]
+
+	def sync(self):
+		"""Syncs every file to disk, texts first and time last, so that every row in time.f8 is in every other file."""
+		for output in self.text_outputs.values() + self.outputs[1:] + self.outputs[:1]:
+			output.sync()
+
+	def close(self):
+		"""Closes every file. Never raises."""
+		for output in self.text_outputs.values() + self.outputs:
+			output.close()
+
+def cut(path, size):
+	"""Cuts the file at path off after size bytes."""
+	with open(path, 'r+b') as out:
+		out.truncate(size)
+
+def schema_hash(schema):
+	return hashlib.md5("\n".join(name + " " + kind for name, kind in schema)).hexdigest()[:8]
+
+##READ AN ARCHIVE===========================================================================================
+def read_header(path):
+	"""Returns the version of the segment at path, then (file, kind, label) for each of its columns."""
+	with open(os.path.join(path, "header"), 'r') as header:
+		lines = header.read().splitlines()
+	version = int(lines[0].split()[-1])
+	return [version] + [tuple(line.split("\t", 2)) for line in lines if "\t" in line]
+
+def load(path):
+	"""
+	Returns (columns, texts) for the segment at path: columns keys "time" and
+	each label to a read-only numpy memmap of its values, and texts keys each
+	label kept as text to the list of texts its codes index. Rows past the
+	last time written (a write cut short) are left out.
+	"""
+	entries = read_header(path)[1:]
+	rows = os.path.getsize(os.path.join(path, "time.f8"))//8
+	columns = {}
+	texts = {}
+	for name, kind, label in entries:
+		if rows:
+			columns[label] = numpy.memmap(os.path.join(path, name), dtype=kind, mode='r', shape=(rows,))
+		else:
+			columns[label] = numpy.zeros(0, dtype=kind)
+		if kind == TEXT:
+			with open(os.path.join(path, name + ".txt"), 'r') as lines:
+				texts[label] = [line.rstrip('\n') for line in lines]
+	return columns, texts
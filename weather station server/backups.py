@@ -0,0 +1,241 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds BackupWriter, which writes rows to the backup *
+#* on the flash drive, or to the local backup while the flash *
+#* drive is unmounted, on a thread of its own, so that a slow *
+#* or wedged USB stick never holds up the cycle.              *
+#* DataOutputter hands it rows from its write-ahead log (see  *
+#* wal.py) through a queue of at most BACKUP_QUEUE_SIZE       *
+#* chunks, and moves the flash and local checkpoints up to    *
+#* what it reports written. Rows the flash drive missed are   *
+#* handed over again from the log once it is back, at most    *
+#* BACKUP_CHUNK_ROWS a cycle, so that catching up on a long   *
+#* backlog is spread over many cycles.                        *
+#**************************************************************
+
+import errors
+import Config
+from outfiles import OutputFiles
+
+import collections
+import os
+import threading
+import traceback
+
+BACKGROUND_BACKUPS = getattr(Config, "BACKGROUND_BACKUPS", True)							#write the flash and local backups on their own thread. False writes them in the cycle
+BACKUP_QUEUE_SIZE = getattr(Config, "BACKUP_QUEUE_SIZE", 8)									#chunks of rows held for the backup writer before the cycle stops handing it more
+BACKUP_CHUNK_ROWS = getattr(Config, "BACKUP_CHUNK_ROWS", 120)								#rows handed to the backup writer a cycle at most, when it has rows to catch up on
+BACKUP_STOP_TIMEOUT = 10.0																	#seconds to wait at exit for the backup writer to finish what it has been handed
+
+#===========================================================================================================
+#												BACKUPWRITER:
+#===========================================================================================================
+class BackupWriter:
+	"""
+	Writes chunks of rows ((number, row), oldest first) to the flash drive
+	backup if it is mounted, or else to the local backup, skipping rows
+	already written there. flash_done and local_done are the numbers of the
+	last rows written to each, starting from the checkpoints given, and
+	flash_synced and local_synced those of the last synced to disk. A chunk
+	that would leave a gap (handed while the drive was unmounted, written
+	once it is back) is dropped, to be handed over again from flash_done.
+	The local backup is emptied once the flash drive has everything in it.
+	"""
+	def __init__(self, config, flash_done, local_done, local_backlog, threaded=BACKGROUND_BACKUPS, capacity=BACKUP_QUEUE_SIZE):
+		self.config = config
+		self.files = OutputFiles()															#the backup files, used only by the writer
+		self.flash_done = flash_done
+		self.local_done = local_done
+		self.flash_synced = flash_done
+		self.local_synced = local_done
+		self.local_backlog = local_backlog													#set while the local backup holds rows the flash drive may not have
+		self.mounted = True																	#whether the flash drive was mounted when last written to
+		self.threaded = threaded
+		self.capacity = capacity
+		self.chunks = collections.deque()
+		self.condition = threading.Condition()
+		self.writing = False																#set while the writer has a chunk out of the queue
+		self.running = False
+		self.flash_file_error = False
+		self.flash_drive_error = False
+		self.writer_error = False
+		self.prefix = errors.get_prefix()													#the messages of the station backed up, sent from the writer's thread too
+		if threaded:
+			self.start()
+
+	def start(self):
+		self.running = True
+		self.thread = threading.Thread(target=self.write_forever)
+		self.thread.daemon = True															#don't keep python alive once the main loop exits
+		self.thread.start()
+		errors.debug("Backup writer started.")
+
+	def write_forever(self):
+		"""Body of the backup writer's thread. Writes each chunk handed to it, until stopped and every chunk is written."""
+		errors.set_prefix(self.prefix)
+		while True:
+			with self.condition:
+				while self.running and not self.chunks:
+					self.condition.wait()
+				if not self.chunks:
+					return
+				rows = self.chunks.popleft()
+				self.writing = True
+			try:
+				self.write(rows)
+				self.writer_error = False
+			except:																			#never let the thread die: backups would stop until restart
+				if not self.writer_error:
+					errors.error("Error in backup writer. Assume error continues until otherwise notified. " +
+						"Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+				self.writer_error = True
+			finally:
+				with self.condition:
+					self.writing = False
+
+	def stop(self):
+		"""
+		Asks the writer to stop once it has written what it has been handed, and
+		waits for it (for at most BACKUP_STOP_TIMEOUT seconds: the flash drive
+		may be wedged). Closes its files if it has stopped.
+		"""
+		if self.threaded:
+			with self.condition:
+				self.running = False
+				self.condition.notify()
+			self.thread.join(BACKUP_STOP_TIMEOUT)
+			if self.thread.is_alive():
+				errors.debug("Backup writer still writing, not waited for.")
+				return
+		self.files.close()
+		self.note_synced()
+
+##HAND OVER ROWS============================================================================================
+	def hand(self, rows):
+		"""
+		Gives the writer a chunk of rows to write. Returns False if its queue is
+		full, in which case they must be handed over again later. Without a
+		thread, writes them now.
+		"""
+		if not self.threaded:
+			self.write(rows)
+			return True
+		with self.condition:
+			if len(self.chunks) >= self.capacity:
+				return False
+			self.chunks.append(rows)
+			self.condition.notify()
+		return True
+
+	def idle(self):
+		"""Returns True if every chunk handed over has been written (or dropped)."""
+		with self.condition:
+			return not self.chunks and not self.writing
+
+	def depth(self):
+		"""Returns the number of chunks waiting to be written."""
+		with self.condition:
+			return len(self.chunks)
+
+	def progress(self):
+		"""Returns (flash_done, local_done, mounted)."""
+		with self.condition:
+			return self.flash_done, self.local_done, self.mounted
+
+	def synced(self):
+		"""Returns (flash_synced, local_synced)."""
+		with self.condition:
+			return self.flash_synced, self.local_synced
+
+##WRITE ROWS================================================================================================
+	def write(self, rows):
+		"""Writes rows to the flash drive backup if it is mounted, or else to the local backup."""
+		if os.path.ismount(self.config.FLASH_BACKUP_DIREC_PATH):
+			self.write_flash(rows)
+		else:
+			self.write_local(rows)
+		self.note_synced()
+
+	def note_synced(self):
+		"""
+		Takes flash_synced and local_synced from the backup files, which sync
+		as often as OUTPUT_SYNC_ROWS and OUTPUT_SYNC_SECONDS say, and sets
+		flash_done and local_done back to them if a file failed to sync as it
+		was closed (see OutputFile.close()), so that what it lost is written
+		again.
+		"""
+		flash = self.files.get(self.config.TO_UNIX_BACKUP_PATH)
+		local = self.files.get(self.config.LOCAL_BACKUP_FILE_PATH)
+		with self.condition:
+			if flash.synced_mark is not None:
+				self.flash_synced = flash.synced_mark
+			if local.synced_mark is not None:
+				self.local_synced = local.synced_mark
+			self.flash_done = self.flash_synced if flash.mark is None else flash.mark		#no mark: nothing written, or nothing of it known to be synced
+			self.local_done = self.local_synced if local.mark is None else local.mark
+
+	def write_flash(self, rows):
+		with self.condition:
+			self.mounted = True
+		rows = [(seq, row) for seq, row in rows if seq > self.flash_done]
+		if not rows or rows[0][0] != self.flash_done + 1:									#nothing new, or a gap: handed over again from flash_done
+			return
+		try:
+			self.files.get(self.config.TO_UNIX_BACKUP_PATH).write("".join(row for seq, row in rows), mark=rows[-1][0])
+		except (IOError, OSError):															#if failure, alert as appropriate. rows are kept in the log for next time
+			if not self.flash_drive_error:
+				errors.error("Flash drive mounted, but unable to write to flash backup. Data is kept in the " +
+					"write-ahead log until it can be. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+			self.flash_drive_error = True
+			if len(rows) > 1 and not self.flash_file_error:								#catching up failed: unmount, as copying the local backup over did
+				self.files.close_under(self.config.FLASH_BACKUP_DIREC_PATH)					#files held open would keep it from unmounting
+				os.system("sudo umount /dev/sda1")
+				self.flash_file_error = True
+			return
+		with self.condition:
+			self.flash_done = rows[-1][0]
+		if self.flash_drive_error:															#if it didn't work last time, alert that it is working
+			errors.error("Write to flash drive successful -- flash backup online.")
+			self.flash_drive_error = False
+		else:
+			errors.debug("Wrote " + str(len(rows)) + " rows to flash drive.")
+		self.flash_file_error = False
+		if self.local_backlog and self.flash_done >= self.local_done:
+			try:
+				self.files.get(self.config.LOCAL_BACKUP_FILE_PATH).clear()					#the flash drive has it all now
+				self.local_backlog = False
+			except (IOError, OSError):
+				errors.debug("Unable to clear local backup, trying again next write.")
+
+	def write_local(self, rows):
+		with self.condition:
+			self.mounted = False
+		self.files.close_under(self.config.FLASH_BACKUP_DIREC_PATH)						#so that they are opened afresh once it is mounted again
+		if not self.flash_drive_error:
+			errors.error("Flash drive unmounted. TS-4200 unable to write to backup file on flash drive. " +
+			"Data diverted to local filesystem backup until notified otherwise.")
+		else:
+			errors.debug("Flash drive still unmounted, diverting data to local backup.")
+		self.flash_drive_error = True
+		done = max(self.local_done, self.flash_done)
+		rows = [(seq, row) for seq, row in rows if seq > done]
+		if not rows or rows[0][0] != done + 1:
+			return
+		try:
+			self.files.get(self.config.LOCAL_BACKUP_FILE_PATH).write("".join(row for seq, row in rows), mark=rows[-1][0])
+		except (IOError, OSError):
+			errors.error("BACKING UP FAILED: unable to write to either flash " +
+				"or local backup. Error message: " +
+				traceback.format_exc(Config.TRACEBACK_LIMIT))
+			return
+		with self.condition:
+			self.local_done = rows[-1][0]
+		self.local_backlog = True
+
+##DAILY RESET===============================================================================================
+	def reset(self):
+		"""Resets error flags so notifications will be resent."""
+		self.flash_file_error = False
+		self.flash_drive_error = False
+		self.writer_error = False
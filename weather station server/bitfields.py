@@ -0,0 +1,168 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds StatusDecoder, which turns the status bytes   *
+#* the PIC sends (geiger_status, fuses_flag, ...) into the    *
+#* text saved for them, by a table of what each bit means.    *
+#* Every value a status byte can take is decoded once, when   *
+#* the decoder is made, so decoding is a dictionary lookup.   *
+#* Also holds ByteCombiner, which puts readings sent a byte   *
+#* at a time (RTD_1K_upper, _middle, _lower) back together.   *
+#**************************************************************
+
+try:																						#numpy is optional: only ByteCombiner.combine_columns needs it
+	import numpy
+except ImportError:
+	numpy = None
+
+#===========================================================================================================
+#												STATUSDECODER:
+#===========================================================================================================
+class StatusDecoder:
+	"""
+	Decodes a status byte by its bits. messages lists (bit, message) for the
+	bits that mean something when set, and clear_messages (bit, message) for
+	those that mean something when clear. Each of these is a condition, and
+	a value's text is the messages of the conditions it meets, lowest bit
+	first (and a bit's clear message before its set message), joined by
+	commas, or ok if it meets none. Bits not listed are ignored.
+
+	Alternatively, values keys every value of the bits in mask to its text,
+	for bytes whose bits don't read as a list (see power_status). Each value
+	is then a condition of its own, so that any change is a change of
+	condition.
+
+	A decoder can be given to spec() as a decoder, or used by a
+	StatusConverter (see DataConverters.py) to alert to new conditions.
+	"""
+	def __init__(self, messages=(), clear_messages=(), ok="OK", values=None, mask=None):
+		self.ok = ok
+		if values is not None:
+			self.mask = mask
+			self.conditions = [(None, value, values[value]) for value in sorted(values)]
+			self.table = dict((value, (values[value], 1 << i)) for i, value in enumerate(sorted(values)))
+			return
+		conditions = [(bit, 0, message) for bit, message in clear_messages] + [(bit, 1, message) for bit, message in messages]
+		conditions.sort(key=lambda condition: condition[:2])
+		self.conditions = conditions															#(bit, value of the bit that meets it, message), in the order they are reported
+		self.mask = 0
+		for bit, when, message in conditions:
+			self.mask |= 1 << bit
+		self.table = {}																		#keys each value of the bits in mask to (text, conditions met as a bitmask)
+		value = self.mask
+		while True:																			#every subset of the bits in mask
+			met = 0
+			for i, (bit, when, message) in enumerate(conditions):
+				if (value >> bit) & 1 == when:
+					met |= 1 << i
+			self.table[value] = (self.describe(met), met)
+			if not value:
+				break
+			value = (value - 1) & self.mask
+
+	def decode(self, raw):
+		"""
+		Returns (text, conditions) for raw, a status byte as an int or a
+		string of one. conditions is a bitmask of the conditions it meets, bit i
+		for condition i. Raises ValueError for a non-integer raw.
+		A negative raw is read as its converters always read it, from the
+		digits of bin(): as the positive value, with the bit just above its
+		highest set bit being the "b" of "-0b...", which raises ValueError
+		if it is read (so -1 fails for bytes whose bit 1 means anything).
+		"""
+		value = int(raw)
+		if value < 0:
+			value = -value
+			if (self.mask >> value.bit_length()) & 1:
+				raise ValueError("Status byte " + repr(raw) + " is negative.")
+		return self.table[value & self.mask]
+
+	def __call__(self, raw):
+		return self.decode(raw)[0]
+
+	def describe(self, conditions):
+		"""Returns the text for a bitmask of conditions, as decode() gives it."""
+		messages = [message for i, (bit, when, message) in enumerate(self.conditions) if (conditions >> i) & 1]
+		return ", ".join(messages) or self.ok
+
+	def changed(self, old, new):
+		"""
+		Returns (begun, ended) for two raw status bytes: bitmasks of the
+		conditions that new meets and old did not, and the other way round.
+		"""
+		old = self.decode(old)[1]
+		new = self.decode(new)[1]
+		return new & ~old, old & ~new
+
+#===========================================================================================================
+#												BYTECOMBINER:
+#===========================================================================================================
+class ByteCombiner:
+	"""
+	Combines raw fields that each hold one byte of a reading into the 16, 24
+	or 32-bit integer they make up, by shifts and masks. labels are the raw
+	labels of the bytes, most significant first for byteorder "big" and
+	least significant first for "little". signed reads the result as two's
+	complement. Bytes received as strings are read in base (16 for bytes
+	sent as hex, such as "A3"); bytes picdata.conf gives a type are used as
+	parsed. A byte that isn't a whole number from 0 to 255 raises ValueError.
+	"""
+	def __init__(self, labels, byteorder="big", signed=False, base=10):
+		if len(labels) not in (2, 3, 4):
+			raise ValueError("ByteCombiner needs 2, 3 or 4 bytes, not " + str(len(labels)) + ".")
+		if byteorder not in ("big", "little"):
+			raise ValueError("Unknown byteorder " + repr(byteorder) + ".")
+		self.labels = tuple(labels)
+		self.byteorder = byteorder
+		self.signed = signed
+		self.base = base
+		self.bits = 8*len(labels)
+		self.shifts = [8*i for i in range(len(labels))]									#the shift of each byte, in the order of labels
+		if byteorder == "big":
+			self.shifts.reverse()
+
+	def byte(self, raw):
+		if isinstance(raw, str):
+			value = int(raw, self.base)
+		else:
+			value = int(raw)
+			if value != raw:
+				raise ValueError("Byte " + repr(raw) + " is not a whole number.")
+		if value & ~0xFF:
+			raise ValueError("Byte " + repr(raw) + " is out of range.")
+		return value
+
+	def combine(self, raw_bytes):
+		"""Returns the integer made up of raw_bytes, given in the order of labels."""
+		value = 0
+		for raw, shift in zip(raw_bytes, self.shifts):
+			value |= self.byte(raw) << shift
+		if self.signed and value >> (self.bits - 1):
+			value -= 1 << self.bits
+		return value
+
+	def read(self, reader):
+		"""Returns the integer made up of this frame's bytes in reader. Raises as get_value() does."""
+		return self.combine([reader.get_value(label) for label in self.labels])
+
+	def combine_columns(self, columns):
+		"""
+		Combines whole columns of bytes at once, for reprocessing many frames
+		(see convert.convert_bulk). columns gives a sequence of raw bytes for
+		each label, in order. Returns a numpy array of the integers and a
+		numpy array that is True where any byte was missing or bad.
+		"""
+		frames = len(columns[0])
+		value = numpy.zeros(frames, dtype=numpy.int64)
+		bad = numpy.zeros(frames, dtype=bool)
+		for column, shift in zip(columns, self.shifts):
+			parsed = numpy.zeros(frames, dtype=numpy.int64)
+			for i, raw in enumerate(column):
+				try:
+					parsed[i] = self.byte(raw)
+				except (ValueError, TypeError, ArithmeticError):
+					bad[i] = True
+			value |= (parsed & 0xFF) << shift
+		if self.signed:
+			value -= (value >> (self.bits - 1) & 1) << self.bits
+		return value, bad
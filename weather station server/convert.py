@@ -3,15 +3,43 @@
 #**************************************************************
 #* Notes: Instantiates all DataConverter subclasses and calls *
 #* instances' safe_process methods. 						  *
+#* Converters declared with spec() (see DataConverters.py)    *
+#* are compiled into a ConversionPlan, which converts them    *
+#* all in one loop rather than through safe_process, and      *
+#* families of them (such as sway_X1..X40) with numpy.        *
+#* Converters that use other fields' converted data (see      *
+#* DataConverter.inputs()) are run after those fields.        *
+#* A converter whose inputs are as they were last cycle, and  *
+#* that converted them without error then, passes on the same *
+#* value again without converting anything.                   *
 #**************************************************************
 
 import DataConverters as dc
+import errors
 from errors import debug
+from handleData import DataMissingError
+import Config
+import timing
+import ranges
+
+import traceback
+import operator
+import heapq
+from decimal import Decimal
+
+try:																						#numpy is optional: without it every field is converted one by one
+	import numpy
+except ImportError:
+	numpy = None
+
+VECTOR_FAMILIES = getattr(Config, "VECTOR_FAMILIES", ["fluxgate_", "triaxial_", "sway_"])		#conv label prefixes of the array sensor families to convert with numpy, in float
+MEMOIZE_CONVERSIONS = getattr(Config, "MEMOIZE_CONVERSIONS", True)							#False converts every field every cycle, as before
+NUMBERS = (int, long, float, Decimal)
 
 #this list holds the converter object corresponding to every outgoing data field
 #when new fields are added, a new subclass of DataConverter should be defined and added here
-#the order of this list is inconsequential unless there is a converter that requires the last value of
-#another, in which case the dependent one should go after its dependency
+#the order of this list is inconsequential: a converter that uses another's converted data declares it in its
+#converted_inputs, and ConversionPlan converts it after that one wherever it is listed (see order_converters)
 
 all_converters = [
 	dc.mux_current(),							
@@ -493,13 +521,561 @@ all_converters = [
 	]
 
 
-def process_all():									#this function loops through all converters and calls safe_process on them.
-	debug("process_all called; calling safe_process of all data converters...")
-	for converter in all_converters:				#it is called from main.py after data is read.
-		converter.safe_process()					#safe_process (defined in DataConverters.py) handles getting raw data from the reader, converting it, responding to
-													#it, sending alerts about it, and finally passing it to the outputter
+#===========================================================================================================
+#												CONVERSIONPLAN:
+#===========================================================================================================
+class ConversionPlan:
+	"""
+	Runs a list of converters in order, after putting each that uses other
+	fields' converted data after the converters of those fields (see
+	order_converters). Each SpecConverter is compiled once
+	into a step holding its raw data slot, formula, operators, rounding and
+	bounds, and converted inline, with the same results, alerts and flags as
+	its safe_process would give. Spec'd converters in the same family (see
+	VECTOR_FAMILIES) are converted together by a VectorFamily, in the place
+	of the first of them. Any other converter is run by its own
+	safe_process. Iterating over a plan gives its converters, in the order
+	they are run.
+
+	With MEMOIZE_CONVERSIONS, each converter's raw inputs (as received, so
+	that "1.0" and "1.00" differ) and converted inputs are kept when it
+	converts them without a range, process or status error, and while they
+	stay the same its last value is passed on again in place of converting
+	them. Alerts are unaffected: a converter with an error set is always
+	converted, and resetting its flags forgets its inputs.
+
+	With CONVERTER_TIMING (see timing.py), every converter is run by its own
+	safe_process, every cycle, so that each can be timed the same way.
+
+	Range checks are left to a RangeTable (see ranges.py), which checks the
+	converted data of every field it can at once, at the end of run().
+	Every converter's bounds are validated when the plan is made: any that
+	aren't numbers are not used, and are alerted to when the plan is bound.
+	"""
+	def __init__(self, converters):
+		self.converters, self.dependencies = order_converters(converters)
+		converters = self.converters
+		self.rejected_bounds = ranges.validate(converters)									#before anything is compiled with them
+		members = {}																		#keys each converter in a family to the list of its family
+		for family in find_families(converters):
+			for converter in family:
+				converter.set_backend("float")												#so that converting one on its own gives what the family gives
+				members[converter] = family
+		order = []																			#converters in the order they are converted, each family together
+		for converter in converters:
+			if converter not in members or timing.CONVERTER_TIMING:
+				order.append(converter)
+			elif converter is members[converter][0]:
+				order.extend(members[converter])
+		self.ranges = ranges.RangeTable([converter for converter in order if table_checks_range(converter)])
+		self.steps = []																		#(converter, raw label, conv label, formula, ops, places, lower, upper, range index), or (converter,) to call safe_process
+		for converter in converters:
+			if converter in members and not timing.CONVERTER_TIMING:						#timed, each member is still in float but runs alone
+				family = members[converter]
+				if converter is family[0]:
+					self.steps.append((VectorFamily(self, family),))
+			else:
+				self.steps.append(self.compile(converter))
+		self.families = [step[0] for step in self.steps if isinstance(step[0], VectorFamily)]
+		self.values = None																	#the reader's list of parsed values that self.slots indexes
+		self.slots = []
+		self.missing_inputs = {}															#keys converters to the inputs the reader or outputter lacks (see check_inputs)
+		self.reused = 0																		#fields passed on unconverted this cycle...
+		self.converted = 0																	#...and converted
+		self.day_reused = 0																	#the same since memo_summary was last reset
+		self.day_converted = 0
+
+	def __iter__(self):
+		return iter(self.converters)
+
+	def groups(self):
+		"""
+		Returns the plan's converters split into groups that depend on nothing
+		outside themselves, each in the order it is run. Converters in
+		different groups can be converted in any order relative to each other,
+		or not at all if their data isn't wanted. Most are alone in theirs.
+		"""
+		group_of = {}
+		groups = []
+		for converter in self.converters:
+			joined = []																		#the groups of its dependencies, each once (groups are lists, so compared by identity)
+			for dependency in self.dependencies[converter]:
+				if not any(group_of[dependency] is other for other in joined):
+					joined.append(group_of[dependency])
+			group = joined[0] if joined else []
+			if not joined:
+				groups.append(group)
+			for other in joined[1:]:
+				group.extend(other)
+				groups = [kept for kept in groups if kept is not other]
+				for member in other:
+					group_of[member] = group
+			group.append(converter)
+			group_of[converter] = group
+		order = dict((converter, i) for i, converter in enumerate(self.converters))
+		for group in groups:
+			group.sort(key=order.get)
+		return groups
+
+	def check_inputs(self, reader, outputter):
+		"""
+		Alerts to any converter whose raw inputs aren't in picdata.conf, or whose
+		converted inputs no converter in the plan gives or aren't in
+		outdata.conf (so that the outputter doesn't keep them). Such a converter
+		is still run, and reports its missing data as it always has.
+		"""
+		producers = set(converter.conv_label for converter in self.converters)
+		self.missing_inputs = {}
+		for converter in self.converters:
+			raw_inputs, converted_inputs = converter.inputs()
+			missing = [label for label in raw_inputs if label not in reader.slots]
+			missing += [label for label in converted_inputs if label not in producers or label not in outputter.columns]
+			if missing:
+				self.missing_inputs[converter] = missing
+		if self.missing_inputs:
+			errors.error("Some fields can't be converted for want of their inputs: " + "; ".join(
+				converter.conv_label + " needs " + ", ".join(self.missing_inputs[converter])
+				for converter in self.converters if converter in self.missing_inputs) +
+				". Check picdata.conf, outdata.conf and the converters in convert.py.")
+
+	def compile(self, converter):
+		"""Returns the step that converts converter."""
+		if not isinstance(converter, dc.SpecConverter) or converter.combiner is not None or timing.CONVERTER_TIMING:	#a combiner's bytes are read by its process()
+			return (converter,)
+		places = converter.dec_places_round
+		if isinstance(places, str):															#"N/A" or "FIX": not rounded, as round() would raise TypeError
+			places = None
+		index = converter.range_index if converter.range_table is self.ranges else None	#None for a field check_range checks as it goes
+		return (converter, converter.raw_label, converter.conv_label, converter.formula,
+			converter.ops, places, converter.lower_bound, converter.upper_bound, index)
+
+	def bind(self, reader):
+		"""Looks up the slot in reader of each step's raw data (see DataReader.compile_slots)."""
+		self.check_inputs(reader, dc.DataConverter.outputter)
+		groups = self.groups()
+		debug("Conversion plan: " + str(len(self.converters)) + " converters in " + str(len(groups)) +
+			" independent groups, the largest of " + str(max([0] + [len(group) for group in groups])) + ".")
+		if self.rejected_bounds:
+			errors.error("Some fields' range bounds are wrong: " + "; ".join(self.rejected_bounds) +
+				". Fix them in DataConverters.py.")
+		self.values = reader.values
+		self.slots = [reader.slots.get(step[1]) if len(step) > 1 else self.input_slots(step[0], reader) for step in self.steps]
+		for family in self.families:
+			family.bind(reader)
+
+	def input_slots(self, converter, reader):
+		"""
+		Returns the slots in reader of a converter's raw inputs and the labels
+		of its converted inputs, by which run_steps memoizes it, or None if it
+		is not to be memoized (see DataConverter.memoize).
+		"""
+		if not MEMOIZE_CONVERSIONS or timing.CONVERTER_TIMING or not isinstance(converter, dc.DataConverter) or not converter.memoize:
+			return None
+		if type(converter).respond.im_func is not dc.DataConverter.respond.im_func:		#respond() may act on every value, not just new ones
+			return None
+		raw_inputs, converted_inputs = converter.inputs()
+		if not all(label in reader.slots for label in raw_inputs):
+			return None
+		return tuple(reader.slots[label] for label in raw_inputs), converted_inputs
+
+	def run(self):
+		"""Converts this cycle's data and passes it to the outputter."""
+		reader = dc.DataConverter.reader
+		if reader.values is not self.values:												#first run, or the reader has been replaced or recompiled
+			self.bind(reader)
+		self.reused = 0
+		self.converted = 0
+		self.run_steps(self.steps, self.slots)
+		self.ranges.check()
+		for family in self.families:
+			self.reused += family.reused
+			self.converted += family.converted
+		self.day_reused += self.reused
+		self.day_converted += self.converted
+		if MEMOIZE_CONVERSIONS:
+			errors.debug("Passed on " + str(self.reused) + " of " + str(self.reused + self.converted) +
+				" fields unconverted, their inputs unchanged (" + self.rate(self.reused, self.converted) + ").")
+
+	def run_steps(self, steps, slots):
+		"""
+		Runs steps, whose raw data is in slots of DataConverter.reader (or, for
+		steps run by safe_process, whose inputs are, as given by input_slots).
+		"""
+		reader = dc.DataConverter.reader
+		receive = dc.DataConverter.outputter.receive
+		raw = reader.raw
+		values = reader.values
+		valid = reader.valid
+		checked = self.ranges.values
+		ERROR_VAL = Config.ERROR_VAL
+		for step, slot in zip(steps, slots):
+			converter = step[0]
+			if len(step) == 1:
+				if slot is None:
+					converter.safe_process()
+					if not isinstance(converter, VectorFamily):										#which counts its own
+						self.converted += 1
+				else:
+					self.run_memoized(converter, slot)
+				continue
+			converter, raw_label, conv_label, formula, ops, places, lower, upper, index = step
+			key = None
+			try:
+				if slot is not None and valid[slot]:
+					key = raw[slot]
+					if MEMOIZE_CONVERSIONS and key == converter.last_inputs:
+						receive(conv_label, converter.last_val)
+						self.reused += 1
+						continue
+					data = values[slot]
+				elif raw_label != "N/A":
+					data = reader.get_value(raw_label)										#raises, and reports, as it would in safe_process
+				else:
+					data = ERROR_VAL
+				data = formula(data)
+				for op, operand in ops:
+					data = op(data, operand)
+				if places is not None and data != ERROR_VAL:
+					try:
+						data = round(data, places)
+					except TypeError:
+						pass
+				if index is not None:
+					if type(data) is not str:
+						checked[index] = data												#range checked at the end of the cycle, with every other field
+				elif not (lower <= data <= upper) or converter.range_error:				#only out of range data or a change of state needs check_range
+					data = converter.check_range(data)
+				if converter.process_error:
+					converter.process_error = False
+					errors.error(conv_label + " process error resolved. Data processed successfully.")
+			except DataMissingError as e:
+				errors.debug(e)
+				data = ERROR_VAL
+			except:
+				if not converter.process_error:
+					errors.error("PROCESS ERROR: " + conv_label + " unable to process received data" +
+						". Probably received or expected wrong data type. Assume error continues until fixed. Error messsage: " +
+						traceback.format_exc(Config.TRACEBACK_LIMIT))
+				converter.process_error = True
+				data = ERROR_VAL
+			receive(conv_label, data)
+			converter.last_val = data
+			converter.last_inputs = key if not (converter.range_error or converter.process_error) else None
+			self.converted += 1
+
+	def run_memoized(self, converter, inputs):
+		"""Runs converter's safe_process, unless its inputs, from input_slots, are unchanged."""
+		raw_slots, converted_labels = inputs
+		reader = dc.DataConverter.reader
+		key = None
+		if all(reader.valid[slot] for slot in raw_slots):
+			raw = reader.raw
+			converted = [dc.DataConverter.outputter.get_converted(label, None) for label in converted_labels]
+			key = tuple(raw[slot] for slot in raw_slots) + tuple((type(data), data) for data in converted)
+			if key == converter.last_inputs:
+				dc.DataConverter.outputter.receive(converter.conv_label, converter.last_val)
+				self.reused += 1
+				return
+		converter.safe_process()
+		if converter.range_error or converter.process_error or converter.status_error:
+			key = None
+		converter.last_inputs = key
+		self.converted += 1
+
+	def rate(self, reused, converted):
+		if not reused + converted:
+			return "none converted"
+		return str(round(100.0*reused/(reused + converted), 1)) + "% reused"
+
+	def memo_summary(self, reset=False):
+		"""Returns a line saying how many fields were passed on unconverted since the last reset."""
+		line = ("Passed on " + str(self.day_reused) + " of " + str(self.day_reused + self.day_converted) +
+			" fields unconverted, their inputs unchanged (" + self.rate(self.day_reused, self.day_converted) + ").")
+		if reset:
+			self.day_reused = 0
+			self.day_converted = 0
+		return line
+
+	def convert_bulk(self, columns):
+		"""
+		Converts many frames' worth of raw data at once, for reprocessing old
+		raw data. columns keys raw labels to sequences of raw values, one per
+		frame, as strings or numbers (such as a column of a raw data backup).
+		Returns a dictionary keying the conv label of every field of a
+		VectorFamily, and of every spec'd field with a ByteCombiner, whose raw
+		data is in columns to a numpy array of its converted values, in float.
+		Missing or unparseable raw data, and data out of range of a field that
+		doesn't report it, give Config.ERROR_VAL. Nothing is alerted. Rounding
+		is by numpy.round, which can differ from round() in the last place for
+		values exactly halfway.
+		"""
+		converted = {}
+		for family in self.families:
+			converted.update(family.convert_bulk(columns))
+		for converter in self.converters:
+			if isinstance(converter, dc.SpecConverter) and converter.combiner is not None and \
+				all(label in columns for label in converter.combiner.labels):
+				converted[converter.conv_label] = convert_combined(converter, columns)
+		return converted
+
+def order_converters(converters):
+	"""
+	Returns converters sorted so that each comes after the converters whose
+	conv labels are among its converted inputs, and otherwise in the order
+	given, and a dictionary keying each converter to those it depends on.
+	Raises ValueError if some converters depend on each other in a cycle.
+	Converted inputs that no converter gives are left to check_inputs.
+	"""
+	producers = {}
+	for converter in converters:
+		producers[converter.conv_label] = converter
+	dependencies = {}
+	dependents = dict((converter, []) for converter in converters)
+	for converter in converters:
+		dependencies[converter] = []
+		for label in converter.inputs()[1]:
+			if label in producers and producers[label] not in dependencies[converter]:
+				dependencies[converter].append(producers[label])
+				dependents[producers[label]].append(converter)
+	position = dict((converter, i) for i, converter in enumerate(converters))
+	waiting = dict((converter, len(dependencies[converter])) for converter in converters)	#dependencies of each not yet placed
+	ready = [position[converter] for converter in converters if not waiting[converter]]
+	heapq.heapify(ready)																	#so that converters are placed in the order given wherever they can be
+	ordered = []
+	while ready:
+		converter = converters[heapq.heappop(ready)]
+		ordered.append(converter)
+		for dependent in dependents[converter]:
+			waiting[dependent] -= 1
+			if not waiting[dependent]:
+				heapq.heappush(ready, position[dependent])
+	if len(ordered) < len(converters):
+		raise ValueError("Converters depend on each other's converted data in a cycle, among: " +
+			", ".join(converter.conv_label for converter in converters if waiting[converter]) + ".")
+	return ordered, dependencies
+
+def table_checks_range(converter):
+	"""
+	Returns True if a RangeTable can range check converter's data in place
+	of its check_range: if that is DataConverter's, and doesn't replace or
+	pass over out of range data.
+	"""
+	return (type(converter).check_range.im_func is dc.DataConverter.check_range.im_func and
+		converter.report_out_of_range_data and not converter.suppress_range_check)
+
+#===========================================================================================================
+#												VECTORFAMILY:
+#===========================================================================================================
+def find_families(converters):
+	"""
+	Returns lists of the converters in converters that can be converted
+	together by a VectorFamily: spec'd converters whose conv labels start
+	with the same entry of VECTOR_FAMILIES and that convert alike but for
+	their operands and bounds. Returns none if numpy is not available.
+	"""
+	if not VECTOR_FAMILIES or numpy is None:
+		return []
+	families = {}
+	order = []
+	for converter in converters:
+		if not isinstance(converter, dc.SpecConverter) or converter.spec["formula"] != "dec" or converter.spec["decoder"] is not None:
+			continue
+		prefixes = [prefix for prefix in VECTOR_FAMILIES if converter.conv_label.startswith(prefix)]
+		bounds = [converter.lower_bound, converter.upper_bound]
+		if not prefixes or converter.raw_label == "N/A" or not all(isinstance(bound, NUMBERS) for bound in bounds):
+			continue
+		places = converter.dec_places_round
+		if not isinstance(places, (int, str)):
+			continue
+		key = (prefixes[0], tuple(op for op, operand in converter.spec["ops"]), places,
+			converter.report_out_of_range_data, converter.suppress_range_check)
+		if key not in families:
+			families[key] = []
+			order.append(key)
+		families[key].append(converter)
+	return [families[key] for key in order if len(families[key]) > 1]
+
+class VectorFamily:
+	"""
+	Converts a family of spec'd converters (see find_families) in float, all
+	at once: their raw data is gathered into a numpy array, each operator is
+	applied to the whole array with an array of the members' operands, and
+	the results are range checked together, by the plan's RangeTable unless
+	it leaves the members to check_range. Each result is rounded with
+	round(), so that it is exactly what the member would give converting on
+	its own in the float backend. Only members that are out of range or
+	whose flags are set need any further attention. Falls back on converting
+	members one by one when any of their raw data is missing or unparseable.
+	Memoized as a whole on the members' raw data (see ConversionPlan).
+	"""
+	def __init__(self, plan, converters):
+		self.plan = plan
+		self.converters = converters
+		self.steps = [plan.compile(converter) for converter in converters]
+		self.labels = [converter.conv_label for converter in converters]
+		self.raw_labels = [converter.raw_label for converter in converters]
+		self.ops = []																		#(operator, array of each member's operand), in order
+		for position in range(len(converters[0].ops)):
+			self.ops.append((converters[0].ops[position][0],
+				numpy.array([converter.ops[position][1] for converter in converters], dtype=float)))
+		self.lower = numpy.array([converter.lower_bound for converter in converters], dtype=float)
+		self.upper = numpy.array([converter.upper_bound for converter in converters], dtype=float)
+		self.places = self.steps[0][5]
+		indexes = [step[8] for step in self.steps]
+		if None not in indexes and indexes == range(indexes[0], indexes[0] + len(indexes)):
+			self.start = indexes[0]															#the members' place in the plan's RangeTable, side by side
+		else:
+			self.start = None
+		self.values = None
+		self.slots = []
+		self.last_inputs = None																#the members' raw data when last converted without error
+		self.reused = 0																		#members passed on unconverted this cycle...
+		self.converted = 0																	#...and converted here rather than by plan.run_steps
+
+	def bind(self, reader):
+		"""Looks up the slot in reader of each member's raw data."""
+		self.slots = [reader.slots.get(raw_label) for raw_label in self.raw_labels]
+		if None in self.slots:																#some member's label isn't in picdata.conf: leave it to get_value to report
+			self.gather = None
+		else:
+			self.gather = operator.itemgetter(*self.slots)
+
+	def safe_process(self):
+		"""Converts every member's data and passes it to the outputter, as their safe_process would."""
+		reader = dc.DataConverter.reader
+		receive = dc.DataConverter.outputter.receive
+		ERROR_VAL = Config.ERROR_VAL
+		self.reused = 0
+		self.converted = 0
+		if self.gather is None or not all(self.gather(reader.valid)):
+			self.last_inputs = None
+			self.plan.run_steps(self.steps, self.slots)
+			return
+		raw = self.gather(reader.raw)
+		if MEMOIZE_CONVERSIONS and raw == self.last_inputs:
+			for converter, label in zip(self.converters, self.labels):
+				receive(label, converter.last_val)
+			self.reused = len(self.converters)
+			return
+		try:
+			data = numpy.array(self.gather(reader.values), dtype=float)
+		except (ValueError, TypeError):
+			self.last_inputs = None
+			self.plan.run_steps(self.steps, self.slots)										#one by one, so that the bad one is reported
+			return
+		for op, operands in self.ops:
+			data = op(data, operands)
+		data = data.tolist()
+		if self.places is not None:
+			data = [round(value, self.places) if value != ERROR_VAL else value for value in data]
+		if self.start is not None:
+			self.plan.ranges.values[self.start:self.start + len(data)] = data
+			in_range = [True]*len(data)
+		else:
+			rounded = numpy.array(data)
+			in_range = ((self.lower <= rounded) & (rounded <= self.upper)).tolist()
+		clean = True
+		for converter, label, value, good, key in zip(self.converters, self.labels, data, in_range, raw):
+			if not good or converter.range_error:
+				value = converter.check_range(value)
+			if converter.process_error:
+				converter.process_error = False
+				errors.error(label + " process error resolved. Data processed successfully.")
+			receive(label, value)
+			converter.last_val = value
+			if converter.range_error:
+				clean = False
+				key = None
+			converter.last_inputs = key														#so that run_steps can reuse it too
+		self.last_inputs = raw if clean else None
+		self.converted = len(self.converters)
+
+	def convert_bulk(self, columns):
+		"""Converts the members whose raw data is in columns. See ConversionPlan.convert_bulk."""
+		members = [i for i in range(len(self.converters)) if self.raw_labels[i] in columns]
+		if not members:
+			return {}
+		ERROR_VAL = Config.ERROR_VAL
+		data = numpy.column_stack([parse_column(columns[self.raw_labels[i]]) for i in members])
+		missing = numpy.isnan(data) | (data == ERROR_VAL)
+		for op, operands in self.ops:
+			data = op(data, operands[members])
+		if self.places is not None:
+			data = numpy.round(data, self.places)
+		out_of_range = ~((self.lower[members] <= data) & (data <= self.upper[members]))
+		converted = {}
+		for column, i in enumerate(members):
+			converter = self.converters[i]
+			values = data[:, column]
+			if not converter.report_out_of_range_data and not converter.suppress_range_check:
+				values[out_of_range[:, column]] = ERROR_VAL
+			values[missing[:, column]] = ERROR_VAL
+			converted[self.labels[i]] = values
+		return converted
+
+def convert_combined(converter, columns):
+	"""
+	Converts a spec'd converter with a ByteCombiner over whole columns of its
+	bytes, which are put together in one pass. See ConversionPlan.convert_bulk.
+	"""
+	ERROR_VAL = Config.ERROR_VAL
+	spec = converter.spec
+	combined, bad = converter.combiner.combine_columns([columns[label] for label in converter.combiner.labels])
+	if spec["decoder"] is None and spec["formula"] == "dec":
+		data = combined.astype(float)
+		for op, operand in spec["ops"]:
+			data = dc.SPEC_OPS[op](data, float(operand))
+	else:																					#a decoder, such as a LookupTable's convert, one value at a time
+		data = []
+		for raw in combined.tolist():
+			try:
+				value = converter.formula(raw)
+				for op, operand in converter.ops:
+					value = op(value, operand)
+				data.append(float(value))
+			except (ValueError, TypeError, ArithmeticError):
+				data.append(float("nan"))
+		data = numpy.array(data)
+	places = converter.dec_places_round
+	if isinstance(places, (int, long)):
+		data = numpy.round(data, places)
+	bounds = [converter.lower_bound, converter.upper_bound]
+	if all(isinstance(bound, NUMBERS) for bound in bounds) and not converter.report_out_of_range_data and \
+		not converter.suppress_range_check:
+		bad |= ~((float(bounds[0]) <= data) & (data <= float(bounds[1])))
+	bad |= numpy.isnan(data)
+	data[bad] = ERROR_VAL
+	return data
+
+def parse_column(column):
+	"""Returns column as a numpy array of floats, with nan for anything that isn't a number."""
+	try:
+		return numpy.asarray(column, dtype=float)
+	except (ValueError, TypeError):
+		parsed = []
+		for value in column:
+			try:
+				parsed.append(float(value))
+			except (ValueError, TypeError):
+				parsed.append(float("nan"))
+		return numpy.array(parsed)
+
+plan = ConversionPlan(all_converters)
+
+
+def build_converters():								#returns a ConversionPlan of a fresh instance of every converter in all_converters, in the
+	return ConversionPlan([type(converter)() for converter in all_converters])	#same order, with flags of its own. used by stations.py to give each station its own set
+
+def process_all(converters=None):					#this function runs a ConversionPlan, by default plan, which converts every field.
+	debug("process_all called; converting data of all data converters...")
+	(converters or plan).run()						#it is called from main.py after data is read. spec'd converters are converted inline and the rest
+													#by safe_process (defined in DataConverters.py), which handles getting raw data from the reader, converting it,
+													#responding to it, sending alerts about it, and finally passing it to the outputter
+
+def convert_bulk(columns, converters=None):		#converts columns of raw data with numpy, by default with plan. see ConversionPlan.convert_bulk
+	return (converters or plan).convert_bulk(columns)
 
-def reset_all_flags():								#resets flags for all converters. called from main.py daily.
+def reset_all_flags(converters=None):				#resets flags for all converters. called from main.py daily.
 	debug("reset_all_flags called; resetting all data converter error flags...")
-	for converter in all_converters:
+	for converter in converters or all_converters:
 		converter.reset_flags()
\ No newline at end of file
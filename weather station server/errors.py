@@ -18,24 +18,40 @@ import smtplib
 import socket
 import signal
 import multiprocessing
+import threading
 
 
+local = threading.local()														#local.prefix is put in front of every message a thread sends, eg "[north] " (set by
+																				#stations.py so that messages from several stations sharing one log and email can be
+																				#told apart). it is kept per thread, as the stations' threads run alongside each other
+
+def set_prefix(prefix):
+	"""Puts prefix in front of every message the calling thread sends from now on."""
+	local.prefix = prefix
+
+def get_prefix():
+	"""Returns the prefix of the calling thread's messages ("" unless set_prefix() was called)."""
+	return getattr(local, "prefix", "")
+
 ##LOGGING HELPER METHODS==============================================================================================
 																				#each of these methods takes a message of the specified urgency level
 def debug(msg):																	#and sends email or logs them depending on the configuration in Config.py
 	"""Logs and emails debugging messages"""
+	msg = get_prefix() + str(msg)
 	log.debug(msg)																#messages of level debug are used for tracking the operation of the program
 	if Config.DEBUG_EMAILS:														#enabling debug generates a detailed, timestamped record of the program's operation
 		queueEmail(msg)
 
 def info(msg):																	#messages of level info are for warnings of mild importance:
 	"""Logs and emails info messages"""											#checks of remaining space, memory use, and so on
+	msg = get_prefix() + str(msg)
 	log.info(msg)
 	if Config.INFO_EMAILS:
 		queueEmail(msg)
 
 def error(msg):																	#messages of level error are warnings of failures to accomplish some functionality
 	"""Logs and emails error messages"""										#if something breaks, error messages will not be resent every cycle
+	msg = get_prefix() + str(msg)
 	log.error(msg)																#an error message will, however, usually be sent when a broken thing unbreaks
 	if Config.ERROR_EMAILS:
 		queueEmail(msg)
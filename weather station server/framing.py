@@ -0,0 +1,119 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds SerialFramer, which turns the bytes read from *
+#* the PIC into complete strings tagged by string ID. Used by *
+#* DataReader in "response" read mode so that late, partial  *
+#* or out-of-order replies are never mistaken for the reply   *
+#* to the request currently being made.                       *
+#**************************************************************
+
+import time
+import string
+
+PRINTABLE = string.printable.replace('\r', '').replace('\n', '').replace('\x0b', '').replace('\x0c', '')
+NOISE = "".join(chr(i) for i in range(256) if chr(i) not in PRINTABLE)						#bytes that are never part of a string: line noise, nulls, stray newlines
+
+#===========================================================================================================
+#												SERIALFRAMER:
+#===========================================================================================================
+class SerialFramer:
+	"""
+	Accumulates bytes from the serial port and splits them into frames at
+	each \\r. A frame is a list of fields, ID first, as the old readline and
+	split('\\t') gave. Complete frames are held by string ID until claimed.
+	"""
+	def __init__(self, expected_strings, max_frame=16384):
+		"""
+		expected_strings keys each known string ID to its number of fields
+		(as DataReader.expected_strings does). Bytes that go max_frame
+		characters without a \\r are thrown away as garbage.
+		"""
+		self.expected_strings = expected_strings
+		self.max_frame = max_frame
+		self.buffer = ""
+		self.frames = {}																	#keys string ID to a list of (arrival time, fields), oldest first
+		self.unknown = []																	#frames whose ID could not be recognized, oldest first
+		self.discarded = 0																	#bytes thrown away while resynchronising
+
+	def feed(self, data):
+		"""Adds data to the buffer and files away every frame it completes."""
+		self.buffer += data
+		now = time.time()
+		while '\r' in self.buffer:
+			end = self.buffer.index('\r')
+			self.add(self.buffer[:end], now)
+			self.buffer = self.buffer[end+1:]
+		if len(self.buffer) > self.max_frame:												#no \r in sight: this isn't a string, so start again
+			self.discarded += len(self.buffer)
+			self.buffer = ""
+
+	def add(self, chunk, now):
+		"""
+		Files chunk (one \\r-terminated piece of the stream, without its \\r)
+		under its string ID. If it doesn't start with a known ID, looks for one
+		further in whose string has exactly the expected number of fields
+		after it, and drops everything before that as garbage.
+		"""
+		cleaned = chunk.translate(None, NOISE)
+		self.discarded += len(chunk) - len(cleaned)
+		if cleaned == "":
+			return
+		fields = cleaned.split('\t')
+		if fields[0] not in self.expected_strings:
+			for start in range(1, len(fields)):
+				stringID = fields[start]
+				if stringID in self.expected_strings and len(fields) - start - 1 == self.expected_strings[stringID]:
+					self.discarded += len('\t'.join(fields[:start])) + 1
+					fields = fields[start:]
+					break
+			else:
+				self.unknown.append((now, fields))
+				return
+		self.frames.setdefault(fields[0], []).append((now, fields))
+
+	def read_from(self, port):
+		"""Feeds whatever is waiting on port without blocking. Returns the number of bytes read."""
+		waiting = port.inWaiting()
+		if waiting:
+			self.feed(port.read(waiting))
+		return waiting
+
+	def take(self, stringID):
+		"""Removes and returns the oldest frame for stringID, or None if there is none."""
+		waiting = self.frames.get(stringID)
+		if not waiting:
+			return None
+		return waiting.pop(0)[1]
+
+	def take_unknown(self):
+		"""Removes and returns all frames whose ID was not recognized."""
+		unknown = [fields for arrived, fields in self.unknown]
+		self.unknown = []
+		return unknown
+
+	def wait_for(self, port, stringID, deadline, interval):
+		"""
+		Reads from port until a frame for stringID is available or
+		time.time() reaches deadline, checking every interval seconds.
+		Returns the frame, or None. Never sleeps past deadline.
+		"""
+		while True:
+			self.read_from(port)
+			frame = self.take(stringID)
+			if frame is not None:
+				return frame
+			remaining = deadline - time.time()
+			if remaining <= 0:
+				return None
+			time.sleep(min(interval, remaining))
+
+	def clear(self):
+		"""
+		Drops every complete frame not yet claimed and returns how many there
+		were. Partial frames are kept, since the rest may still arrive.
+		"""
+		stale = sum(len(waiting) for waiting in self.frames.values()) + len(self.unknown)
+		self.frames = {}
+		self.unknown = []
+		return stale
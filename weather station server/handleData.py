@@ -14,54 +14,108 @@
 
 import errors
 import Config
+from framing import SerialFramer
+from journal import SerialJournal, JournalingPort
+from supervisor import SerialSupervisor
+from outfiles import OutputFiles
+from wal import WriteAheadLog
+from backups import BackupWriter, BACKUP_CHUNK_ROWS
+from archive import ColumnArchive, COLUMN_ARCHIVE_PATH
 
-import serial																				#see https://pythonhosted.org/pyserial/index.html
 import traceback
 import sys
 import time
 import os
+import threading
+import collections
 
 from shutil import copyfile
+from decimal import Decimal
+
+																							#serial read settings. these may be overridden in Config.py:
+READ_MODE = getattr(Config, "READ_MODE", "fixed")											#"fixed" sleeps a set time after each request as the PIC always has,
+																							#"response" returns as soon as the PIC's \r-terminated reply arrives
+STRING_DEADLINE = getattr(Config, "STRING_DEADLINE", 2.0)									#seconds to wait for a reply before giving up on a string (response mode)
+STRING_DEADLINES = getattr(Config, "STRING_DEADLINES", {"1": 9.0})							#per-string overrides. string 1 is measured after QQ, which takes ~7s
+REPLY_POLL_INTERVAL = getattr(Config, "REPLY_POLL_INTERVAL", 0.005)							#seconds between checks of the serial input buffer (response mode)
+FRAME_BUFFER_SIZE = getattr(Config, "FRAME_BUFFER_SIZE", 120)								#frames held for the main loop when acquisition runs on its own thread
+SERIAL_JOURNAL_PATH = getattr(Config, "SERIAL_JOURNAL_PATH", None)						#if set, every byte to and from the PIC is journaled here (see journal.py).
+																							#may hold strftime codes, eg "journal/serial-%Y%m%d.wxj" for a file a day
+
+SINKS = ["2UNIX", "flash", "local"]												#where DataOutputter.save writes each row from its write-ahead log (see wal.py)
+
+FIELD_PARSERS = {																			#the types a field may be given after its label in picdata.conf,
+	"str": None,																			#eg "Temp_1 int". fields with no type are "str", kept as received
+	"int": int,
+	"hex": lambda text: int(text, 16),
+	"dec": Decimal,
+	"float": float}
+VALID = bytearray([1])
+INVALID = bytearray([0])
+
+LEGACY_SCHEDULE = [																			#(string ID, commands, raw data file) in the order the PIC has always been polled.
+	("B", ["SS"], "data"),																	#used for any string whose STR: line in picdata.conf gives no options
+	("1", ["QQ", "11"], "data"),
+	("2", ["22"], "array"),
+	("3", ["33"], "array"),
+	("4", ["44"], "array")]
+LEGACY_RAW_ORDER = ["1", "B", "2", "3", "4"]												#order strings have always been written to the raw data files
 #===========================================================================================================
 #												DATAREADER:
 #===========================================================================================================
 class DataReader:
 	"""Essentially a wrapper for the serial port that allows data to be requested by label."""
 ##CONSTRUCTOR===============================================================================================
-	def __init__(self):
+	def __init__(self, port=None, config=Config, directory=""):
 		"""
 		Constructor for DataReader. Responsible for initializing locations,
 		a dictionary keying (string, index) by field label, from picdata.conf.
 		If this fails, method will raise SystemExit. Also opens serial connection 
-		as configured in Config.py. If connection fails at first, method will 
-		continue attempting indefinitely.
+		as configured in Config.py, or to port if given. If connection fails at 
+		first, method will continue attempting indefinitely. config stands in for
+		Config.py and directory holds picdata.conf and the reader's other files
+		(see stations.py); by default both are those of the one station.
 		"""
+		self.config = config
+		self.directory = directory
 		errors.debug("DataReader initializing...")																					
 		self.locations = {}																	#this code reads picdata.conf and turns it into a dictionary,
 		index = 0																			#keyed by field label holding a tuple of string name and index in string (from 0):
 		current_string = None																#in essence, the dictionary created here asks for the string's label and gives its location.
 																							#it will be used to tell the DataReader where to look for data that is requested
 		self.expected_strings = {}															#expected_strings keys each string expected to its length
+		self.field_types = {}																#keys field label to its type as declared in picdata.conf ("str" if none given)
+		string_order = []																	#string IDs in the order they appear in picdata.conf
+		string_options = {}																	#keys string ID to the options given on its STR: line (see build_schedule)
 		errors.debug("Attempting to parse picdata.")
 		try:																				
-			copyfile('picdata.conf', 'picdata.conf.cache')
-			with open('picdata.conf.cache', 'r') as picdata:								#open the file containing expected format
+			copyfile(self.path('picdata.conf'), self.path('picdata.conf.cache'))
+			with open(self.path('picdata.conf.cache'), 'r') as picdata:								#open the file containing expected format
 				for line in picdata:														#iterate though each line
 					line = line.strip('\n')													#clean the line of return characters
 					if line != '' and line[0] != "#":										#skip empty lines and comments
 						if len(line) >= 4 and line[:4] == "STR:":							#if "STR:" tag is present, register the start of a new string
 							index = 0														#start counting index from zero
-							current_string = line[4:].strip()								#save string as current string
+							words = line[4:].split()										#the ID may be followed by options such as "cmd=22 every=3"
+							current_string = words[0]										#save string as current string
+							string_order.append(current_string)
+							string_options[current_string] = dict(word.split('=', 1) for word in words[1:])
 							errors.debug("Registered string " + current_string)
-						else:																#if "STR:" tag is not present, the line must contain the name of a field
-							if line in self.locations:
+						else:																#if "STR:" tag is not present, the line must contain the name of a field,
+							words = line.split()											#optionally followed by its type (see FIELD_PARSERS)
+							label = words[0]
+							if label in self.locations:
 								errors.info("Warning: picdata.conf contains label " + 
-									line + " multiple times. Only the last instance will be kept.")
+									label + " multiple times. Only the last instance will be kept.")
+							if len(words) > 1 and words[1] not in FIELD_PARSERS:
+								errors.info("Warning: picdata.conf gives label " + label + " unknown type " +
+									words[1] + ". It will be kept as received.")
 							if current_string is None:
 								errors.info("Warning: picdata.conf is improperly formatted, " +
 									"contains label without string header.")
 							else:
-								self.locations[line] = (current_string, index)				#add an entry to the dictionary holding the string it is in and the index in that string
+								self.locations[label] = (current_string, index)				#add an entry to the dictionary holding the string it is in and the index in that string
+								self.field_types[label] = words[1] if len(words) > 1 and words[1] in FIELD_PARSERS else "str"
 								index +=1													#increment the index for next time
 						self.expected_strings[current_string] = index
 			errors.debug("Parsed picdata.conf successfully.")
@@ -79,7 +133,7 @@ class DataReader:
 			errors.sendEmail()
 			errors.debug("Preparing to exit...")
 			sys.exit("Unable to read picdata.conf")
-		except (IndexError, KeyError):														#error in adding entry or slicing string (very unlikely, this is here just in case)
+		except (IndexError, KeyError, ValueError):											#error in adding entry or slicing string, or a malformed option on a STR: line
 			errors.error("FATAL: DataReader unable to parse picdata.conf. " + 
 				"Error is either in parser or in format of picdata.conf. main.py " +
 				"exiting. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
@@ -95,29 +149,22 @@ class DataReader:
 
 
 		
-		self.connectionFailures = 0 
-		while True:																			#try to establish connection to serial port:
-			try:
-				errors.debug("Attempting serial port connection...")
-				self.port = serial.Serial(													#create a Serial object to represent the port
-					port=Config.PORT_NUM, 
-					baudrate=Config.BAUD_RATE, 
-					timeout=Config.PORT_TIMEOUT)
-				if self.connectionFailures > 1:												#alert to success if connection has failed previously
-					errors.sendEmail(message="Serial connection successful, initialization continuing.",
-						subject="TS-4200 Serial Connection Successful")
-				errors.log.error("Serial connection successful.")
-				break																		#exit loop if successful
-			except serial.SerialException:													#at two fails, log and send an email
-				self.connectionFailures += 1
-				if self.connectionFailures==2 or self.connectionFailures%4320 == 0:			#at two fails or every 6 hours, log and send an email
-					errors.sendEmail(message="Failed to connect to serial port. " +
-						"TS-4200 not functional until further notice. " + 
-						"Attempts to connect will continue indefinitely. " +
-						"Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT), 
-						subject="TS-4200 Failed to Connect to Serial Port")
-				errors.debug("Serial connection failed.")
-				time.sleep(5)																#not much point in running the rest of the program without a serial connection, 																					#so try until success																					#initialize various flags to keep track of errors:
+		self.build_schedule(string_order, string_options)
+		self.framer = SerialFramer(self.expected_strings)									#splits bytes from the PIC into strings in "response" read mode
+		self.compile_slots(string_order)
+		self.cycle_count = 0																#number of frames acquired, used to decide which strings are due
+
+		self.pause = time.sleep																#how request() waits for the PIC in "fixed" read mode
+		self.journal = None
+		if hasattr(port, "read"):															#an already open port (such as a journal.ReplayPort) is used as it is
+			self.port = port
+		else:																				#otherwise the supervisor opens the port, and keeps it open, in the background
+			self.port = SerialSupervisor(self.config.PORT_NUM if port is None else port, self.config.BAUD_RATE, self.config.PORT_TIMEOUT)
+			self.port.start()
+		journal_path = getattr(self.config, "SERIAL_JOURNAL_PATH", SERIAL_JOURNAL_PATH)
+		if journal_path is not None and not hasattr(port, "read"):							#journal what passes through the real port
+			self.journal = SerialJournal(journal_path, {"mode": READ_MODE})
+			self.port = JournalingPort(self.port, self.journal)
 		self.consecutiveEmptyStrings = 0													#number of strings consecutively not received from PIC
 		self.totalEmptyStrings = 0															#total number of strings not received since start up or last reset
 		self.PICStringIDErrorState = False													#whether or not there is an outstanding unrecognized string coming from PIC
@@ -125,79 +172,79 @@ class DataReader:
 																							#note that the above two will mask other errors of their sort until the first is fixed
 																							#(i.e., two unrecognized strings are sent repeatedly but only one is reported at first)
 		self.totalBadStrings = 0															#number of received strings since start up or reset for which there was some error
-		self.badFormatErrors = []															#hold every field/string requested by DataConverters that was not found
+		self.badFormatErrors = set()														#hold every field/string requested by DataConverters that was not found
 
 		self.dataStrings = {}																#create empty dictionary to hold data
-		open(Config.COMMAND_FILE_PATH, 'a').close()
+		self.skipped = set()																#IDs of strings not requested in the current frame
+		self.latency = {}																	#keys string ID to [replies, timeouts, total, min, max] reply times in seconds
+		self.counts_lock = threading.Lock()													#guards the counts, flags and latency above, kept by the acquisition thread
+		self.last_frame_time = None															#when a string from the PIC was last accepted
+		self.acquisition_thread = None														#set by start_acquisition()
+		self.prefix = errors.get_prefix()													#the messages of this reader's station, sent from the acquisition thread too
+		open(self.config.COMMAND_FILE_PATH, 'a').close()
 		self.command_error = False
+		self.files = OutputFiles()															#the raw data files and their backups, kept open between frames
 		errors.debug("DataReader initialization completed.")
 
+	def path(self, name):
+		"""Returns the path of the reader's file name (such as picdata.conf)."""
+		return os.path.join(self.directory, name)
+
 ##GET DATA BY LABEL===============================================================================================
 	def get(self, label):
 		"""
 		Given a label, returns that label's stored data as a string. If no
 		such label is found in the given format or if the corresponding data 
 		point is not found in received data, registers an error message.
-		Errors are stored in a list as the name (label, stringID, or ID+index)
-		of the missing location. If a location is already in the list, email 
+		Errors are stored in a set as the name (label or stringID) of the
+		missing location. If a location is already in the set, email 
 		will not be resent. These errors are expected to handle cases of
 		typos in picdata.conf or data converting code, missing strings, and
 		so on. This method does not check type -- calling methods get either
-		the raw data exactly as received (as a string) or Config.ERROR_VAL. 
+		the raw data exactly as received (as a string) or self.config.ERROR_VAL. 
 		Be sure NOT to use this method to request the name of a string (eg, B or T).
+		The common case is a single lookup of the label's slot in self.raw
+		(see compile_slots); only missing data takes the slower paths below.
 		"""
 		try:
-			tup = self.locations[label]														#try to retrieve information about the requested field from self.locations
-		except KeyError:																	#if info retrieval throws error, notify...
+			data = self.raw[self.slots[label]]												#look up the field's slot in this frame's raw data
+		except KeyError:																	#if the label has no slot, notify...
 			if label not in self.badFormatErrors:
 				errors.error("NO RAW DATA ERROR: data for '" + label + "' requested, but no such " + 
 					"label found. Either label not added to picdata.conf or misspelled " + 
 					"somewhere. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT) +
 					"Assume error continues until otherwise notified.")
-				self.badFormatErrors.append(label)											#...and add to list of errors...
-			#errors.debug("get called but data for " + label + " not returned.")
-			raise DataMissingError(label)													#...and return None, so calling method knows there is no data 
-		else:
-			try:
-				self.badFormatErrors.remove(label)											#if that succeeds, try to remove label from the list of missing data...
-				errors.debug("get called on " + label + " successful, removing error flag.")#this little error sub-system is too subtle for comments -- see documentation
-			except:
-				pass																		#...but don't worry if it wasn't there in the first place
-
-		try:																				#using the information from self.locations, 
-			stringID = tup[0]
-			index = tup[1]
-			data = self.dataStrings[stringID][index]										#try to find data for the requested label
-			try:																			#if that succeeds, remove location from list of missing 
-				self.badFormatErrors.remove(stringID+str(index))
-				errors.debug("get called on " + stringID + str(index)+ " successfully, removing error flag.")
-			except:
-				pass
-			try:																			#if that succeeds, remove stringID from list of missing
-				self.badFormatErrors.remove(stringID)
-				errors.debug("get called on member of string " + stringID + " successfully, removing error flag.")
-			except:
-				pass
-		except KeyError:																	#handle errors. these will only be called if there is a missing string or
-			if stringID not in self.badFormatErrors:										#some other corruption of data betweed the calling of read() and get()
+				self.badFormatErrors.add(label)												#...and add to set of errors...
+			raise DataMissingError(label)													#...and raise, so calling method knows there is no data 
+		if data is None:																	#the field's string was not received (or not requested) this frame
+			stringID = self.locations[label][0]
+			if stringID in self.skipped:													#(strings not requested this cycle are expected to be missing)
+				raise DataMissingError(label)
+			if stringID not in self.badFormatErrors:										#store() normally reports the string first; this catches anything else
 				errors.error("String '" + stringID + "' not found among received data: mismatch " +
-				"between picdata.conf and requested data, probably. Error message: " + 
-				traceback.format_exc(Config.TRACEBACK_LIMIT) + " Assume error continues until " + 
-				"otherwise notified.")
-				self.badFormatErrors.append(stringID)
-			errors.debug("get called but data for " + label + " not returned.")
-			raise DataMissingError(label)	
-		except IndexError:																	#this particular case should hardly ever be reached, but is here for completeness.
-			if stringID+str(index) not in self.badFormatErrors:
-				errors.error("Data field " + stringID +  str(index) + " not found among received data: " +
-				"mismatch between picdata.conf and requested data. Error message: " + 
-				traceback.format_exc(Config.TRACEBACK_LIMIT) + " Assume error continues until " + 
+				"between picdata.conf and requested data, probably. Assume error continues until " + 
 				"otherwise notified.")
-				self.badFormatErrors.append(stringID + str(index))
+				self.badFormatErrors.add(stringID)
 			errors.debug("get called but data for " + label + " not returned.")
-			raise DataMissingError(label)		
+			raise DataMissingError(label)
 		return data 																		#return data as a string. methods calling get() will be responsible for type-checking.
 
+	def get_value(self, label):
+		"""
+		Like get(), but returns the field parsed to the type picdata.conf declares
+		for it (see FIELD_PARSERS) -- an int, Decimal or float, or the string as
+		received if no type is declared. Raises DataMissingError as get() does if
+		there is no data, and BadRawDataError if the field did not parse.
+		"""
+		try:
+			slot = self.slots[label]
+			if self.valid[slot]:
+				return self.values[slot]													#the common case: parsed once already by store()
+		except KeyError:
+			pass
+		data = self.get(label)																#raises, and reports, if the data is missing
+		raise BadRawDataError(label, data, self.field_types[label])
+
 ##HELPER METHODS===============================================================================================
 	def numStrings(self):
 		"""Returns the number of PIC strings in the current format."""
@@ -206,257 +253,478 @@ class DataReader:
 	def numBadStrings(self, reset=False):
 		"""Returns the number of bad (empty or misformatted strings) received since 
 		last reset or start up. Also resets counters and flags if reset is True."""
-		val = self.totalBadStrings															#store value to return
-		if reset:																			#if specified, reset all flags and counters
-			self.totalBadStrings = 0
-			self.totalEmptyStrings = 0
-			self.consecutiveEmptyStrings = 0
-			self.PICStringIDErrorState = False
-			self.PICFormatErrorState = False	
-			self.badFormatErrors = []
-			self.command_error = False
+		with self.counts_lock:
+			val = self.totalBadStrings														#store value to return
+			if reset:																		#if specified, reset all flags and counters
+				self.totalBadStrings = 0
+				self.totalEmptyStrings = 0
+				self.consecutiveEmptyStrings = 0
+				self.PICStringIDErrorState = False
+				self.PICFormatErrorState = False
+				self.badFormatErrors = set()
+				self.command_error = False
 		return val
 
+	def compile_slots(self, string_order):
+		"""
+		Lays every string's fields end to end, in picdata.conf order, in one
+		flat list, self.raw, which store() refills each frame. self.slots keys
+		each label to its offset in that list and self.string_slots keys each
+		string ID to (offset of its first field, number of fields).
+		"""
+		self.string_slots = {}
+		offset = 0
+		for stringID in string_order:
+			self.string_slots[stringID] = (offset, self.expected_strings[stringID])
+			offset += self.expected_strings[stringID]
+		self.slots = {}
+		for label in self.locations:
+			stringID, index = self.locations[label]
+			self.slots[label] = self.string_slots[stringID][0] + index
+		self.raw = [None]*offset															#no data until the first frame is stored
+		self.values = [None]*offset															#the same slots parsed to each field's declared type (see store())
+		self.valid = bytearray(offset)														#1 where the slot in self.values holds a good value, 0 where missing or unparseable
+		self.typed_slots = [(self.slots[label], FIELD_PARSERS[self.field_types[label]])			#the slots store() has to parse; "str" fields are used as received
+			for label in self.slots if FIELD_PARSERS[self.field_types[label]] is not None]
+		self.typed_slots.sort()
+		errors.debug("Compiled " + str(len(self.slots)) + " labels into " + str(offset) + " raw data slots, " +
+			str(len(self.typed_slots)) + " of them typed.")
+
+	def parse_slots(self):
+		"""
+		Refills self.values and self.valid from self.raw. Each typed field is
+		parsed once here, so converters that ask for it with get_value() all
+		get the same number without parsing the string again.
+		"""
+		raw = self.raw
+		values = self.values
+		valid = self.valid
+		values[:] = raw																		#untyped fields are used as received
+		for stringID in self.string_slots:
+			start, length = self.string_slots[stringID]
+			if length:
+				valid[start:start+length] = (VALID if raw[start] is not None else INVALID) * length
+		for slot, parser in self.typed_slots:
+			if valid[slot]:
+				try:
+					values[slot] = parser(raw[slot])
+				except (ValueError, ArithmeticError):										#(decimal.InvalidOperation is an ArithmeticError)
+					values[slot] = None
+					valid[slot] = 0
+
+	def build_schedule(self, string_order, string_options):
+		"""
+		Builds self.schedule, the list of strings to request from the PIC in the
+		order they are requested, from the options on picdata.conf's STR: lines:
+			STR:<ID> cmd=<cmd>[,<cmd>...] every=<cycles> raw=<data|array|none> deadline=<seconds>
+		cmd gives the commands sent to get the string (default: the ID twice,
+		e.g. 22 for string 2), every how many cycles it is requested (default 1),
+		raw which raw data file its fields are written to (default array), and
+		deadline how long to wait for it in response read mode. If no STR: line
+		has options, the sequence the PIC has always used is kept (see
+		LEGACY_SCHEDULE), including the order of the raw data files.
+		"""
+		if any(string_options.values()):
+			poll_order = string_order
+			self.raw_order = string_order
+		else:
+			errors.debug("No options on STR: lines of picdata.conf, using legacy poll schedule.")
+			legacy = [stringID for stringID, cmds, raw in LEGACY_SCHEDULE if stringID in self.expected_strings]
+			extra = [stringID for stringID in string_order if stringID not in legacy]
+			poll_order = legacy + extra
+			self.raw_order = [stringID for stringID in LEGACY_RAW_ORDER if stringID in self.expected_strings] + extra
+		defaults = dict((stringID, (cmds, raw)) for stringID, cmds, raw in LEGACY_SCHEDULE)
+		self.schedule = []
+		self.raw_files = {}
+		for stringID in poll_order:
+			options = string_options[stringID]
+			cmds, raw = defaults.get(stringID, ([stringID*2], "array"))
+			entry = {
+				"id": stringID,
+				"cmds": options["cmd"].split(',') if "cmd" in options else cmds,
+				"every": max(1, int(options.get("every", 1))),
+				"deadline": float(options.get("deadline", STRING_DEADLINES.get(stringID, STRING_DEADLINE)))}
+			self.raw_files[stringID] = options.get("raw", raw)
+			self.schedule.append(entry)
+			errors.debug("String " + stringID + " requested with " + ",".join(entry["cmds"]) + " every " +
+				str(entry["every"]) + " cycles.")
+
 	def send(self, cmd):
 		"""Sends string cmd to PIC via serial connection."""								#flush input so that input doesn't build up in serial port -- 
 		self.port.write(cmd)														#we want only data sent in response to S
 		errors.debug("Sent " + cmd + " to PIC.")
 
+	def request(self, cmds, stringID, deadline=None):
+		"""
+		Sends each command in cmds to the PIC and returns its reply for string
+		stringID as a list of tab-separated fields, ID first. In "fixed" read mode
+		this sleeps as long as the PIC has always needed; in "response" mode it
+		returns as soon as self.framer has a complete string with ID stringID
+		or its deadline passes. Strings with other IDs that arrive meanwhile
+		are kept by the framer for the request they answer. An
+		unanswered request returns [''], as an empty readline would. deadline
+		is in seconds and defaults to the string's entry in STRING_DEADLINES.
+		"""
+		if READ_MODE != "response":
+			for cmd in cmds:
+				self.port.write(cmd)
+			if len(cmds) > 1:																#a leading command (QQ) asks the PIC to take a measurement first
+				self.pause(7)
+			reply = self.port.readline(size=None, eol='\r')
+			self.pause(1.1)
+			return reply.split('\t')
+
+		replies = {}
+		for wait_until in self.request_steps(cmds, stringID, deadline, replies):
+			time.sleep(max(0, min(REPLY_POLL_INTERVAL, wait_until - time.time())))
+		return replies[stringID]
+
+	def request_steps(self, cmds, stringID, deadline, replies):
+		"""
+		Generator form of request() in "response" mode. Sends cmds, then each
+		time it is resumed checks the port for the reply to stringID. Until the
+		reply arrives or the deadline passes, yields the time at which it gives
+		up, so the caller can wait on the port (or on other ports) meanwhile.
+		Finally stores the reply, or [''], in replies[stringID].
+		"""
+		start = time.time()
+		for cmd in cmds:
+			self.port.write(cmd)
+		if deadline is None:
+			deadline = STRING_DEADLINES.get(stringID, STRING_DEADLINE)
+		while True:
+			self.framer.read_from(self.port)
+			reply = self.framer.take(stringID)
+			if reply is not None or time.time() >= start + deadline:
+				break
+			yield start + deadline
+		elapsed = time.time() - start
+		with self.counts_lock:
+			stats = self.latency.setdefault(stringID, [0, 0, 0.0, None, 0.0])
+			if reply is None:
+				stats[1] += 1
+			else:
+				stats[0] += 1
+				stats[2] += elapsed
+				if stats[3] is None or elapsed < stats[3]:
+					stats[3] = elapsed
+				stats[4] = max(stats[4], elapsed)
+		if reply is None:
+			errors.debug("No reply for string " + stringID + " after " + str(elapsed) + " seconds.")
+			reply = ['']
+		replies[stringID] = reply
+
+	def seconds_since_frame(self):
+		"""Returns seconds since a string from the PIC was last accepted, or None if none ever has been."""
+		if self.last_frame_time is None:
+			return None
+		return time.time() - self.last_frame_time
+
+	def connection_status(self):
+		"""Returns a line describing the serial connection and when data last arrived."""
+		since = self.seconds_since_frame()
+		line = "Last good string " + ("never received." if since is None else str(int(since)) + " seconds ago.")
+		if hasattr(self.port, "status"):
+			line = self.port.status() + " " + line
+		return line
+
+	def latency_summary(self, reset=False):
+		"""Returns a line per string giving reply counts and times since last reset."""
+		with self.counts_lock:
+			latency = self.latency
+			if reset:
+				self.latency = {}
+		lines = []
+		for stringID in sorted(latency):
+			replies, timeouts, total, fastest, slowest = latency[stringID]
+			if replies:
+				lines.append("String " + stringID + ": " + str(replies) + " replies, " + str(timeouts) +
+					" timeouts, mean " + str(round(total/replies, 3)) + "s, min " + str(round(fastest, 3)) +
+					"s, max " + str(round(slowest, 3)) + "s.")
+			else:
+				lines.append("String " + stringID + ": no replies, " + str(timeouts) + " timeouts.")
+		return "\n".join(lines)
+
 
 	def build_file_for_dash(self):															#overwrites the file for dash with raw data.
 		errors.debug("Data reader building file of raw data for dash board...")
-		with open('picdata.conf.cache', 'r') as picdata:									#dataoutputter will pick this file up and append converted data to it
-			with open('data_for_dash', 'w') as fordash:
+		with open(self.path('picdata.conf.cache'), 'r') as picdata:									#dataoutputter will pick this file up and append converted data to it
+			with open(self.path('data_for_dash'), 'w') as fordash:
 				fordash.write(str(time.time()) + '\n')
 				for line in picdata:
 					line= line.strip()
 					if line == "" or line[0] == "#":
 						pass
 					elif len(line) > 4 and line[:4] == "STR:":
-						fordash.write("RAW\t" + line[4:].strip() + '\n')
+						fordash.write("RAW\t" + line[4:].split()[0] + '\n')
 					else:
+						label = line.split()[0]
 						try:
-							raw = self.get(line)
+							raw = self.get(label)
 						except DataMissingError:
 							raw = "not received"
-						fordash.write(line + '\t' + raw + '\n')
+						fordash.write(label + '\t' + raw + '\n')
 						#print line + '\t' + raw + '\n'
 		errors.debug("Done building raw data file for dash.")
 
 
 ##READ DATA FROM SERIAL PORT====================================================================================
 	def read(self, header, header_1, toggle):
+		"""
+		Reads one frame of strings from the PIC and stores it (see acquire()
+		and store()). Used when acquisition is not running on its own thread.
+		"""
+		self.store(self.acquire(), header, header_1, toggle)
+
+	def acquire(self):
 		"""
 		Reads strings of raw data from serial port and checks them for
-		errors before saving them in a dictionary. The strings that make
+		errors. Returns a frame: a dictionary holding the time the frame was
+		requested, the replies as received (split into fields), and the
+		strings that passed the checks keyed by ID. The strings that make
 		it through this method are guaranteed to have the right ID and 
 		length, but any given piece of data could conceivably be missing ("").
 		Checking that data exist is the job of get().
 		"""
+		frame = []
+		for wait_until in self.acquire_steps(frame):
+			time.sleep(max(0, min(REPLY_POLL_INTERVAL, wait_until - time.time())))
+		return frame[0]
+
+	def acquire_steps(self, result):
+		"""
+		Generator form of acquire(): yields, in "response" mode, whenever it is
+		waiting for the PIC (see request_steps()), and finally appends the frame
+		to the list result. Lets one thread acquire from several PICs at once.
+		"""
+		frame_time = time.time()
+		replies = {}
+		errors.debug("acquire() called, getting data...")
+		strings = {}
+		due = [entry["id"] for entry in self.schedule if self.cycle_count % entry["every"] == 0]
+		if self.journal is not None:
+			self.journal.mark_cycle(self.cycle_count)
+		self.cycle_count += 1
+		print str(len(due)) + " strings due from read() in DataReader"					#ENTER LOOP
+		if READ_MODE == "response":															#anything still waiting belongs to earlier frames
+			self.framer.read_from(self.port)
+			stale = self.framer.clear()
+			if stale:
+				errors.debug("Discarded " + str(stale) + " strings left over from earlier requests.")
+		if getattr(self.port, "connected", True):
+			for entry in self.schedule:														#request every string that is due this cycle
+				if entry["id"] not in due:
+					continue
+				if READ_MODE == "response":
+					for wait_until in self.request_steps(entry["cmds"], entry["id"], entry["deadline"], replies):
+						yield wait_until
+				else:
+					replies[entry["id"]] = self.request(entry["cmds"], entry["id"], entry["deadline"])
+		else:																				#no port: the frame holds only missing strings
+			errors.debug("Serial port disconnected, not requesting strings.")
+			for stringID in due:
+				replies[stringID] = ['']
+		received = [(stringID, replies[stringID]) for stringID in due]
+		if READ_MODE == "response":
+			self.framer.read_from(self.port)
+			for i in range(len(received)):													#pick up replies that arrived after their request timed out
+				stringID, string = received[i]
+				if string == ['']:
+					late = self.framer.take(stringID)
+					if late is not None:
+						errors.debug("Received late reply for string " + stringID + ".")
+						replies[stringID] = late
+						received[i] = (stringID, late)
+			received += [(None, string) for string in self.framer.take_unknown()]			#unrecognized strings are checked (and reported) below
+		with self.counts_lock:																#the daily checks read and reset the counts and flags kept here
+			for requestedID, string in received:
+				badstring = 1																
+				if string == "" or string == ['']:												#if data read is empty (nothing before the read timed out)...
+					self.totalEmptyStrings += 1													#increment the relevant counters, and
+					self.consecutiveEmptyStrings +=1
+					errors.debug("Received empty string from PIC.")
+					with open(self.path("pic_status"), 'w') as pic_status:
+						pic_status.write("0")
+					if self.consecutiveEmptyStrings == self.config.MISSED_CONSECUTIVE_STRING_WARNING:#send a warning if necessary
+						downtime = int((self.consecutiveEmptyStrings/3)/self.numStrings())
+						errors.error("PIC has been unresponsive for " + str(downtime) + " minutes.")
+					self.totalBadStrings += badstring
+					continue																	#an empty string has no ID to check
+				else:																			#if string is not empty...
+					with open(self.path("pic_status"), 'w') as pic_status:
+						pic_status.write("1")
+					if self.consecutiveEmptyStrings > self.config.MISSED_CONSECUTIVE_STRING_WARNING:	#send a notification that PIC is responsive, if necessary
+						errors.error("Received string from PIC after " + 
+							str(self.consecutiveEmptyStrings) + " consecutive missed strings.")
+					self.consecutiveEmptyStrings = 0											#reset consecutiveEmptyStrings counter												#make the string into a list to better manipulate it
+				stringID = string[0]														#save the ID (the first item in the list)
+				string = string[1:]															#BUILD DATA STRING and check for missing data:												#put each datum into a list														
+				print "self.expected_strings", self.expected_strings						#remove the ID from the string
+				if stringID not in self.expected_strings:									#if the ID is not recognized...
+					if not self.PICStringIDErrorState:										#notify as appropriate
+						errors.error("Received unexpected string from PIC starting with " + stringID + 
+							". Assume error continues until intervention. Data will be lost " +
+							"if strings of the expected format are not received.")
+					else: 
+						errors.debug("Received bad string from PIC starting with " + stringID + ".")
+					self.PICStringIDErrorState = True										#and raise error flag
+				else:																		#if ID is recognized...
+					errors.debug("String of ID " + stringID + " found.")
+					expectedLength = self.expected_strings[stringID]
+					if len(string) != expectedLength:										#check if it is the expected length
+						if not self.PICFormatErrorState:									#if not, notify as appropriate
+							errors.info("Received bad string from PIC: " + str(len(string)) + 
+								" fields instead of " + str(expectedLength) + " fields in string " + stringID +
+								". Assume error continues until intervention. Data will be lost " +
+								"if strings of the expected format are not received. Any strings not " + 
+								"conforming to expected format can not be processed.")
+						else:
+							errors.debug("Received bad string from PIC: " + str(len(string)) + 
+								" fields instead of " + str(expectedLength) + " fields.")
+						self.PICFormatErrorState = True										#and raise error flag
+					else:																	#if it is the expected length, then accept it
+						errors.debug("String accepted.")
+						strings[stringID] = string 											#add it to dictionary of data
+						self.last_frame_time = frame_time
+						badstring = 0														#mark it as a good string
+
+				self.totalBadStrings += badstring
+		result.append({"time": frame_time, "due": due, "replies": replies, "strings": strings})
+
+	def store(self, frame, header, header_1, toggle):
+		"""
+		Makes frame (see acquire()) the data returned by get() and appends
+		its raw replies to the raw data files and their backups.
+		"""
 		raw_data_list = header
 		raw_array_data_list = header_1
-		string_list = []
-		self.dataStrings = {}																#clearing data
-		errors.debug("read() called, getting data...")
-		strings = []			
-		print str(self.numStrings()) + " from read() in DataReader"						#ENTER LOOP
-		self.port.write("SS")
-		string_B = self.port.readline(size=None, eol='\r')
-		time.sleep(1.1)
-		string_B = 	string_B.split('\t')
-		string_list.append(string_B)
-		self.port.write("QQ")
-		self.port.write("11")
-		time.sleep(7)
-		string_1 = self.port.readline(size=None, eol='\r')
-		time.sleep(1.1)
-		string_1 = 	string_1.split('\t')
-		string_list.append(string_1)
-		self.port.write("22")
-		string_2 = self.port.readline(size=None, eol='\r')
-		time.sleep(1.1)
-		string_2 = 	string_2.split('\t')
-		string_list.append(string_2)
-		self.port.write("33")
-		string_3 = self.port.readline(size=None, eol='\r')
-		time.sleep(1.1)
-		string_3 = 	string_3.split('\t')
-		string_list.append(string_3)
-		self.port.write("44")
-		string_4 = self.port.readline(size=None, eol='\r')
-		time.sleep(1.1)
-		string_4 = 	string_4.split('\t')
-		string_list.append(string_4)
-		for i in range (len(string_list)):
-			string = string_list[i]
-			badstring = 1																
-			if string == "":																#if data read is empty...
-				self.totalEmptyStrings += 1													#increment the relevant counters, and
-				self.consecutiveEmptyStrings +=1
-				errors.debug("Received empty string from PIC.")
-				with open("pic_status", 'w') as pic_status:
-					pic_status.write("0")
-				if self.consecutiveEmptyStrings == Config.MISSED_CONSECUTIVE_STRING_WARNING:#send a warning if necessary
-					downtime = int((self.consecutiveEmptyStrings/3)/self.numStrings())
-					errors.error("PIC has been unresponsive for " + str(downtime) + " minutes.")
-			else:																			#if string is not empty...
-				with open("pic_status", 'w') as pic_status:
-					pic_status.write("1")
-				if self.consecutiveEmptyStrings > Config.MISSED_CONSECUTIVE_STRING_WARNING:	#send a notification that PIC is responsive, if necessary
-					errors.error("Received string from PIC after " + 
-						str(self.consecutiveEmptyStrings) + " consecutive missed strings.")
-				self.consecutiveEmptyStrings = 0											#reset consecutiveEmptyStrings counter												#make the string into a list to better manipulate it
-			stringID = string[0]														#save the ID (the first item in the list)
-			string = string[1:]															#BUILD DATA STRING and check for missing data:												#put each datum into a list														
-			print "self.expected_strings", self.expected_strings						#remove the ID from the string
-			if stringID not in self.expected_strings:									#if the ID is not recognized...
-				if not self.PICStringIDErrorState:										#notify as appropriate
-					errors.error("Received unexpected string from PIC starting with " + stringID + 
-						". Assume error continues until intervention. Data will be lost " +
-						"if strings of the expected format are not received.")
-				else: 
-					errors.debug("Received bad string from PIC starting with " + stringID + ".")
-				self.PICStringIDErrorState = True										#and raise error flag
-			else:																		#if ID is recognized...
-				errors.debug("String of ID " + stringID + " found.")
-				expectedLength = self.expected_strings[stringID]
-				if len(string) != expectedLength:										#check if it is the expected length
-					if not self.PICFormatErrorState:									#if not, notify as appropriate
-						errors.info("Received bad string from PIC: " + str(len(string)) + 
-							" fields instead of " + str(expectedLength) + " fields in string " + stringID +
-							". Assume error continues until intervention. Data will be lost " +
-							"if strings of the expected format are not received. Any strings not " + 
-							"conforming to expected format can not be processed.")
-					else:
-						errors.debug("Received bad string from PIC: " + str(len(string)) + 
-							" fields instead of " + str(expectedLength) + " fields.")
-					self.PICFormatErrorState = True										#and raise error flag
-				else:																	#if it is the expected length, then accept it
-					errors.debug("String accepted.")
-					self.dataStrings[stringID] = string 								#add it to dictionary of data
-					badstring = 0														#mark it as a good string
-
-			self.totalBadStrings += badstring
-		string_B = string_B[1:]
-		string_1 = string_1[1:]
-		string_2 = string_2[1:]
-		string_3 = string_3[1:]
-		string_4 = string_4[1:]
-		len_string_1 = len(string_1)
-		len_string_B = len(string_B)
-		len_string_2 = len(string_2)
-		len_string_3 = len(string_3)
-		len_string_4 = len(string_4)
-		exp_len_string_1 = self.expected_strings['1']
-		exp_len_string_B = self.expected_strings['B']
-		exp_len_string_2 = self.expected_strings['2']
-		exp_len_string_3 = self.expected_strings['3']
-		exp_len_string_4 = self.expected_strings['4']
-		if (len_string_1 == 0):
-			for i in range (exp_len_string_1):
-				string_1.append(str(Config.ERROR_VAL))
-		if (len_string_B == 0):
-			for i in range (exp_len_string_B):
-				string_B.append(str(Config.ERROR_VAL))
-		if (len_string_2 == 0):
-			for i in range (exp_len_string_2):
-				string_2.append(str(Config.ERROR_VAL))
-		if (len_string_3 == 0):
-			for i in range (exp_len_string_3):
-				string_3.append(str(Config.ERROR_VAL))
-		if (len_string_4 == 0):
-			for i in range (exp_len_string_4):
-				string_4.append(str(Config.ERROR_VAL))
-		for item in string_1:
-			raw_data_list.append(item.strip())	
-		for item in string_B:
-			raw_data_list.append(item.strip())	
-		for item in string_2:
-			raw_array_data_list.append(item.strip())	
-		for item in string_3:
-			raw_array_data_list.append(item.strip())	
-		for item in string_4:
-			raw_array_data_list.append(item.strip())												#add to counter if string was not good																					#and repeat
+		self.dataStrings = frame["strings"]
+		self.skipped = set(self.expected_strings) - set(frame["due"])
+		raw = self.raw																		#copy each accepted string into its slots; the rest are missing (None)
+		for stringID in self.string_slots:
+			start, length = self.string_slots[stringID]
+			string = self.dataStrings.get(stringID)
+			raw[start:start+length] = string if string is not None else [None]*length
+		self.parse_slots()
+		for stringID in self.raw_order:													#BUILD RAW DATA STRINGS, in the order given by picdata.conf
+			reply = frame["replies"].get(stringID, [''])[1:]								#strings not due this cycle are written as missing
+			if len(reply) == 0:
+				reply = [str(self.config.ERROR_VAL)] * self.expected_strings[stringID]
+			if self.raw_files[stringID] == "data":
+				raw_list = raw_data_list
+			elif self.raw_files[stringID] == "array":
+				raw_list = raw_array_data_list
+			else:
+				continue
+			for item in reply:
+				raw_list.append(item.strip())
 		raw_data_string = "\t".join(raw_data_list) + '\n'
 		raw_array_data_string = "\t".join(raw_array_data_list) + '\n'
-		if (not os.path.exists(Config.CUR_BACKUP_PATH)):
-			os.makedirs(Config.CUR_BACKUP_PATH)
-		if os.path.ismount(Config.FLASH_BACKUP_DIREC_PATH):
+		if (not os.path.exists(self.config.CUR_BACKUP_PATH)):
+			os.makedirs(self.config.CUR_BACKUP_PATH)
+		if os.path.ismount(self.config.FLASH_BACKUP_DIREC_PATH):
 			try:
 				errors.debug("Attempting to write rawdata backup")
-				with open(Config.RAW_DATA_BACKUP_PATH, 'a') as raw_data_backup:							#actually write data to file
-					raw_data_backup.write(raw_data_string)
+				self.files.get(self.config.RAW_DATA_BACKUP_PATH).write(raw_data_string)					#actually write data to file
 				errors.debug("...write successful.")
 				self.to_unix_error = False
 			except:
 				errors.debug("Copy failed.")
-			raw_data_backup.close()
 			try:
 				errors.debug("Attempting to write raw array data backup")
-				with open(Config.RAW_ARRAY_DATA_BACKUP_PATH, 'a') as raw_array_data_backup:							#actually write data to file
-					raw_array_data_backup.write(raw_array_data_string)
-				errors.debug("...write successful.")
-				self.to_unix_error = False
-			except:
-				errors.debug("Copy failed.")
-		raw_array_data_backup.close()
-		if (toggle == 1):													
-			try:
-				errors.debug("Attempting to write rawdata")
-				with open(Config.RAW_DATA_FILE_PATH, 'w') as raw_data:							#actually write data to file
-					raw_data.write(raw_data_string)
+				self.files.get(self.config.RAW_ARRAY_DATA_BACKUP_PATH).write(raw_array_data_string)		#actually write data to file
 				errors.debug("...write successful.")
 				self.to_unix_error = False
 			except:
 				errors.debug("Copy failed.")
-			raw_data.close()
-			try:
-				errors.debug("Attempting to write raw array data")
-				with open(Config.RAW_ARRAY_DATA_FILE_PATH, 'w') as raw_array_data:							#actually write data to file
-					raw_array_data.write(raw_array_data_string)
-				errors.debug("...write successful.")
-				self.to_unix_error = False
-			except:
-				errors.debug("Copy failed.")
-			raw_array_data.close()
-		if (toggle == 0):													
+		else:
+			self.files.close_under(self.config.FLASH_BACKUP_DIREC_PATH)						#so that they are opened afresh once it is mounted again
+		if toggle in (0, 1):																#afresh if the toggle is 1, appending if 0
 			try:
 				errors.debug("Attempting to write rawdata")
-				with open(Config.RAW_DATA_FILE_PATH, 'a') as raw_data:							#actually write data to file
-					raw_data.write(raw_data_string)
+				self.files.get(self.config.RAW_DATA_FILE_PATH).write(raw_data_string, toggle == 1)		#actually write data to file
 				errors.debug("...write successful.")
 				self.to_unix_error = False
 			except:
 				errors.debug("Copy failed.")
-			raw_data.close()
 			try:
 				errors.debug("Attempting to write raw array data")
-				with open(Config.RAW_ARRAY_DATA_FILE_PATH, 'a') as raw_array_data:							#actually write data to file
-					raw_array_data.write(raw_array_data_string)
+				self.files.get(self.config.RAW_ARRAY_DATA_FILE_PATH).write(raw_array_data_string, toggle == 1)	#actually write data to file
 				errors.debug("...write successful.")
 				self.to_unix_error = False
 			except:
 				errors.debug("Copy failed.")
-			raw_array_data.close()																				#EXIT LOOP																																					
-		for stringID in self.expected_strings:												#check that each expected string was received
+		for stringID in frame["due"]:														#check that each string requested was received
 			if stringID not in self.dataStrings:											#if a string wasn't read,
 				if stringID not in self.badFormatErrors:									#and isn't already broken,
 					errors.error("Did not receive full string " + stringID + " from PIC. " +#send an alert
 						"Assume error continues until otherwise notified. No data from " + 
 						stringID + " available.")
-					self.badFormatErrors.append(stringID)									#and add it to the list of broken strings
+					self.badFormatErrors.add(stringID)										#and add it to the set of broken strings
 				else:
 					errors.debug("Did not find string " + stringID + " again.")
 			else:																			#if a string was read, make sure it isn't in the list of broken strings
-				try:
+				if stringID in self.badFormatErrors:
 					self.badFormatErrors.remove(stringID)									#alert that it is working again
 					errors.error("Received previously missing string " + stringID + 
 						". Assume problem solved until notified otherwise.")
-				except:
-					pass
 		errors.debug("Done reading and storing data.")
 
 
+##BACKGROUND ACQUISITION======================================================================================
+	def start_acquisition(self, period, capacity=FRAME_BUFFER_SIZE):
+		"""
+		Starts a thread that calls acquire() every period seconds and pushes
+		each frame into self.frames, a FrameBuffer holding at most capacity
+		frames. Commands for the PIC are sent from that thread too, so the
+		main loop must not use the port once this has been called.
+		"""
+		self.frames = FrameBuffer(capacity)
+		self.acquiring = True
+		self.wake = threading.Event()														#cuts the thread's wait short when it is stopped
+		self.acquisition_error = False
+		self.acquisition_thread = threading.Thread(target=self.acquire_forever, args=(period,))
+		self.acquisition_thread.daemon = True												#don't keep python alive once the main loop exits
+		self.acquisition_thread.start()
+		errors.debug("Acquisition thread started, one frame every " + str(period) + " seconds.")
+
+	def acquire_forever(self, period):
+		"""Body of the acquisition thread. Keeps to period regardless of how long the main loop takes."""
+		errors.set_prefix(self.prefix)
+		next_start = time.time()
+		while self.acquiring:
+			try:
+				self.frames.push(self.acquire())
+				self.send_commands()
+				if self.acquisition_error:
+					self.acquisition_error = False
+					errors.error("Acquisition thread reading from PIC again.")
+			except:																			#never let the thread die: the main loop would wait forever
+				if not self.acquisition_error:
+					errors.error("Error in acquisition thread. Assume error continues until " +
+						"otherwise notified. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+				self.acquisition_error = True
+			next_start += period
+			time_to_sleep = next_start - time.time()
+			if time_to_sleep > 0:
+				self.wake.wait(time_to_sleep)
+			else:																			#if a read overran the period, start the next one now
+				next_start = time.time()
+
+	def stop_acquisition(self):
+		"""
+		Asks the acquisition thread to stop after its current frame and waits for
+		it. Frames it acquired are left in self.frames. Returns False if it was
+		never started.
+		"""
+		if self.acquisition_thread is None:
+			return False
+		self.acquiring = False
+		self.wake.set()
+		self.acquisition_thread.join()
+		self.acquisition_thread = None
+		return True
+
 ##SEND COMMANDS TO PIC======================================================================================
 	def send_commands(self):
 		"""
@@ -465,8 +733,11 @@ class DataReader:
 		one command per line.
 		"""
 		errors.debug("Preparing to send commands to PIC.")
+		if not getattr(self.port, "connected", True):										#leave the commands in the file until they can be sent
+			errors.debug("Serial port disconnected, commands not sent.")
+			return
 		try:
-			with open(Config.COMMAND_FILE_PATH, 'r') as command_file:
+			with open(self.config.COMMAND_FILE_PATH, 'r') as command_file:
 				for line in command_file:
 					command = line.split('\t')
 					errors.debug(str(command))
@@ -482,7 +753,7 @@ class DataReader:
 				errors.error("Error in reading and sending commands. Error message: " + 
 					traceback.format_exc(Config.TRACEBACK_LIMIT))
 		else:
-			open(Config.COMMAND_FILE_PATH, 'w').close()
+			open(self.config.COMMAND_FILE_PATH, 'w').close()
 
 ##TESTING===================================================================================================
 
@@ -493,26 +764,91 @@ class DataMissingError(Exception):
 	def __str__(self):
 		return repr(self.value)
 
+class BadRawDataError(Exception):
+	def __init__(self, label, data, field_type):
+		self.value = "Raw data " + repr(data) + " for " + label + " is not a valid " + field_type + "."
+	def __str__(self):
+		return repr(self.value)
+
 class NoSuchLabelError(Exception):
 	def __init__(self, label):
 		self.value = "DataReader does not have record of any label " + label + "."
 	def __str__(self):
 		return repr(self.value)
 
+#===========================================================================================================
+#												FRAMEBUFFER:
+#===========================================================================================================
+class FrameBuffer:
+	"""
+	Fixed-capacity ring buffer of frames passed from the acquisition thread
+	to the main loop. When full, the oldest frame is dropped and counted so
+	that sampling never waits on the main loop.
+	"""
+	def __init__(self, capacity):
+		self.capacity = capacity
+		self.frames = collections.deque()
+		self.condition = threading.Condition()
+		self.pushed = 0																		#frames received since start up
+		self.dropped = 0																	#frames dropped since start up or last reset
+		self.overflow_error = False
+
+	def push(self, frame):
+		"""Adds frame to the buffer, dropping the oldest frame if it is full."""
+		with self.condition:
+			if len(self.frames) >= self.capacity:
+				self.frames.popleft()
+				self.dropped += 1
+				if not self.overflow_error:
+					errors.error("Frame buffer full: main loop is more than " + str(self.capacity) +
+						" frames behind acquisition, oldest frames are being dropped. " +
+						"Assume error continues until the daily checks.")
+					self.overflow_error = True
+			self.frames.append(frame)
+			self.pushed += 1
+			self.condition.notify()
+
+	def pop(self, timeout):
+		"""Removes and returns the oldest frame, or None if none arrives within timeout seconds."""
+		deadline = time.time() + timeout
+		with self.condition:
+			while not self.frames:
+				remaining = deadline - time.time()
+				if remaining <= 0:
+					return None
+				self.condition.wait(remaining)
+			return self.frames.popleft()
+
+	def __len__(self):
+		with self.condition:
+			return len(self.frames)
+
+	def numDropped(self, reset=False):
+		"""Returns the number of frames dropped since last reset. Also resets the count and flag if reset is True."""
+		with self.condition:
+			val = self.dropped
+			if reset:
+				self.dropped = 0
+				self.overflow_error = False
+			return val
+
 #===========================================================================================================
 #												DATAOUTPUTTER:
 #===========================================================================================================
 class DataOutputter:
 	"""Handles outputting data."""
 ##CONSTRUCTOR===============================================================================================
-	def __init__(self):
+	def __init__(self, config=Config, directory=""):
 		"""Parses outdata.conf into a list, makes a document holding
-		format of data to dashboard, and initializes error flags."""
+		format of data to dashboard, and initializes error flags.
+		config and directory are as for DataReader."""
+		self.config = config
+		self.directory = directory
 		self.format = []																	#this list holds labels of outgoing data in order
 		try:
-			open("dashformat.txt", 'w').close()												#clear dashformat.txt
-			with open("dashformat.txt", 'a') as dashformat:									#open dashformat.txt
-				with open("outdata.conf", 'r') as outdata:									#open outdata.conf
+			open(self.path("dashformat.txt"), 'w').close()												#clear dashformat.txt
+			with open(self.path("dashformat.txt"), 'a') as dashformat:									#open dashformat.txt
+				with open(self.path("outdata.conf"), 'r') as outdata:									#open outdata.conf
 					for line in outdata:													#iterate through each line
 						if line == '\n' or line[0] == "#":									#ignore empty lines or lines that start with '#'
 							pass
@@ -538,16 +874,55 @@ class DataOutputter:
 			errors.debug("Preparing to exit...")
 			sys.exit("Unable to parse outdata.conf")
 
-		self.data = {}																		#a dictionary keying label to converted data
+		self.compile_columns()
 		self.unrecognized_labels = []														#initialize error flags/lists:
-		self.missing_data = []
+		self.missing_columns = 0															#bit i set once the label of column i has been alerted to as missing
 		self.to_unix_error = False
-		self.temp_backup_error = False
-		self.flash_file_error = False
-		self.flash_drive_error = False
+		self.log_error = False
+		self.backup_queue_error = False
 		self.for_dash_error = False
-		open("temp_unix_backup", 'w').close()												#initialize backup file
+		self.files = OutputFiles()															#the files data is saved to, kept open between cycles
+		sinks = SINKS + (["archive"] if COLUMN_ARCHIVE_PATH else [])
+		self.log = WriteAheadLog(self.files.get(self.path("write_ahead_log")), sinks)		#every row goes here first, then to each sink (see save)
+		self.unix_fresh = False																#set when the toggle asks for 2UNIX to be started afresh, until it is
+		local_backlog = False
+		if os.path.exists(self.config.LOCAL_BACKUP_FILE_PATH) and os.path.getsize(self.config.LOCAL_BACKUP_FILE_PATH):
+			local_backlog = True
+			if not self.log.existed:														#left by a version without the log: the flash drive still needs it
+				with open(self.config.LOCAL_BACKUP_FILE_PATH, 'r') as local:
+					self.log.adopt(local.readlines(), "flash")
+		self.backups = BackupWriter(self.config, self.log.checkpoints["flash"], self.log.checkpoints["local"], local_backlog)
+		self.handed = self.log.checkpoints["flash"]										#number of the last row handed to the backup writer
+		self.backups_caught_up = time.time()												#when the flash backup last had every row
+		self.archive = None
+		self.archive_error = False
+		if COLUMN_ARCHIVE_PATH:																#each field once, in the order of outdata.conf
+			labels = [label for column, label in enumerate(self.format) if self.columns[label] == column]
+			self.archive = ColumnArchive(self.path(COLUMN_ARCHIVE_PATH), labels, [self.columns[label] for label in labels],
+				len(self.format), self.log.checkpoints["archive"])
+
 
+	def path(self, name):
+		"""Returns the path of the outputter's file name (such as outdata.conf)."""
+		return os.path.join(self.directory, name)
+
+	def compile_columns(self):
+		"""
+		Numbers the fields of outdata.conf by their column in a line of output.
+		self.columns keys each label to its column and self.row holds this
+		cycle's converted data by column, with self.received 1 for each column
+		received since the last save. A label listed twice takes its data from
+		its first column (see self.repeats).
+		"""
+		self.columns = {}
+		self.repeats = []																	#(column, first column of the same label) for labels listed more than once
+		for column, label in enumerate(self.format):
+			if label in self.columns:
+				self.repeats.append((column, self.columns[label]))
+			else:
+				self.columns[label] = column
+		self.row = [None]*len(self.format)
+		self.received = bytearray(len(self.format))
 
 ##RECEIVE CONVERTED DATA====================================================================================
 	def receive(self, label, data):
@@ -556,8 +931,10 @@ class DataOutputter:
 		DataConverters once they have finished converting data.
 		Outputter will store the data and ultimately format/save it.
 		"""
-		if label in self.format:															#if label is recognized, save its data
-			self.data[label] = data
+		column = self.columns.get(label)
+		if column is not None:																#if label is recognized, save its data
+			self.row[column] = data
+			self.received[column] = 1
 			if label == "rain_drip_code":
 				print "Received rain_drip_code"
 		elif label not in self.unrecognized_labels:											#if not, and label not already registered as unrecognized, send an error and add it
@@ -569,9 +946,18 @@ class DataOutputter:
 			self.unrecognized_labels.append(label)
 
 ##GET CONVERTED DATA========================================================================================
-	def get_converted(self, label):
-		"""Recover converted data from outputter. Used for second-level conversions."""
-		return self.data[label]
+	def get_converted(self, label, *default):
+		"""
+		Recover converted data from outputter. Used for second-level conversions.
+		Raises KeyError for data not received this cycle, unless given a default
+		to return instead.
+		"""
+		column = self.columns.get(label)
+		if column is not None and self.received[column]:
+			return self.row[column]
+		if default:
+			return default[0]
+		raise KeyError(label)
 
 ##SAVE DATA TO FILES========================================================================================
 	def save(self, header, toggle):
@@ -580,185 +966,182 @@ class DataOutputter:
 		appropriate configuration of files. Clears all data so outputter
 		is available to receive a new batch.
 		"""
-		data_list = header													#BUILD DATA STRING and check for missing data:
-		for label in self.format:														#for each expected piece of data
-			try:
-				data = str(self.data[label])												#request it from self.data
-			except KeyError:																#if it is not found, send an alert
-				if label not in self.missing_data:											#note that this alert applies only to data not sent at all -- data noted as missing earlier will
-					errors.error("DataOutputter missing data for label " + label + 			#have been replaced by an error value and so will not throw this error.
-						". Probable cause: no data converter passes data to outputter." +	#this error should just catch coding mistakes (such as a piece of expected data not being passed to
-						" Problem will continue until fixed.")								#the outputter for whatever reason)
-					self.missing_data.append(label)
-				data = str(Config.ERROR_VAL)												#...and replace it with the error value
-			data_list.append(data)															#put each datum into a list
+		row = self.row													#BUILD DATA STRING and check for missing data:
+		received = self.received
+		for column, first in self.repeats:
+			row[column] = row[first]
+			received[column] = received[first]
+		column = received.find('\x00')													#only columns not received need looking at
+		while column != -1:																#if one is not found, send an alert
+			label = self.format[column]
+			if not self.missing_columns >> self.columns[label] & 1:							#note that this alert applies only to data not sent at all -- data noted as missing earlier will
+				errors.error("DataOutputter missing data for label " + label + 				#have been replaced by an error value and so will not throw this error.
+					". Probable cause: no data converter passes data to outputter." +		#this error should just catch coding mistakes (such as a piece of expected data not being passed to
+					" Problem will continue until fixed.")									#the outputter for whatever reason)
+				self.missing_columns |= 1 << self.columns[label]
+			row[column] = self.config.ERROR_VAL												#...and replace it with the error value
+			column = received.find('\x00', column + 1)
+		data_list = header
+		data_list.extend(map(str, row))													#put each datum into the list, in one pass
 		data_string = "\t".join(data_list) + '\n'											#turn the list into a string
-		self.data = {}
-		if (not os.path.exists(Config.CUR_BACKUP_PATH)):
-			os.makedirs(Config.CUR_BACKUP_PATH)																			#clear data
+		self.received = bytearray(len(row))
+		if (not os.path.exists(self.config.CUR_BACKUP_PATH)):
+			os.makedirs(self.config.CUR_BACKUP_PATH)																			#clear data
 		
+		try:																				#WRITE AHEAD: every row goes in the log before any file, so that
+			self.log.append(data_string)													#a file that can't be written to is given it once it can
+			self.log_error = False
+		except (IOError, OSError):
+			self.alert_log_error()
+
 		try:
 			errors.debug("Attempting to write oneline")
-			with open(Config.ONE_LINE_FILE_PATH, 'w') as one_line:							#actually write data to file
-				one_line.write(data_string)
+			self.files.get(self.config.ONE_LINE_FILE_PATH).write(data_string, fresh=True)	#only ever the latest row, never given again from the log
 			errors.debug("...write successful.")
-			self.to_unix_error = False
 		except:
-			errors.debug("Copy failed.")
-		if (toggle == 1):																		#WRITE TO 2UNIX:
-			try:																				#this try block copies over backed up data to 2UNIX in case of interference or failure
-				errors.debug("Copying temp_backup over to 2UNIX...")							#this is a plan C, very unlikely to be needed.
-				with open("temp_unix_backup", 'r') as backup:									
-					missing_data = backup.read()
-				with open(Config.TO_UNIX_FILE_PATH, 'w') as to_unix:
-					to_unix.write(missing_data)
-				open("temp_unix_backup", "w").close()
-			except:
-				errors.debug("Copy failed.")
+			errors.debug("Write to oneline failed.")
 
+		if toggle == 1:																		#WRITE TO 2UNIX: afresh once the toggle is 1, appending otherwise
+			self.unix_fresh = True
+		if toggle in (0, 1):
 			try:
 				errors.debug("Attempting to write to 2UNIX...")
-				with open(Config.TO_UNIX_FILE_PATH, 'w') as to_unix:							#actually write data to file
-					to_unix.write(data_string)
-				errors.debug("...write successful.")
+				rows = self.apply("2UNIX", self.config.TO_UNIX_FILE_PATH, self.unix_fresh)	#with any rows held back since it last failed
+				if rows:
+					self.unix_fresh = False
+				errors.debug("...wrote " + str(len(rows)) + " rows.")
 				self.to_unix_error = False
-			except IOError:
-				time.sleep(.1)																	#if it fails, wait and try again
-				errors.debug("...write failed, trying again.")
-				try:
-					with open(Config.TO_UNIX_FILE_PATH, 'w') as to_unix:						#try to write again
-						to_unix.write(data_string)
-						errors.debug("Second write successful.")
-						self.to_unix_error = False
-				except IOError:																	#if that fails, put data in a backup
-					errors.debug("Second write failed.")
-					if not self.to_unix_error:
-						errors.error("Unable to write to file for database. Storing unsent data in a temporary backup.")
-						self.to_unix_error = True
-					try:
-						with open("temp_unix_backup", 'w') as backup:
-							backup.write(data_string)
-						errors.debug("Wrote data to backup.")
-						self.temp_backup_error = False
-					except:																		#if the backup fails, not much more that can be done
-						if not self.temp_backup_error:
-							errors.error("Write to temporary backup failed. Data will not be written to 2UNIX.")
-							self.temp_backup_error = True
-					else:
-						errors.debug("Write to 2UNIX failed again.")
-		if (toggle == 0):																		#WRITE TO 2UNIX:
-			try:																				#this try block copies over backed up data to 2UNIX in case of interference or failure
-				errors.debug("Copying temp_backup over to 2UNIX...")							#this is a plan C, very unlikely to be needed.
-				with open("temp_unix_backup", 'r') as backup:									
-					missing_data = backup.read()
-				with open(Config.TO_UNIX_FILE_PATH, 'a') as to_unix:
-					to_unix.write(missing_data)
-				open("temp_unix_backup", "w").close()
-			except:
-				errors.debug("Copy failed.")
+			except (IOError, OSError):
+				if not self.to_unix_error:
+					errors.error("Unable to write to file for database. Unsent data is kept in the write-ahead log " +
+						"and will be written to 2UNIX once it can be.")
+					self.to_unix_error = True
 
+		self.hand_backups()																	#BACKUP DATA ON FLASH DRIVE, or locally while it is unmounted
+
+		if self.archive is not None:														#ADD TO COLUMN ARCHIVE, written every so many rows
 			try:
-				errors.debug("Attempting to write to 2UNIX...")
-				with open(Config.TO_UNIX_FILE_PATH, 'a') as to_unix:							#actually write data to file
-					to_unix.write(data_string)
-				errors.debug("...write successful.")
-				self.to_unix_error = False
-			except IOError:
-				time.sleep(.1)																	#if it fails, wait and try again
-				errors.debug("...write failed, trying again.")
-				try:
-					with open(Config.TO_UNIX_FILE_PATH, 'a') as to_unix:						#try to write again
-						to_unix.write(data_string)
-						errors.debug("Second write successful.")
-						self.to_unix_error = False
-				except IOError:																	#if that fails, put data in a backup
-					errors.debug("Second write failed.")
-					if not self.to_unix_error:
-						errors.error("Unable to write to file for database. Storing unsent data in a temporary backup.")
-						self.to_unix_error = True
-					try:
-						with open("temp_unix_backup", 'a') as backup:
-							backup.write(data_string)
-						errors.debug("Wrote data to backup.")
-						self.temp_backup_error = False
-					except:																		#if the backup fails, not much more that can be done
-						if not self.temp_backup_error:
-							errors.error("Write to temporary backup failed. Data will not be written to 2UNIX.")
-							self.temp_backup_error = True
-					else:
-						errors.debug("Write to 2UNIX failed again.")
+				skipped = self.archive.add(self.log.after(self.archive.added), len(data_list))
+				if skipped:
+					errors.error("Left " + str(skipped) + " rows out of the column archive: they don't fit its " +
+						"columns (saved before outdata.conf was changed?). They are still in 2UNIX and the backups.")
+				self.archive_error = False
+			except (IOError, OSError):
+				self.alert_archive_error()
+			self.log.checkpoint("archive", self.archive.synced)
+
+		try:
+			self.log.commit()																#record how far each sink has got
+		except (IOError, OSError):
+			self.alert_log_error()
 
+		self.data_list = data_list
+
+	def apply(self, sink, path, fresh=False):
+		"""
+		Writes the rows of the write-ahead log after the last written to path
+		(replacing what it holds with fresh), and moves sink's checkpoint up to
+		the last row synced to disk there. Returns the rows written. Raises
+		IOError or OSError, leaving them to be written next cycle.
+		"""
+		out = self.files.get(path)
+		rows = self.log.after(self.log.checkpoints[sink] if out.mark is None else out.mark)
+		if rows:
+			out.write("".join(row for seq, row in rows), fresh, mark=rows[-1][0])
+		self.checkpoint_synced(sink, path)
+		return rows
 
-																						#COPY FROM LOCAL TO FLASH DRIVE BACKUP (in case of flash drive coming back online)
-		if os.path.ismount(Config.FLASH_BACKUP_DIREC_PATH) and not self.flash_file_error:	#checking whether drive is mounted so that code does not save to local file at same path						
+	def checkpoint_synced(self, sink, path):
+		"""Moves sink's checkpoint up to the last row synced to disk in path, as its syncing policy says (see outfiles.py)."""
+		synced = self.files.get(path).synced_mark
+		if synced is not None:
+			self.log.checkpoint(sink, synced)
+
+	def hand_backups(self):
+		"""
+		Hands the backup writer the rows after the last it was handed, at most
+		BACKUP_CHUNK_ROWS of them, then checkpoints what it has written. Once it has written everything handed to it,
+		starts again from what the flash drive (or, while it is unmounted, the
+		local backup) has, so that rows it dropped or missed are handed again.
+		"""
+		if self.backups.idle():
+			flash_done, local_done, mounted = self.backups.progress()
+			self.handed = flash_done if mounted else max(flash_done, local_done)
+		rows = self.log.after(self.handed, BACKUP_CHUNK_ROWS)
+		if rows:
+			if self.backups.hand(rows):
+				self.handed = rows[-1][0]
+				self.backup_queue_error = False
+			elif not self.backup_queue_error:
+				errors.error("Backup writer has fallen behind (flash drive slow or stuck?): its queue is full. Rows " +
+					"are kept in the write-ahead log until it catches up. " + self.backup_status())
+				self.backup_queue_error = True
+		self.checkpoint_backups()
+		errors.debug(self.backup_status())
+
+	def checkpoint_backups(self):
+		"""Moves the flash and local checkpoints up to what the backup writer has synced to disk."""
+		flash_synced, local_synced = self.backups.synced()
+		self.log.checkpoint("flash", flash_synced)
+		self.log.checkpoint("local", max(flash_synced, local_synced))						#the local backup only takes what the flash drive can't
+		if self.backups.progress()[0] >= self.log.seq:
+			self.backups_caught_up = time.time()
+
+	def backup_status(self):
+		"""Returns a line giving the backup writer's queue depth and how far the flash backup is behind."""
+		flash_done, local_done, mounted = self.backups.progress()
+		return ("Backup queue: " + str(self.backups.depth()) + " of " + str(self.backups.capacity) + " chunks. Flash backup " +
+			str(self.log.seq - flash_done) + " rows behind, last caught up " + str(int(time.time() - self.backups_caught_up)) +
+			" seconds ago" + ("." if mounted else " (flash drive unmounted)."))
+
+	def close(self):
+		"""Stops the backup writer and syncs and closes the files kept open between cycles."""
+		self.backups.stop()
+		self.checkpoint_backups()
+		self.files.close()																	#syncs 2UNIX, so that its checkpoint takes in every row written
+		self.checkpoint_synced("2UNIX", self.config.TO_UNIX_FILE_PATH)
+		if self.archive is not None:
 			try:
-				errors.debug("Copying local backup to flash.")								#try copying local backup to flash drive. if no data in local backup, just append nothing
-				with open(Config.LOCAL_BACKUP_FILE_PATH, 'r') as local:						#open and read data from local backup
-					forFlash = local.read()
-				with open(Config.TO_UNIX_BACKUP_PATH, 'a') as flash:			#append data to flash backup
-					flash.write(forFlash)
-				open(Config.LOCAL_BACKUP_FILE_PATH, 'w').close()							#clear local backup if successful
-				self.flash_file_error = False
-			except:
-				if not self.flash_file_error:
-					errors.info("Copy from local to flash failed, but flash drive mounted. " + 
-					 "Beware discontinuity in data starting around current time. " +
-					 "Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
-				os.system("sudo umount /dev/sda1")											#unmount flash drive 
-				self.flash_file_error = True
-		else:
-			errors.debug("Flash unmounted, copy from local to flash not attempted.")
-
-																						#BACKUP DATA ON FLASH DRIVE
-		if os.path.ismount(Config.FLASH_BACKUP_DIREC_PATH):									#if flash drive is mounted:
-			try:																			#try writing data to backup on flash drive
-				with open(Config.TO_UNIX_BACKUP_PATH, 'a') as flash:			#open file and write data
-					flash.write(data_string)
-					if self.flash_drive_error:												#if it didn't work last time, alert that it is working
-						errors.error("Write to flash drive successful -- flash backup online.")
-						self.flash_drive_error = False
-					else:
-						errors.debug("Data written to flash drive successfully.")
-			except:																			#if failure, alert as appropriate and write data to local backup instead
-				if not self.flash_drive_error:
-					errors.error("Flash drive mounted, but unable to write to flash backup. " +
-						"Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
-				self.flash_drive_error = True
-		else:
-			if not self.flash_drive_error:
-				errors.error("Flash drive unmounted. TS-4200 unable to write to backup file on flash drive. " +
-				"Data diverted to local filesystem backup until notified otherwise.")
-			else:
-				errors.debug("Flash drive still unmounted, diverting data to local backup.")
-			self.flash_drive_error = True
+				self.archive.close()
+			except (IOError, OSError):
+				self.alert_archive_error()
+			self.log.checkpoint("archive", self.archive.synced)
+		try:
+			self.log.commit()
+		except (IOError, OSError):
+			self.alert_log_error()
+		self.log.file.close()
 
-																						#IF FLASH DRIVE UNMOUNTED, WRITE TEMPORARILY TO LOCAL BACKUP
-			try:	
-				with open(Config.LOCAL_BACKUP_FILE_PATH, 'a') as local:						#open and write data to local backup
-					local.write(data_string)
-			except:
-				errors.error("BACKING UP FAILED: unable to write to either flash " + 
-					"or local backup. Error message: " + 
-					traceback.format_exc(Config.TRACEBACK_LIMIT))
+	def alert_archive_error(self):
+		if not self.archive_error:
+			errors.error("Unable to write to column archive. Rows are kept in the write-ahead log until it can be. " +
+				"Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+			self.archive_error = True
+
+	def alert_log_error(self):
+		if not self.log_error:
+			errors.error("Unable to write to the write-ahead log. Data is still being saved, but rows that can't " +
+				"be written now may be lost. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+			self.log_error = True
 
-		self.data_list = data_list
 ##DAILY RESET===============================================================================================
 	def reset(self):
 		"""Resets error flags and lists so notifications will be resent."""
 		self.unrecognized_labels = []
-		self.missing_data = []
+		self.missing_columns = 0
 		self.to_unix_error = False
-		self.temp_backup_error = False
-		self.flash_file_error = False
-		self.flash_drive_error = False
+		self.log_error = False
+		self.backup_queue_error = False
+		self.archive_error = False
+		self.backups.reset()
 
 ##BUILD FILE FOR DASH=======================================================================================
 	def build_file_for_dash(self):
 		index = 1																		#WRITE DATA FOR	DASHBOARD:
 		errors.debug("Building converted data file for dash.")
 		try:																			#this file will be read using pysftp by the dashboard application whenever it loads
-			with open("data_for_dash", 'a') as fordash:									#open format file and data file
-				with open("dashformat.txt", 'r') as dashformat:
+			with open(self.path("data_for_dash"), 'a') as fordash:									#open format file and data file
+				with open(self.path("dashformat.txt"), 'r') as dashformat:
 					for line in dashformat:												#for each line in format file
 						if line[:4] == "STR:":											#if the line is a string tag, copy it over	
 							fordash.write("CVT\t" + line[4:].strip() + '\n')
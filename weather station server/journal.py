@@ -0,0 +1,406 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds SerialJournal, which records every byte sent  *
+#* to and received from the PIC in a compact binary file, and *
+#* JournalingPort, which wraps the serial port to feed it.    *
+#* Also holds ReplayPort and replay(), which play a journal   *
+#* back through DataReader, the DataConverters and            *
+#* DataOutputter as fast as they will go, so that an incident *
+#* in the field can be reproduced and profiled offline (see   *
+#* main.py --replay), and compare_backends(), which converts  *
+#* a journal in both numeric backends to see which fields     *
+#* could use float (see main.py --compare-backends).          *
+#**************************************************************
+
+import errors
+import Config
+
+import os
+import struct
+import time
+import traceback
+import ctypes
+import ctypes.util
+
+MAGIC = "WXJ1"																				#first four bytes of every journal file
+RECORD = struct.Struct("<cddI")																#each record: kind, monotonic time, wall time, length of the data that follows
+WRITE = "W"																					#bytes written to the PIC
+READ = "R"																					#bytes read from the PIC
+FLUSHED = "F"																				#bytes the PIC sent that were thrown away unread (flushInput)
+CYCLE = "C"																					#start of a frame; data is the cycle number
+HEADER = "H"																				#written each time a file is opened; data is "key=value" pairs, such as the read mode
+
+##MONOTONIC CLOCK=================================================================================================
+class _timespec(ctypes.Structure):
+	_fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+try:																						#python 2 has no time.monotonic, so ask the kernel directly.
+	_clock_gettime = ctypes.CDLL(ctypes.util.find_library("rt") or None, use_errno=True).clock_gettime
+	_clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(_timespec)]
+	_CLOCK_MONOTONIC = 1
+	def monotonic():
+		"""Returns seconds since an arbitrary point, unaffected by changes to the clock."""
+		t = _timespec()
+		_clock_gettime(_CLOCK_MONOTONIC, ctypes.byref(t))
+		return t.tv_sec + t.tv_nsec*1e-9
+except (OSError, AttributeError):															#fall back on times(), which counts in clock ticks (usually 10ms)
+	def monotonic():
+		"""Returns seconds since an arbitrary point, unaffected by changes to the clock."""
+		return os.times()[4]
+
+#===========================================================================================================
+#												SERIALJOURNAL:
+#===========================================================================================================
+class SerialJournal:
+	"""Appends timestamped records of serial traffic to a binary journal file."""
+	def __init__(self, path, header=None):
+		"""
+		path is the journal file to append to. It may hold time.strftime codes
+		(eg "journal/serial-%Y%m%d.wxj"), in which case a new file is started
+		whenever the name changes, checked at the start of each cycle. header
+		is a dictionary written at the start of each file (see HEADER).
+		Records are buffered and flushed at the start of each cycle, so a crash
+		loses at most the cycle in progress.
+		"""
+		self.path_pattern = path
+		self.header = header or {}
+		self.path = None
+		self.file = None
+		self.write_error = False
+		self.open()
+
+	def open(self):
+		"""Opens the file named by the current time, if it isn't already open."""
+		path = time.strftime(self.path_pattern)
+		if path == self.path:
+			return
+		self.close()
+		self.path = path
+		try:
+			new = not os.path.exists(path) or os.path.getsize(path) == 0
+			self.file = open(path, 'ab')
+			if new:
+				self.file.write(MAGIC)
+			self.record(HEADER, " ".join(key + "=" + str(self.header[key]) for key in sorted(self.header)))
+			errors.debug("Journaling serial traffic to " + path)
+		except:
+			self.failed()
+
+	def record(self, kind, data):
+		"""Appends a record of kind (see WRITE, READ, ...) holding data."""
+		if self.file is None:
+			return
+		try:
+			self.file.write(RECORD.pack(kind, monotonic(), time.time(), len(data)) + data)
+		except:
+			self.failed()
+
+	def mark_cycle(self, cycle):
+		"""Records the start of cycle number cycle and flushes what came before it."""
+		self.open()
+		self.record(CYCLE, str(cycle))
+		try:
+			if self.file is not None:
+				self.file.flush()
+				if self.write_error:
+					self.write_error = False
+					errors.error("Writing serial journal " + self.path + " again.")
+		except:
+			self.failed()
+
+	def failed(self):
+		"""Reports a failed write, once, and stops journaling until the next file is opened."""
+		if not self.write_error:
+			errors.error("Unable to write serial journal " + str(self.path) + ". Serial traffic " +
+				"will not be journaled until otherwise notified. Error message: " +
+				traceback.format_exc(Config.TRACEBACK_LIMIT))
+		self.write_error = True
+		self.file = None
+		self.path = None																	#so that open() tries again next cycle
+
+	def close(self):
+		if self.file is not None:
+			try:
+				self.file.close()
+			except:
+				pass
+			self.file = None
+
+def read_journal(path):
+	"""
+	Generates (kind, monotonic time, wall time, data) for each record in the
+	journal at path, in the order written. A record cut short at the end of
+	the file (the station stopped mid-write) is ignored.
+	"""
+	with open(path, 'rb') as journal:
+		if journal.read(len(MAGIC)) != MAGIC:
+			raise ValueError(path + " is not a serial journal.")
+		while True:
+			head = journal.read(RECORD.size)
+			if len(head) < RECORD.size:
+				return
+			kind, mono, wall, length = RECORD.unpack(head)
+			data = journal.read(length)
+			if len(data) < length:
+				return
+			yield kind, mono, wall, data
+
+#===========================================================================================================
+#												JOURNALINGPORT:
+#===========================================================================================================
+class JournalingPort:
+	"""Stands in for a serial.Serial, recording everything that passes through it in a SerialJournal."""
+	def __init__(self, port, journal):
+		self.port = port
+		self.journal = journal
+
+	def write(self, data):
+		self.journal.record(WRITE, data)
+		return self.port.write(data)
+
+	def read(self, size=1):
+		data = self.port.read(size)
+		if data:
+			self.journal.record(READ, data)
+		return data
+
+	def readline(self, *args, **kwargs):
+		data = self.port.readline(*args, **kwargs)
+		if data:
+			self.journal.record(READ, data)
+		return data
+
+	def flushInput(self):
+		waiting = self.port.inWaiting()
+		if waiting:
+			self.journal.record(FLUSHED, self.port.read(waiting))
+		self.port.flushInput()
+
+	def __getattr__(self, name):															#everything else (inWaiting, close, ...) goes straight to the port
+		return getattr(self.port, name)
+
+#===========================================================================================================
+#												REPLAYPORT:
+#===========================================================================================================
+class ReplayPort:
+	"""
+	Stands in for a serial.Serial, giving DataReader the bytes recorded in a
+	journal one cycle at a time. Within a cycle, bytes that were read after the
+	nth write to the PIC become readable after DataReader's nth write, so that
+	replies are not mistaken for leftovers from the cycle before. What
+	DataReader writes is counted and dropped.
+	"""
+	def __init__(self, path):
+		self.cycles = []																	#(wall time, [(writes before, bytes read), ...]) for each cycle, in order
+		self.header = {}
+		reads = []
+		writes = 0
+		wall = None
+		for kind, mono, recorded, data in read_journal(path):
+			if kind == READ:
+				reads.append((writes, data))
+			elif kind == WRITE:
+				writes += 1
+			elif kind == CYCLE:
+				if wall is not None or reads:
+					self.cycles.append((wall if wall is not None else recorded, reads))
+				reads = []
+				writes = 0
+				wall = recorded
+			elif kind == HEADER:
+				self.header.update(word.split('=', 1) for word in data.split())
+		if wall is not None:
+			self.cycles.append((wall, reads))
+		self.buffer = ""
+		self.pending = []																	#this cycle's reads not yet made available
+		self.writes = 0																		#writes so far this cycle
+		self.next = 0
+		self.written = 0
+		self.wall = None
+
+	def next_cycle(self):
+		"""
+		Starts the next cycle and returns True, or returns False if the journal
+		has no more cycles. Bytes the last cycle left unread stay in front of
+		the new ones, as they would in the serial port.
+		"""
+		if self.next >= len(self.cycles):
+			return False
+		self.buffer += "".join(data for writes, data in self.pending)
+		self.wall, self.pending = self.cycles[self.next]
+		self.pending = list(self.pending)
+		self.writes = 0
+		self.next += 1
+		self.release()
+		return True
+
+	def release(self):
+		"""Makes readable the bytes that arrived after as many writes as have been made this cycle."""
+		while self.pending and self.pending[0][0] <= self.writes:
+			self.buffer += self.pending.pop(0)[1]
+
+	def write(self, data):
+		self.written += len(data)
+		self.writes += 1
+		self.release()
+		return len(data)
+
+	def inWaiting(self):
+		return len(self.buffer)
+
+	def read(self, size=1):
+		data, self.buffer = self.buffer[:size], self.buffer[size:]
+		return data
+
+	def readline(self, size=None, eol='\n'):
+		end = self.buffer.find(eol)
+		end = len(self.buffer) if end < 0 else end + len(eol)								#as a timed-out readline would, return whatever there is
+		if size is not None:
+			end = min(end, size)
+		return self.read(end)
+
+	def flushInput(self):
+		self.buffer = ""
+
+	def close(self):
+		pass
+
+##REPLAY=====================================================================================================
+def replay_reader(path):
+	"""
+	Returns a ReplayPort for the journal at path and a DataReader reading from
+	it, in the read mode the journal was recorded in, that never waits.
+	"""
+	import handleData
+
+	os.environ['TZ'] = 'CST+6'																#as main.py does
+	time.tzset()
+	port = ReplayPort(path)
+	handleData.READ_MODE = port.header.get("mode", handleData.READ_MODE)
+	reader = handleData.DataReader(port=port)
+	reader.pause = lambda seconds: None													#the PIC has already answered: don't wait for it
+	for entry in reader.schedule:
+		entry["deadline"] = 0
+	return port, reader
+
+def replay_header(wall):
+	"""Returns the header main.py would start a row recorded at wall with."""
+	local_time = time.localtime(wall)
+	return [str(wall), str(local_time.tm_year), str(local_time.tm_mon), str(local_time.tm_mday),
+		str(local_time.tm_hour), str(local_time.tm_min), str(local_time.tm_sec),
+		Config.NULL_VAL, Config.NULL_VAL, Config.NULL_VAL]
+
+def replay(path, cycles=None, save=True):
+	"""
+	Plays the journal at path back through a DataReader, every DataConverter
+	and a DataOutputter as fast as possible, cycle by cycle, and prints the
+	time spent in each stage. Rows are stamped with the time each cycle was
+	recorded. The read mode the journal was recorded in is used. If save is
+	False, converted data is not written out. Writes to the files named in
+	Config.py, so run it from a scratch copy of the station directory.
+	"""
+	import handleData
+	import DataConverters
+	import convert
+
+	port, reader = replay_reader(path)
+	outputter = handleData.DataOutputter()
+	DataConverters.DataConverter.set_in_out(reader=reader, outputter=outputter)
+
+	timings = {"read": 0.0, "convert": 0.0, "save": 0.0}
+	count = 0
+	while (cycles is None or count < cycles) and port.next_cycle():
+		header = replay_header(port.wall)
+		start = time.time()
+		reader.read(list(header), list(header), 0)
+		read_done = time.time()
+		convert.process_all()
+		convert_done = time.time()
+		if save:
+			outputter.save(list(header), 0)
+		timings["read"] += read_done - start
+		timings["convert"] += convert_done - read_done
+		timings["save"] += time.time() - convert_done
+		count += 1
+	outputter.close()																		#let the backup writer finish
+
+	total = sum(timings.values())
+	print "Replayed " + str(count) + " of " + str(len(port.cycles)) + " cycles from " + path + " in " + \
+		str(round(total, 2)) + " seconds (" + (str(round(count/total, 1)) if total else "-") + " cycles per second)."
+	for stage in ["read", "convert", "save"]:
+		print "  " + stage + ": " + str(round(timings[stage], 3)) + " seconds" + \
+			(" (" + str(round(timings[stage]*1000/count, 2)) + " ms per cycle)" if count else "")
+	return count
+
+##COMPARE BACKENDS===========================================================================================
+def compare_backends(path, cycles=None):
+	"""
+	Converts every cycle of the journal at path with each spec'd converter
+	(see DataConverters.spec) in both the "decimal" and "float" numeric
+	backends, and prints, for each field, the largest difference between
+	the two once rounded to the field's dec_places_round, and how many
+	cycles gave different output text. Fields that never differ are listed
+	as a CONVERTER_BACKENDS setting for Config.py. Writes nothing.
+	"""
+	import DataConverters
+	import convert
+	from handleData import DataMissingError
+
+	port, reader = replay_reader(path)
+	DataConverters.DataConverter.set_in_out(reader=reader, outputter=None)
+	pairs = []																				#(decimal converter, float converter) for each numeric field
+	for converter in convert.all_converters:
+		if isinstance(converter, DataConverters.SpecConverter) and converter.spec["formula"] == "dec" and \
+			converter.spec["decoder"] is None:
+			pair = (type(converter)(), type(converter)())
+			pair[0].set_backend("decimal")
+			pair[1].set_backend("float")
+			pairs.append(pair)
+	deviation = dict((exact.conv_label, 0.0) for exact, fast in pairs)
+	differing = dict((exact.conv_label, 0) for exact, fast in pairs)
+	timings = {"decimal": 0.0, "float": 0.0}
+
+	def convert_once(converter):
+		"""Returns converter's converted and rounded value for this cycle, as safe_process would pass it on."""
+		try:
+			data = reader.get_value(converter.raw_label) if converter.raw_label != "N/A" else Config.ERROR_VAL
+			start = time.time()
+			data = converter.process(data)
+			if data != Config.ERROR_VAL:
+				try:
+					data = round(data, converter.dec_places_round)
+				except TypeError:
+					pass
+			timings[converter.backend] += time.time() - start
+			return data
+		except DataMissingError:
+			return None
+		except:
+			return Config.ERROR_VAL
+
+	count = 0
+	while (cycles is None or count < cycles) and port.next_cycle():
+		header = replay_header(port.wall)
+		reader.read(list(header), list(header), 0)
+		for exact, fast in pairs:
+			a = convert_once(exact)
+			b = convert_once(fast)
+			if str(a) != str(b):
+				differing[exact.conv_label] += 1
+			try:
+				deviation[exact.conv_label] = max(deviation[exact.conv_label], abs(float(a) - float(b)))
+			except (TypeError, ValueError):													#one side missing or not a number; counted as differing above
+				pass
+		count += 1
+
+	unchanged = sorted(label for label in differing if not differing[label])
+	print "Compared " + str(len(pairs)) + " fields over " + str(count) + " cycles from " + path + "."
+	print "  decimal: " + str(round(timings["decimal"], 3)) + " seconds, float: " + str(round(timings["float"], 3)) + " seconds"
+	for label in sorted(differing, key=lambda label: (-deviation[label], -differing[label], label)):
+		if differing[label]:
+			print "  " + label + ": max deviation " + repr(deviation[label]) + ", output differs in " + \
+				str(differing[label]) + " of " + str(count) + " cycles"
+	print str(len(unchanged)) + " of " + str(len(pairs)) + " fields give the same output in float:"
+	print "CONVERTER_BACKENDS = {" + ", ".join('"' + label + '": "float"' for label in unchanged) + "}"
+	return deviation, differing
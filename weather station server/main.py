@@ -9,11 +9,22 @@ import errors
 from handleData import DataReader, DataOutputter
 import convert
 import DataConverters
+import handleData
+import stations
+import timing
 
 import sched
+import select
 import os
 import signal
 import time
+import argparse
+import traceback
+
+CYCLE_PERIOD = getattr(Config, "CYCLE_PERIOD", 29.9787)									#seconds from the start of one cycle to the next. can be shortened
+																							#when the reader runs in "response" mode (see handleData.py)
+THREADED_ACQUISITION = getattr(Config, "THREADED_ACQUISITION", False)						#read from the PIC on a separate thread so that slow writes or emails
+																							#downstream do not delay sampling
 
 #===================================================================================================================
 #											WEATHERSCHEDULER CLASS DEFINITION
@@ -25,13 +36,20 @@ import time
 class WeatherScheduler:
 
 ##INITIALIZE WEATHER SCHEDULER======================================================================================
-	def __init__(self):
+	def __init__(self, port=None, simulated=False, max_cycles=None):
 		"""
 		Constructor for WeatherScheduler. Responsible for initializing
 		instances of DataReader and DataOutputter and setting these to
 		be used by DataConverters. Also initializes a scheduler from
-		python's sched module.
+		python's sched module. port overrides Config.PORT_NUM. If simulated
+		is True (see simulate()), the board's LED is left alone and emails
+		are queued but not sent. If max_cycles is given, run() returns
+		after that many cycles. If Config.STATIONS lists stations, a
+		reader and outputter is made for each instead (see stations.py).
 		"""
+		self.simulated = simulated
+		self.max_cycles = max_cycles
+		self.cycles_run = 0
 		self.startup_time = time.time()														#get the current time
 		t = "unknown"
 		try:
@@ -47,12 +65,19 @@ class WeatherScheduler:
 			pass
 
 		errors.debug("WeatherScheduler initializing.")
-		self.reader = DataReader()															#initialize a DataReader to handle raw data 
-		self.outputter = DataOutputter()													#initialize a DataOutputter to handle converted data
+		self.stations = None
+		if stations.STATIONS:																#several PICs: every station is read in the same cycle
+			handleData.READ_MODE = "response"												#fixed sleeps would make each station wait for the others
+			self.stations = stations.load_stations()
+			errors.debug("Running " + str(len(self.stations)) + " stations: " + 
+				", ".join(station.name for station in self.stations))
+		else:
+			self.reader = DataReader(port=port)												#initialize a DataReader to handle raw data 
+			self.outputter = DataOutputter()												#initialize a DataOutputter to handle converted data
 																							#see handleData for details on these
-		DataConverters.DataConverter.set_in_out(											#tell all DataConverters to use the objects just created
-									reader=self.reader, 
-									outputter=self.outputter)			
+			DataConverters.DataConverter.set_in_out(										#tell all DataConverters to use the objects just created
+										reader=self.reader, 
+										outputter=self.outputter)			
 		self.scheduler = sched.scheduler(time.time, time.sleep)								#create a scheduler to handle the main loop's timing
 
 		self.cycles = 0																		#this counter will be used to tell daily_checks when to run
@@ -61,6 +86,9 @@ class WeatherScheduler:
 																							#program to exit gracefully at the end of a cycle
 		signal.signal(signal.SIGUSR1, self.end) 											#initialize a signal handler to catch SIGUSR1 and call self.end()
 		errors.debug("Set signal handler for SIGUSR1 to " + str(signal.getsignal(signal.SIGUSR1)))
+		self.dumpToggle = False																#set by SIGUSR2 when converters are timed, to write out their timings
+		if timing.CONVERTER_TIMING:
+			signal.signal(signal.SIGUSR2, self.dump_timing)
 		self.maybe_end()
 
 ##RUN WEATHERSCHEDULER===============================================================================================
@@ -70,6 +98,8 @@ class WeatherScheduler:
 		the main loop forever, calling other functions as scheduled.
 		"""
 		still_to_wait = int(Config.WAIT_AT_STARTUP - (time.time() - self.startup_time))		#calculate how much longer to wait
+		if self.simulated:																	#a simulated PIC is ready straight away
+			still_to_wait = 0
 		errors.debug("Waiting " + str(still_to_wait) + " seconds for PIC...")
 
 		for i in range(int(still_to_wait/20)):												#wait, but periodically check if end signal has been received
@@ -78,48 +108,160 @@ class WeatherScheduler:
 			self.maybe_end()
 
 		errors.debug("Entering main loop.")
+		if self.stations is not None:
+			return self.run_stations()
+		if THREADED_ACQUISITION:
+			self.reader.start_acquisition(CYCLE_PERIOD)
 		self.last_cycle_started = time.time()
 		while True:
+			frame = None
+			if THREADED_ACQUISITION:														#wait for the acquisition thread's next frame
+				frame = self.reader.frames.pop(CYCLE_PERIOD)
+				if frame is None:
+					errors.debug("No frame from acquisition thread this cycle.")
+					self.maybe_end()
+					continue
 			errors.debug("____________NEW CYCLE____________")
-			errors.sendEmail()
+			if not self.simulated:
+				errors.sendEmail()
 			self.note_running()
-			os.environ['TZ'] = 'CST+6'
-			time.tzset()
-			local_time = time.localtime()
-			unix_time = str(time.time())
-			year = str(local_time.tm_year)
-			month = str(local_time.tm_mon)
-			day = str(local_time.tm_mday)
-			hour = str(local_time.tm_hour)
-			minute = str(local_time.tm_min)
-			second = str(local_time.tm_sec)
-			clk_source = Config.NULL_VAL
-			stardate = Config.NULL_VAL
-			future = Config.NULL_VAL
-			header = [unix_time, year, month, day, hour, minute, second, clk_source, stardate, future]
-			header_1 = [unix_time, year, month, day, hour, minute, second, clk_source, stardate, future]
-			header_2 = [unix_time, year, month, day, hour, minute, second, clk_source, stardate, future]
-			toggleFile = open(Config.TOGGLE_FILE_PATH, 'r')
-			toggle = toggleFile.readline()
-			if toggle == '': 
-				toggle = 0
-			toggleFile.close()
-			self.reader.read(header, header_1, int(toggle))
+			unix_time = time.time() if frame is None else frame["time"]					#timestamp rows with the time the data was requested
+			toggle = self.read_toggle()
+			if frame is None:
+				self.reader.read(self.make_header(unix_time), self.make_header(unix_time), toggle)
+			else:
+				self.reader.store(frame, self.make_header(unix_time), self.make_header(unix_time), toggle)
 			convert.process_all()
-			self.outputter.save(header_2, int(toggle))
-			toggleFile = open(Config.TOGGLE_FILE_PATH, 'r')
+			self.outputter.save(self.make_header(unix_time), toggle)
+			self.reset_toggle(toggle)
+			if not THREADED_ACQUISITION:													#the acquisition thread sends commands itself
+				self.reader.send_commands()
+			self.daily_checks()	
+			self.finish_cycle()
+			self.scheduler.run()
+			self.cycles_run += 1
+			if self.max_cycles is not None and self.cycles_run >= self.max_cycles:
+				return
+
+	def run_stations(self):
+		"""
+		The main loop when several stations are configured: every cycle, reads
+		a frame from each station's PIC at once (see acquire_all()), then
+		converts and saves each station's data in turn.
+		"""
+		self.last_cycle_started = time.time()
+		while True:
+			frames = self.acquire_all()
+			errors.set_prefix("")
+			errors.debug("____________NEW CYCLE____________")
+			if not self.simulated:
+				errors.sendEmail()
+			self.note_running()
+			toggle = self.read_toggle()
+			for station in self.stations:
+				station.activate()
+				frame = frames[station]
+				station.reader.store(frame, self.make_header(frame["time"]), self.make_header(frame["time"]), toggle)
+				convert.process_all(station.converters)
+				station.outputter.save(self.make_header(frame["time"]), toggle)
+				station.reader.send_commands()
+			errors.set_prefix("")
+			self.reset_toggle(toggle)
+			self.daily_checks()	
+			self.finish_cycle()
+			self.scheduler.run()
+			self.cycles_run += 1
+			if self.max_cycles is not None and self.cycles_run >= self.max_cycles:
+				return
+
+	def acquire_all(self):
+		"""
+		Requests a frame from every station at the same time and returns them
+		keyed by station. One thread waits on all the serial ports with
+		select(), so the cycle takes as long as the slowest station rather than
+		the sum of them all.
+		"""
+		frames = {}
+		waiting = {}																		#keys station to (its acquire_steps(), time it gives up waiting)
+		for station in self.stations:
+			frames[station] = []
+			self.advance(station, station.reader.acquire_steps(frames[station]), waiting)
+		while waiting:
+			ports = {}
+			poll = False
+			for station in waiting:
+				try:
+					fd = station.reader.port.fileno()
+				except (AttributeError, ValueError):
+					fd = None
+				if fd is None:																#no descriptor to wait on: check it every poll interval
+					poll = True
+				else:
+					ports[fd] = station
+			timeout = max(0, min(wait_until for steps, wait_until in waiting.values()) - time.time())
+			if poll:
+				timeout = min(timeout, handleData.REPLY_POLL_INTERVAL)
+			try:
+				readable = select.select(ports.keys(), [], [], timeout)[0]
+			except select.error:															#a descriptor went bad (port lost): let the reader find out
+				readable = ports.keys()
+			now = time.time()
+			ready = set(ports[fd] for fd in readable)
+			for station in waiting.keys():
+				steps, wait_until = waiting[station]
+				if station in ready or wait_until <= now or station not in ports.values():
+					self.advance(station, steps, waiting)
+		for station in self.stations:
+			if not frames[station]:															#acquisition failed: the station's strings are all missing
+				frames[station].append({"time": time.time(), "due": [], "replies": {}, "strings": {}})
+			frames[station] = frames[station][0]
+		return frames
+
+	def advance(self, station, steps, waiting):
+		"""Resumes station's acquisition until it next waits on its port, or finishes."""
+		errors.set_prefix(station.prefix)
+		try:
+			waiting[station] = (steps, steps.next())
+		except StopIteration:
+			waiting.pop(station, None)
+		except:																				#one station's failure mustn't stop the others
+			waiting.pop(station, None)
+			if not station.acquisition_error:
+				errors.error("Error reading from PIC. Assume error continues until otherwise notified. " +
+					"Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+			station.acquisition_error = True
+		else:
+			if station.acquisition_error and station not in waiting:
+				errors.error("Reading from PIC again.")
+				station.acquisition_error = False
+		errors.set_prefix("")
+
+	def make_header(self, unix_time):
+		"""Returns the fields that start every row of data, for data requested at unix_time."""
+		os.environ['TZ'] = 'CST+6'
+		time.tzset()
+		local_time = time.localtime(unix_time)
+		return [str(unix_time), str(local_time.tm_year), str(local_time.tm_mon), str(local_time.tm_mday),
+			str(local_time.tm_hour), str(local_time.tm_min), str(local_time.tm_sec),
+			Config.NULL_VAL, Config.NULL_VAL, Config.NULL_VAL]									#clock source, stardate, future
+
+	def read_toggle(self):
+		"""Returns 1 if the database has asked for the files it collects to be started afresh, else 0."""
+		with open(Config.TOGGLE_FILE_PATH, 'r') as toggleFile:
+			toggle = toggleFile.readline()
+		if toggle == '': 
+			toggle = 0
+		return int(toggle)
+
+	def reset_toggle(self, toggle):
+		"""Clears the toggle once the cycle has acted on it, unless it was set meanwhile."""
+		with open(Config.TOGGLE_FILE_PATH, 'r') as toggleFile:
 			last_toggle = int(toggleFile.readline())
-			toggleFile.close()
-			toggleFile = open(Config.TOGGLE_FILE_PATH, 'w')
-			if (last_toggle == 1 and int(toggle) == 0):
+		with open(Config.TOGGLE_FILE_PATH, 'w') as toggleFile:
+			if (last_toggle == 1 and toggle == 0):
 				toggleFile.write('1')
 			else:
 				toggleFile.write('0')
-			toggleFile.close()  
-			self.reader.send_commands()
-			self.daily_checks()	
-			self.finish_cycle()
-			self.scheduler.run()
 
 ##DO DAILY TASKS====================================================================================================
 	def daily_checks(self):
@@ -131,7 +273,8 @@ class WeatherScheduler:
 		"""
 		self.build_file_for_dash()															#put together data for GUI
 		errors.debug("daily_checks called.")
-		os.system("sudo ts4200ctl --redledoff")												#turn off LED
+		if not self.simulated:
+			os.system("sudo ts4200ctl --redledoff")											#turn off LED
 		self.cycles +=1
 		if self.cycles != 1:																#i.e., run only every 24 hours' worth of cycles
 			errors.debug("daily_checks exiting without checking.")
@@ -141,7 +284,7 @@ class WeatherScheduler:
 		self.cycles = 0																		#reset counter
 																							#the following 2 checks use the statvfs utility. see statvfs man pages.
 																						#check space remaining on local filesystem:
-		localStats = os.statvfs(Config.TO_UNIX_FILE_PATH)									#get statvfs data about local filesystem
+		localStats = os.statvfs(os.path.dirname(Config.TO_UNIX_FILE_PATH) or ".")			#get statvfs data about local filesystem
 		freeBytes = localStats.f_frsize * localStats.f_bavail								#free bytes = fragment size * number of fragments available to us
 		if freeBytes < Config.FREE_BYTES_WARNING:											#check that this number is acceptable. if not, send an alert.
 			errors.error("TS-4200 has " + str(freeBytes/1000000) + " MB remaining. " +
@@ -167,7 +310,14 @@ class WeatherScheduler:
 			errors.error("TS-4200 has only " + str(unusedmem) + " kB of " +
 				"unused RAM. Speed and performance may be impacted, corrective action recommended.")
 
-		PIC_bad_strings = self.reader.numBadStrings(reset=True)								#get number of bad strings and reset all flags in reader
+		for reader, outputter, converters in self.each_station():
+			self.station_checks(reader, outputter, converters)
+		self.sched_warning_sent = False 													#reset schedule error flag
+		open("text_for_dash", 'w').close()													#stop text_for_dash from ballooning
+
+	def station_checks(self, reader, outputter, converters):
+		"""The part of daily_checks() done for each station's reader, outputter and converters."""
+		PIC_bad_strings = reader.numBadStrings(reset=True)									#get number of bad strings and reset all flags in reader
 		if PIC_bad_strings >= Config.TOTAL_BAD_STRING_WARNING:								#send an error if there are too many bad strings
 			errors.info("TS-4200 has logged " + str(PIC_bad_strings) + " bad strings " + 
 				"(unrecognized ID, wrong length, or unreceived) in last 24 hours. Probable " +
@@ -177,17 +327,43 @@ class WeatherScheduler:
 				"might be going wrong.")
 		else:
 			errors.debug("Only " + str(PIC_bad_strings) + " bad strings for the day. No warning sent.")
+		errors.debug("PIC reply times for the day:\n" + reader.latency_summary(reset=True))
+		errors.debug(reader.connection_status())
+		if timing.CONVERTER_TIMING:
+			errors.debug(timing.summary(converters or convert.plan, reset=True))
+		if THREADED_ACQUISITION and self.stations is None:
+			dropped = reader.frames.numDropped(reset=True)
+			if dropped:
+				errors.info("Main loop fell behind acquisition and dropped " + str(dropped) +
+					" frames in last 24 hours.")
+			else:
+				errors.debug("No frames dropped for the day.")
 
-		convert.reset_all_flags()															#resets all data converter error flags
-		self.outputter.reset()																#resets outputter's error flags
-		self.sched_warning_sent = False 													#reset schedule error flag
-		open("text_for_dash", 'w').close()													#stop text_for_dash from ballooning
+		errors.debug((converters or convert.plan).memo_summary(reset=True))
+		errors.debug(outputter.backup_status())
+		convert.reset_all_flags(converters)													#resets all data converter error flags
+		outputter.reset()																	#resets outputter's error flags
 
 ##MAKE FILES FOR DASH================================================================================================
 	def build_file_for_dash(self):
 		"""Tells reader and outputter to each add their data to file for GUI"""															
-		self.reader.build_file_for_dash()													#call method of DataReader
-		self.outputter.build_file_for_dash()												#call method of DataOutputter
+		for reader, outputter, converters in self.each_station():
+			reader.build_file_for_dash()													#call method of DataReader
+			outputter.build_file_for_dash()													#call method of DataOutputter
+
+	def each_station(self):
+		"""
+		Generates (reader, outputter, converters) for each station, pointing the
+		DataConverters and error messages at each in turn. converters is None
+		(meaning convert.plan) when only one station is run.
+		"""
+		if self.stations is None:
+			yield self.reader, self.outputter, None
+			return
+		for station in self.stations:
+			station.activate()
+			yield station.reader, station.outputter, station.converters
+		errors.set_prefix("")
 
 	def note_running(self):
 		"""Leave a timestamp in a file so GUI knows Freya is running"""
@@ -201,15 +377,41 @@ class WeatherScheduler:
 			errors.info("Received end signal, terminating main.py. " +						#if ending, send email
 						"Use startup.sh to restart.")										
 			errors.sendEmail(subject="TS-4200 Stopping Operations")
+			if self.stations is None and self.reader.stop_acquisition():					#frames already acquired are saved before the files are closed
+				self.save_buffered()
+			for reader, outputter, converters in self.each_station():						#sync and close the files kept open between cycles
+				reader.files.close()
+				outputter.close()															#after the backup writer has written what it was handed
 			errors.debug("main.py exiting.")
 			raise SystemExit 																#exit python
-		os.system("sudo ts4200ctl --redledon")												#turn on LED
+		if not self.simulated:
+			os.system("sudo ts4200ctl --redledon")											#turn on LED
 		self.note_running()																	#leave a timestamp for dash
+		if self.dumpToggle:																	#write converter timings if asked to by SIGUSR2
+			self.dumpToggle = False
+			timing.dump([(errors.get_prefix().strip("[] ") or "-", converters or convert.plan)
+				for reader, outputter, converters in self.each_station()])
+			errors.debug("Wrote converter timings to " + timing.CONVERTER_TIMING_PATH)
+
+	def save_buffered(self):
+		"""Stores, converts and saves each frame left in the stopped acquisition thread's buffer, oldest first."""
+		toggle = self.read_toggle()
+		frame = self.reader.frames.pop(0)
+		while frame is not None:
+			unix_time = frame["time"]
+			self.reader.store(frame, self.make_header(unix_time), self.make_header(unix_time), toggle)
+			convert.process_all()
+			self.outputter.save(self.make_header(unix_time), toggle)
+			errors.debug("Saved a frame left in the acquisition buffer.")
+			frame = self.reader.frames.pop(0)
+		self.reset_toggle(toggle)
 
 	def finish_cycle(self):
 		"""Called at the end of a cycle to wrap up"""
 		self.maybe_end()																	#see above
-		time_to_sleep = self.last_cycle_started + 29.9787 - time.time()						#calculate time to sleep. 19.9787 is 20s minus the average 
+		if THREADED_ACQUISITION and self.stations is None:									#the acquisition thread keeps time, the main loop just waits for frames
+			return
+		time_to_sleep = self.last_cycle_started + CYCLE_PERIOD - time.time()				#calculate time to sleep. 29.9787 is 30s minus the average 
 																							#time it takes to queue the next cycle
 		if time_to_sleep < Config.BEHIND_SCHEDULE_WARNING:									#if behind schedule, send an alert and don't sleep
 			if not self.sched_warning_sent:
@@ -228,12 +430,62 @@ class WeatherScheduler:
 		errors.debug("Received SIGUSR1.")													#sets endToggle to true. endToggle will be checked periodically, and
 		self.endToggle = True																#if it is true the program ends (see above).
 
+	def dump_timing(self, signum, frame):													#catches SIGUSR2 when converters are timed (see timing.py). the
+		errors.debug("Received SIGUSR2.")													#timings are written by maybe_end, between cycles
+		self.dumpToggle = True
+
 
 ##MAIN CODE===========================================================================================================
 
-def main():
-	fred = WeatherScheduler()
+def simulate(speed, cycles, latency, drop_rate, truncate_rate, unknown_rate):
+	"""
+	Runs the full cycle against a PICSimulator (see picSimulator.py) instead
+	of the PIC, with time running speed times faster than real time, and
+	prints how many cycles it managed per minute. Writes to the files named
+	in Config.py, so run it from a scratch copy of the station directory.
+	"""
+	global CYCLE_PERIOD
+	import picSimulator
+	handleData.READ_MODE = "response"													#fixed sleeps can't be compressed, so wait for replies instead
+	handleData.STRING_DEADLINE = handleData.STRING_DEADLINE/speed
+	handleData.STRING_DEADLINES = dict((stringID, deadline/speed) for stringID, deadline in handleData.STRING_DEADLINES.items())
+	CYCLE_PERIOD = CYCLE_PERIOD/speed
+	sim = picSimulator.PICSimulator(latency=latency, drop_rate=drop_rate, truncate_rate=truncate_rate,
+		unknown_rate=unknown_rate, time_scale=1.0/speed)
+	sim.start()
+	fred = WeatherScheduler(port=sim.port_name, simulated=True, max_cycles=cycles)
+	start = time.time()
 	fred.run()
+	elapsed = time.time() - start
+	print str(fred.cycles_run) + " cycles in " + str(round(elapsed, 2)) + " seconds (" + \
+		str(round(fred.cycles_run*60/elapsed, 1)) + " cycles per minute)."
+	print "Simulator: " + sim.summary()
+	sim.stop()
+
+def main():
+	parser = argparse.ArgumentParser(description="Carleton weather station data collection.")
+	parser.add_argument("--simulate", action="store_true", help="run against a simulated PIC (see picSimulator.py)")
+	parser.add_argument("--speed", type=float, default=1.0, help="with --simulate, how many times faster than real time to run")
+	parser.add_argument("--replay", metavar="JOURNAL", help="play back a serial journal (see journal.py) as fast as possible")
+	parser.add_argument("--no-save", action="store_true", help="with --replay, convert but don't write out the data")
+	parser.add_argument("--compare-backends", metavar="JOURNAL", help="convert a serial journal in both the decimal and float numeric backends and report where they differ")
+	parser.add_argument("--cycles", type=int, default=None, help="with --simulate, --replay or --compare-backends, stop after this many cycles")
+	parser.add_argument("--latency", type=float, default=0.05, help="with --simulate, seconds the PIC takes to reply")
+	parser.add_argument("--drop-rate", type=float, default=0.0, help="with --simulate, chance a reply is never sent")
+	parser.add_argument("--truncate-rate", type=float, default=0.0, help="with --simulate, chance a reply is cut short")
+	parser.add_argument("--unknown-rate", type=float, default=0.0, help="with --simulate, chance a reply has an unknown ID")
+	args = parser.parse_args()
+	if args.replay:
+		import journal
+		journal.replay(args.replay, args.cycles, save=not args.no_save)
+	elif args.compare_backends:
+		import journal
+		journal.compare_backends(args.compare_backends, args.cycles)
+	elif args.simulate:
+		simulate(args.speed, args.cycles, args.latency, args.drop_rate, args.truncate_rate, args.unknown_rate)
+	else:
+		fred = WeatherScheduler()
+		fred.run()
 
 if __name__ == '__main__':
 	main()
@@ -0,0 +1,147 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds OutputFile, which keeps one of the files data *
+#* is saved to (2UNIX, oneline, the raw data files and their  *
+#* backups) open from cycle to cycle, in place of opening and *
+#* closing it for every row. Each row is still handed to the  *
+#* OS as it is written, so that a crash loses nothing it      *
+#* would not have lost before, and is synced to disk as often *
+#* as OUTPUT_SYNC_ROWS and OUTPUT_SYNC_SECONDS say, or when   *
+#* sync() is called. A writer can mark how far what it has    *
+#* written goes (a row number of the write-ahead log, see     *
+#* wal.py) and read back the mark of what has been synced. A  *
+#* file is reopened if what is at its path is no longer what  *
+#* it has open (it was moved, deleted, or its drive           *
+#* remounted), and after any failure to write it.             *
+#**************************************************************
+
+import Config
+
+import os
+import time
+
+OUTPUT_SYNC_ROWS = getattr(Config, "OUTPUT_SYNC_ROWS", 0)									#sync an output file to disk every this many rows written to it (0: never by rows)...
+OUTPUT_SYNC_SECONDS = getattr(Config, "OUTPUT_SYNC_SECONDS", 60)							#...or when a row is written this many seconds after it was last synced (0: never by time)
+
+#===========================================================================================================
+#												OUTPUTFILE:
+#===========================================================================================================
+class OutputFile:
+	"""
+	A file appended to row by row, kept open between rows. Writes raise
+	IOError or OSError as open() and write() would, after closing the file
+	so that the next write opens it anew. mark is the mark given with the
+	last text written (see write()) and synced_mark the mark as of the last
+	sync, or None before either.
+	"""
+	def __init__(self, path, sync_rows=OUTPUT_SYNC_ROWS, sync_seconds=OUTPUT_SYNC_SECONDS):
+		self.path = path
+		self.sync_rows = sync_rows
+		self.sync_seconds = sync_seconds
+		self.handle = None
+		self.identity = None																#(device, inode) of the file open
+		self.unsynced = 0																	#rows written since the last sync
+		self.synced = time.time()
+		self.mark = None
+		self.synced_mark = None
+
+	def open(self):
+		self.handle = open(self.path, 'a')
+		stat = os.fstat(self.handle.fileno())
+		self.identity = (stat.st_dev, stat.st_ino)
+		self.synced = time.time()
+
+	def current(self):
+		"""Returns True if the file open is still the file at self.path."""
+		try:
+			stat = os.stat(self.path)
+		except OSError:
+			return False
+		return (stat.st_dev, stat.st_ino) == self.identity
+
+	def write(self, text, fresh=False, mark=None):
+		"""
+		Appends text to the file, or with fresh replaces what the file holds
+		with it (as open() with 'w' would), and hands it to the OS. mark, if
+		given, becomes self.mark once text is written.
+		"""
+		if self.handle is not None and not self.current():
+			self.close()
+		try:
+			if self.handle is None:
+				self.open()
+			if fresh:
+				self.handle.truncate(0)														#the file is opened to append, so text goes at the start
+			self.handle.write(text)
+			self.handle.flush()
+			if mark is not None:
+				self.mark = mark
+			self.unsynced += 1
+			if (self.sync_rows and self.unsynced >= self.sync_rows) or \
+				(self.sync_seconds and time.time() - self.synced >= self.sync_seconds):
+				self.sync()
+		except (IOError, OSError):
+			self.close()
+			raise
+
+	def clear(self):
+		"""Empties the file (as opening it with 'w' would)."""
+		self.write("", fresh=True)
+
+	def sync(self):
+		if self.handle is not None:
+			os.fsync(self.handle.fileno())
+		self.unsynced = 0
+		self.synced = time.time()
+		self.synced_mark = self.mark
+
+	def close(self):
+		"""
+		Syncs and closes the file, if it is open. Never raises: a file that fails
+		to close is given up on, and mark is set back to synced_mark, as what was
+		written since may be lost.
+		"""
+		handle = self.handle
+		self.handle = None
+		self.identity = None
+		if handle is None:
+			return
+		try:
+			handle.flush()
+			if self.unsynced:
+				os.fsync(handle.fileno())
+			self.synced_mark = self.mark
+		except (IOError, OSError):
+			self.mark = self.synced_mark
+		finally:
+			self.unsynced = 0
+			try:
+				handle.close()
+			except (IOError, OSError):
+				pass
+
+#===========================================================================================================
+#												OUTPUTFILES:
+#===========================================================================================================
+class OutputFiles:
+	"""The OutputFiles of a DataReader or DataOutputter, by path."""
+	def __init__(self):
+		self.files = {}
+
+	def get(self, path):
+		"""Returns the OutputFile for path, making it if need be."""
+		if path not in self.files:
+			self.files[path] = OutputFile(path)
+		return self.files[path]
+
+	def close_under(self, directory):
+		"""Closes every file in directory or below it, such as those on the flash drive before it is unmounted."""
+		directory = os.path.join(os.path.abspath(directory), "")
+		for path in self.files:
+			if os.path.abspath(path).startswith(directory):
+				self.files[path].close()
+
+	def close(self):
+		for path in self.files:
+			self.files[path].close()
@@ -0,0 +1,206 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Simulates the PIC on a pseudo-terminal so that      *
+#* DataReader and the whole WeatherScheduler cycle can be run *
+#* and timed without a TS-4200 or PIC attached. Answers the   *
+#* commands in picdata.conf's poll schedule with a string for *
+#* every STR: block, with configurable latency and faults.    *
+#* Used by main.py --simulate (see main.py).                  *
+#**************************************************************
+
+import errors
+import handleData
+import DataConverters
+
+import os
+import tty
+import select
+import threading
+import random
+import time
+import traceback
+
+#===========================================================================================================
+#												PICSIMULATOR:
+#===========================================================================================================
+class PICSimulator:
+	"""Answers DataReader's requests on a pseudo-terminal the way the PIC would."""
+##CONSTRUCTOR===============================================================================================
+	def __init__(self, picdata="picdata.conf", latency=0.05, jitter=0.02, drop_rate=0.0,
+			truncate_rate=0.0, unknown_rate=0.0, time_scale=1.0, seed=None):
+		"""
+		Reads picdata.conf the way DataReader does and opens a pseudo-terminal
+		whose name, self.port_name, can be given to DataReader in place of the
+		serial port. Replies are sent latency +/- jitter seconds after the
+		command that asks for them, times time_scale. drop_rate, truncate_rate
+		and unknown_rate are the chances (0 to 1) that a reply is not sent at
+		all, is cut short, or starts with an ID the reader does not expect.
+		"""
+		self.latency = latency
+		self.jitter = jitter
+		self.drop_rate = drop_rate
+		self.truncate_rate = truncate_rate
+		self.unknown_rate = unknown_rate
+		self.time_scale = time_scale
+		self.random = random.Random(seed)
+
+		self.strings = {}																	#keys string ID to the list of its field labels
+		order = []
+		options = {}
+		current_string = None
+		with open(picdata, 'r') as conf:
+			for line in conf:
+				line = line.strip()
+				if line == "" or line[0] == "#":
+					continue
+				if line[:4] == "STR:":
+					words = line[4:].split()
+					current_string = words[0]
+					order.append(current_string)
+					options[current_string] = dict(word.split('=', 1) for word in words[1:])
+					self.strings[current_string] = []
+				elif current_string is not None:
+					self.strings[current_string].append(line.split()[0])
+
+		self.commands = {}																	#keys each command to the string ID it asks for, or None for a
+		defaults = dict((stringID, cmds) for stringID, cmds, raw in handleData.LEGACY_SCHEDULE)	#command that only starts a measurement (such as QQ)
+		for stringID in order:
+			if "cmd" in options[stringID]:
+				cmds = options[stringID]["cmd"].split(',')
+			else:
+				cmds = defaults.get(stringID, [stringID*2])
+			for cmd in cmds[:-1]:
+				self.commands.setdefault(cmd, None)
+			self.commands[cmds[-1]] = stringID
+
+		converters = {}																		#choose a starting value for every field, in range where possible
+		for name in dir(DataConverters):
+			cls = getattr(DataConverters, name)
+			if isinstance(cls, type) and issubclass(cls, DataConverters.DataConverter):
+				converters[name] = cls
+		self.values = {}
+		for stringID in self.strings:
+			self.values[stringID] = [self.starting_value(label, converters.get(label)) for label in self.strings[stringID]]
+
+		self.stats = {"requests": 0, "replies": 0, "dropped": 0, "truncated": 0, "unknown": 0, "ignored": 0}
+		self.pending = []																	#(time due, string ID) of replies not yet sent
+		self.master, self.slave = os.openpty()
+		tty.setraw(self.master)
+		tty.setraw(self.slave)
+		self.port_name = os.ttyname(self.slave)
+		self.running = False
+		errors.debug("PIC simulator serving " + str(len(self.strings)) + " strings on " + self.port_name)
+
+	def starting_value(self, label, cls):
+		"""
+		Returns a raw value for label that its converter (cls, if any) turns into
+		a value within its bounds, found by trying raw values from 0 to about 2^24.
+		Bytes of combined fields and fields with no usable converter get a byte.
+		"""
+		if cls is None:
+			return self.random.randint(0, 255)
+		try:
+			converter = cls()
+			if type(converter.dec_places_round) is not int:								#status fields: report all clear
+				return 0
+			good = []
+			for k in range(80):
+				raw = int(1.23**k)
+				try:
+					value = converter.process(str(raw))
+				except:
+					continue
+				lower, upper = converter.lower_bound, converter.upper_bound
+				if (type(lower) is str or lower <= value) and (type(upper) is str or value <= upper):
+					good.append(raw)
+			if good:
+				return good[len(good)/2]
+		except:
+			errors.debug("PIC simulator could not probe " + label + ": " + traceback.format_exc(1))
+		return self.random.randint(0, 1023)
+
+##SERVE REQUESTS============================================================================================
+	def start(self):
+		"""Starts answering requests on a background thread."""
+		self.running = True
+		self.thread = threading.Thread(target=self.serve)
+		self.thread.daemon = True
+		self.thread.start()
+
+	def stop(self):
+		"""Stops the background thread and closes the pseudo-terminal."""
+		self.running = False
+		self.thread.join()
+		os.close(self.master)
+		os.close(self.slave)
+
+	def serve(self):
+		"""Body of the simulator thread: reads commands and sends replies when they fall due."""
+		received = ""
+		while self.running:
+			now = time.time()
+			while self.pending and self.pending[0][0] <= now:
+				due, stringID = self.pending.pop(0)
+				reply = self.reply(stringID)
+				if reply is not None:
+					os.write(self.master, reply)
+			timeout = 0.05
+			if self.pending:
+				timeout = max(0, min(timeout, self.pending[0][0] - now))
+			readable = select.select([self.master], [], [], timeout)[0]
+			if not readable:
+				continue
+			received += os.read(self.master, 1024)
+			while len(received) >= 2:														#the PIC's commands are two characters long
+				cmd, received = received[:2], received[2:]
+				self.handle(cmd)
+
+	def handle(self, cmd):
+		"""Queues the reply to cmd, if it asks for one."""
+		if cmd not in self.commands:
+			self.stats["ignored"] += 1
+			return
+		stringID = self.commands[cmd]
+		if stringID is None:
+			return
+		self.stats["requests"] += 1
+		delay = max(0, self.latency + self.random.uniform(-self.jitter, self.jitter)) * self.time_scale
+		self.pending.append((time.time() + delay, stringID))
+		self.pending.sort()
+
+	def reply(self, stringID):
+		"""Returns the next reply for stringID, with faults applied, or None if it is dropped."""
+		if self.random.random() < self.drop_rate:
+			self.stats["dropped"] += 1
+			return None
+		values = self.values[stringID]
+		for i in range(len(values)):														#let each value wander a little from cycle to cycle
+			step = max(1, values[i]/200)
+			values[i] = max(0, values[i] + self.random.randint(-step, step))
+		fields = [stringID] + [str(value) for value in values]
+		if self.random.random() < self.unknown_rate:
+			self.stats["unknown"] += 1
+			fields[0] = "Z"
+		if self.random.random() < self.truncate_rate:
+			self.stats["truncated"] += 1
+			fields = fields[:self.random.randint(1, len(fields))]
+		self.stats["replies"] += 1
+		return "\t".join(fields) + '\r'
+
+	def summary(self):
+		"""Returns a line describing what the simulator has done so far."""
+		return ", ".join(key + " " + str(self.stats[key]) for key in sorted(self.stats))
+
+##TESTING===================================================================================================
+
+if __name__ == '__main__':
+	sim = PICSimulator()
+	sim.start()
+	print "PIC simulator listening on " + sim.port_name + ". Ctrl-C to stop."
+	try:
+		while True:
+			time.sleep(10)
+			print sim.summary()
+	except KeyboardInterrupt:
+		sim.stop()
@@ -0,0 +1,160 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds RangeTable, which range checks the converted  *
+#* data of every field at once, at the end of each cycle, in  *
+#* place of each converter's check_range. Bounds are checked  *
+#* by validate() when a ConversionPlan is made: a bound that  *
+#* isn't a number (such as "FIX") is reported and not used.   *
+#* Which fields are out of range is kept as a bitmask, so     *
+#* that only the fields that have gone out of range or come   *
+#* back since last cycle are alerted to.                      *
+#**************************************************************
+
+import errors
+
+from decimal import Decimal
+
+try:																						#numpy is optional: without it the bounds are compared one by one
+	import numpy
+except ImportError:
+	numpy = None
+
+NUMBERS = (int, long, float, Decimal)
+UNBOUNDED = (Decimal("-Infinity"), Decimal("Infinity"))
+
+#===========================================================================================================
+#												RANGETABLE:
+#===========================================================================================================
+class RangeTable:
+	"""
+	Range checks converters' data together. Each converter given gets an
+	index in values, where whoever converts it puts the data its
+	check_range would have been given (see DataConverter.check_range), and
+	check() compares everything put there with the bounds, all at once,
+	alerting and setting range_error as check_range would. Fields left
+	unchecked in a cycle (missing data, process errors, values passed on
+	unchanged, strings) keep the state they had. The converters' bounds
+	must have been through validate().
+	"""
+	def __init__(self, converters):
+		self.converters = list(converters)
+		self.lower = [converter.lower_bound for converter in self.converters]
+		self.upper = [converter.upper_bound for converter in self.converters]
+		if numpy is not None:
+			self.lower_array = numpy.array(self.lower, dtype=float)
+			self.upper_array = numpy.array(self.upper, dtype=float)
+		self.state = 0																		#bit i set while converter i is out of range
+		self.values = [None]*len(self.converters)
+		for index, converter in enumerate(self.converters):
+			converter.range_table = self
+			converter.range_index = index
+
+	def defer(self, index, value):
+		"""Puts value in for checking by check(), unless it is a string. Returns it unchanged."""
+		if type(value) is not str:
+			self.values[index] = value
+		return value
+
+	def clear(self, index):
+		"""Forgets that converter index is out of range, so that it is alerted to again (see reset_flags)."""
+		self.state &= ~(1 << index)
+
+	def check(self):
+		"""
+		Range checks every value put in values since the last check, then alerts
+		to each field that has gone out of range or come back within it.
+		"""
+		values = self.values
+		if not values:
+			return
+		checked, out = None, None
+		if numpy is not None:
+			try:
+				checked, out = self.compare_arrays(values)
+			except (ValueError, TypeError, OverflowError):									#something numpy can't take as a float: compare one by one
+				pass
+		if checked is None:
+			checked, out = self.compare(values, range(len(values)))
+		state = (self.state & ~checked) | out
+		changed = state ^ self.state
+		self.state = state
+		while changed:																		#one pass per field alerted to, however many fields there are
+			bit = changed & -changed
+			changed ^= bit
+			index = bit.bit_length() - 1
+			converter = self.converters[index]
+			if state & bit:
+				errors.error("OUT OF RANGE ERROR: " + converter.conv_label + " reported value of " + str(values[index]))
+				converter.range_error = True
+			else:
+				errors.error(converter.conv_label + " range error resolved, reported value is back within bounds.")
+				converter.range_error = False
+		values[:] = [None]*len(values)
+
+	def compare_arrays(self, values):
+		"""
+		Returns (checked, out): bitmasks of the values given and of those out of
+		range. Compares them as floats, all at once, then exactly any that come
+		out equal to a bound, where rounding to float could have decided it.
+		"""
+		data = numpy.array(values, dtype=float)
+		checked = numpy.not_equal(numpy.array(values, dtype=object), None)
+		lower, upper = self.lower_array, self.upper_array
+		with numpy.errstate(invalid="ignore"):												#nan, which is out of range as it always was
+			out = checked & ~((lower <= data) & (data <= upper))
+			close = checked & ((data == lower) | (data == upper))
+		out = bitmask(out)
+		if close.any():
+			exact, exact_out = self.compare(values, numpy.flatnonzero(close).tolist())
+			out = (out & ~exact) | exact_out
+		return bitmask(checked), out
+
+	def compare(self, values, indexes):
+		"""Returns (checked, out) as compare_arrays does, for values at indexes, comparing each with its bounds exactly."""
+		checked = 0
+		out = 0
+		lower, upper = self.lower, self.upper
+		for index in indexes:
+			value = values[index]
+			if value is None:
+				continue
+			checked |= 1 << index
+			try:
+				good = lower[index] <= value <= upper[index]
+			except ArithmeticError:															#a Decimal NaN, which can't be compared
+				good = False
+			if not good:
+				out |= 1 << index
+		return checked, out
+
+def bitmask(flags):
+	"""Returns a numpy array of booleans as an int, with bit i set if flags[i] is."""
+	if not len(flags):
+		return 0
+	return int(numpy.packbits(flags[::-1]).tostring().encode("hex"), 16) >> (-len(flags) % 8)
+
+def validate(converters):
+	"""
+	Checks every converter's bounds, replacing any that isn't a number (such
+	as "FIX", which compares with numbers by type rather than value) with no
+	bound. Returns a line for each converter whose bounds were rejected, or
+	whose lower bound is above its upper. "N/A" is taken to mean no bound,
+	and isn't rejected.
+	"""
+	rejected = []
+	for converter in converters:
+		problems = []
+		for attr, unbounded in zip(["lower_bound", "upper_bound"], UNBOUNDED):
+			bound = getattr(converter, attr)
+			if not isinstance(bound, NUMBERS) or isinstance(bound, bool):
+				if bound != "N/A":
+					problems.append(attr + " " + repr(bound))
+				setattr(converter, attr, unbounded)
+		if problems:
+			rejected.append(converter.conv_label + " (" + ", ".join(problems) + (": not a number" if len(problems) == 1 else
+				": not numbers") + ", not used)")
+		elif not converter.lower_bound <= converter.upper_bound:
+			rejected.append(converter.conv_label + " (lower_bound " + str(converter.lower_bound) + " is above upper_bound " +
+				str(converter.upper_bound) + ": every value is out of range)")
+	return rejected
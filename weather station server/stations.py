@@ -0,0 +1,88 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Lets one main.py run several stations, each a PIC  *
+#* on its own serial port with its own picdata.conf,          *
+#* outdata.conf and output files, while sharing the           *
+#* converter definitions, the log and the email digest. The   *
+#* stations are listed in Config.py as STATIONS, eg:          *
+#*                                                            *
+#* STATIONS = [                                               *
+#*   {"name": "north", "PORT_NUM": "/dev/ttyS1"},             *
+#*   {"name": "south", "PORT_NUM": "/dev/ttyS2",              *
+#*    "directory": "/home/wx/south",                          *
+#*    "TO_UNIX_FILE_PATH": "/home/wx/south/2UNIX"}]           *
+#*                                                            *
+#* Any setting from Config.py may be overridden per station.  *
+#* The files named in STATION_FILES that are not overridden   *
+#* get the station's name put in front of their file name, so *
+#* that stations never write to the same file. Files that     *
+#* have always lived in the working directory (picdata.conf,  *
+#* pic_status, data_for_dash, ...) are kept in the station's  *
+#* directory, which defaults to its name.                     *
+#* See WeatherScheduler.run_stations() in main.py.            *
+#**************************************************************
+
+import errors
+import Config
+import convert
+import DataConverters
+from handleData import DataReader, DataOutputter
+
+import os
+
+STATIONS = getattr(Config, "STATIONS", [])													#an empty list runs the one station configured in Config.py, as always
+
+STATION_FILES = [																			#settings naming files that each station needs its own copy of
+	"COMMAND_FILE_PATH", "LOCAL_BACKUP_FILE_PATH", "ONE_LINE_FILE_PATH",
+	"RAW_DATA_FILE_PATH", "RAW_ARRAY_DATA_FILE_PATH", "RAW_DATA_BACKUP_PATH",
+	"RAW_ARRAY_DATA_BACKUP_PATH", "TO_UNIX_FILE_PATH", "TO_UNIX_BACKUP_PATH", "SERIAL_JOURNAL_PATH"]
+
+#===========================================================================================================
+#												STATIONCONFIG:
+#===========================================================================================================
+class StationConfig:
+	"""Stands in for Config for one station: its own settings first, then Config's."""
+	def __init__(self, name, settings):
+		self.name = name
+		self.settings = settings
+
+	def __getattr__(self, attr):															#only called for settings not yet looked up
+		if attr in self.settings:
+			value = self.settings[attr]
+		else:
+			value = getattr(Config, attr)													#raises AttributeError as Config would
+			if attr in STATION_FILES and value is not None:
+				head, tail = os.path.split(value.rstrip('/'))
+				value = os.path.join(head, self.name + "_" + tail)
+		setattr(self, attr, value)															#so that the next lookup is an ordinary attribute
+		return value
+
+#===========================================================================================================
+#												STATION:
+#===========================================================================================================
+class Station:
+	"""A DataReader, DataOutputter and set of converters for one PIC."""
+	def __init__(self, settings):
+		self.name = settings["name"]
+		self.directory = settings.get("directory", self.name)
+		self.prefix = "[" + self.name + "] "
+		self.config = StationConfig(self.name, settings)
+		self.activate()
+		self.reader = DataReader(config=self.config, directory=self.directory)
+		self.outputter = DataOutputter(config=self.config, directory=self.directory)
+		self.converters = convert.build_converters()
+		self.acquisition_error = False
+		self.activate()
+
+	def activate(self):
+		"""Points the converters and error messages at this station."""
+		errors.set_prefix(self.prefix)
+		DataConverters.DataConverter.set_in_out(reader=getattr(self, "reader", None),
+			outputter=getattr(self, "outputter", None))
+
+def load_stations():
+	"""Returns a Station for each entry in Config.STATIONS."""
+	stations = [Station(settings) for settings in STATIONS]
+	errors.set_prefix("")
+	return stations
@@ -0,0 +1,193 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds SerialSupervisor, which owns the serial port  *
+#* to the PIC and reconnects to it in the background whenever *
+#* it can't be opened or is lost mid-run. While disconnected  *
+#* it acts as a port that never answers, so DataReader keeps  *
+#* producing frames (of Config.ERROR_VAL) on schedule and the *
+#* station recovers without a restart.                        *
+#**************************************************************
+
+import errors
+import Config
+
+import serial																				#see https://pythonhosted.org/pyserial/index.html
+import threading
+import traceback
+import time
+
+RECONNECT_MIN = getattr(Config, "SERIAL_RECONNECT_MIN", 5)									#seconds before the first reconnection attempt. doubles after each failure...
+RECONNECT_MAX = getattr(Config, "SERIAL_RECONNECT_MAX", 300)								#...up to this many
+DISCONNECTED_REMINDER = getattr(Config, "SERIAL_DISCONNECTED_REMINDER", 21600)				#seconds between reminders that the port is still down (6 hours)
+
+PORT_ERRORS = (serial.SerialException, OSError, IOError, ValueError)						#what pyserial raises when the device goes away (ValueError: port closed)
+
+#===========================================================================================================
+#												SERIALSUPERVISOR:
+#===========================================================================================================
+class SerialSupervisor:
+	"""Stands in for a serial.Serial that may come and go."""
+	def __init__(self, port, baudrate, timeout):
+		self.port_name = port
+		self.baudrate = baudrate
+		self.timeout = timeout
+		self.port = None
+		self.connected = False
+		self.state = "connecting"															#"connecting" until first opened, then "connected" or "disconnected"
+		self.lock = threading.RLock()														#held while using or replacing self.port
+		self.lost_event = threading.Event()													#wakes the supervisor thread when the port is lost
+		self.backoff = RECONNECT_MIN
+		self.failures = 0																	#failed attempts since the port was last open
+		self.reconnects = 0																	#times the port has been reopened after being lost
+		self.down_since = time.time()
+		self.last_reminder = None
+		self.running = False
+		self.prefix = errors.get_prefix()													#the messages of the station the port is for, sent from the thread too
+
+	def start(self):
+		"""
+		Tries once to open the port, then starts the thread that keeps it open.
+		Never blocks for longer than one attempt.
+		"""
+		self.connect()
+		self.running = True
+		self.thread = threading.Thread(target=self.supervise)
+		self.thread.daemon = True
+		self.thread.start()
+
+	def stop(self):
+		self.running = False
+		self.lost_event.set()
+		self.thread.join()
+		with self.lock:
+			self.close_port()
+
+	def supervise(self):
+		"""Body of the supervisor thread: reconnects with capped exponential backoff."""
+		errors.set_prefix(self.prefix)
+		while self.running:
+			if self.connected:
+				self.lost_event.wait(60)
+				self.lost_event.clear()
+				continue
+			self.lost_event.wait(self.backoff)
+			self.lost_event.clear()
+			if self.running and not self.connected and not self.connect():
+				self.backoff = min(self.backoff*2, RECONNECT_MAX)
+
+	def connect(self):
+		"""Makes one attempt to open the port. Returns True if it is open."""
+		try:
+			errors.debug("Attempting serial port connection...")
+			port = serial.Serial(port=self.port_name, baudrate=self.baudrate, timeout=self.timeout)
+		except PORT_ERRORS:
+			self.failures += 1
+			now = time.time()
+			if (self.failures == 2 and self.state == "connecting") or (self.last_reminder is not None and now - self.last_reminder >= DISCONNECTED_REMINDER):
+				errors.error("Failed to connect to serial port " + str(self.port_name) + ". TS-4200 not " +
+					"functional until further notice; frames will hold no data. Attempts to connect will " +
+					"continue indefinitely. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+				self.last_reminder = now
+			errors.debug("Serial connection failed, next attempt in " + str(self.backoff) + " seconds.")
+			return False
+		with self.lock:
+			self.port = port
+			self.connected = True
+			if self.state == "disconnected":
+				self.reconnects += 1
+			if self.failures > 1 or self.state == "disconnected":							#alert to success if connection has failed previously
+				errors.error("Serial connection successful after " + str(int(time.time() - self.down_since)) +
+					" seconds without one.")
+			self.state = "connected"
+		errors.log.error("Serial connection successful.")
+		self.failures = 0
+		self.backoff = RECONNECT_MIN
+		self.last_reminder = None
+		return True
+
+	def lost(self):
+		"""Called when the open port fails: closes it and wakes the supervisor thread."""
+		with self.lock:
+			if not self.connected:
+				return
+			errors.error("Lost serial connection to PIC. Reconnecting in the background; frames " +
+				"will hold no data until then. Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+			self.close_port()
+			self.state = "disconnected"
+			self.down_since = time.time()
+			self.last_reminder = self.down_since
+		self.lost_event.set()
+
+	def close_port(self):
+		self.connected = False
+		if self.port is not None:
+			try:
+				self.port.close()
+			except PORT_ERRORS:
+				pass
+			self.port = None
+
+##PORT METHODS================================================================================================
+																							#while disconnected, the port reads as silent and writes go nowhere
+	def write(self, data):
+		with self.lock:
+			if self.connected:
+				try:
+					return self.port.write(data)
+				except PORT_ERRORS:
+					self.lost()
+		return 0
+
+	def read(self, size=1):
+		with self.lock:
+			if self.connected:
+				try:
+					return self.port.read(size)
+				except PORT_ERRORS:
+					self.lost()
+		return ""
+
+	def readline(self, *args, **kwargs):
+		with self.lock:
+			if self.connected:
+				try:
+					return self.port.readline(*args, **kwargs)
+				except PORT_ERRORS:
+					self.lost()
+		return ""
+
+	def inWaiting(self):
+		with self.lock:
+			if self.connected:
+				try:
+					return self.port.inWaiting()
+				except PORT_ERRORS:
+					self.lost()
+		return 0
+
+	def flushInput(self):
+		with self.lock:
+			if self.connected:
+				try:
+					self.port.flushInput()
+				except PORT_ERRORS:
+					self.lost()
+
+	def fileno(self):
+		"""Returns the port's file descriptor, for select(), or None while disconnected."""
+		with self.lock:
+			if self.connected:
+				return self.port.fileno()
+		return None
+
+	def close(self):
+		self.stop()
+
+##STATUS======================================================================================================
+	def status(self):
+		"""Returns a line describing the connection."""
+		line = "Serial port " + str(self.port_name) + " " + self.state + ", reopened " + str(self.reconnects) + " times."
+		if not self.connected:
+			line += " Down for " + str(int(time.time() - self.down_since)) + " seconds."
+		return line
@@ -0,0 +1,170 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds LookupTable, which stands in for an expensive *
+#* conversion formula (the RTD polynomial and Steinhart-Hart  *
+#* thermistor equations in DataConverters.py) with a table of *
+#* its values over every raw reading the ADC can give. Tables *
+#* are built in float the first time they are needed, saved   *
+#* to disk so that they are only built again when their       *
+#* formula changes, and checked against the formula computed  *
+#* exactly in Decimal.                                        *
+#**************************************************************
+
+import errors
+import Config
+
+from decimal import Decimal
+from array import array
+import hashlib
+import os
+import traceback
+import types
+
+LOOKUP_TABLES = getattr(Config, "LOOKUP_TABLES", True)										#False converts by the formulas every time, as before
+LOOKUP_TABLE_PATH = getattr(Config, "LOOKUP_TABLE_PATH", "tables")							#directory the tables are saved in
+LOOKUP_EXACT_BITS = getattr(Config, "LOOKUP_EXACT_BITS", 17)								#inputs of up to this many bits get a value for every reading...
+LOOKUP_KNOT_BITS = getattr(Config, "LOOKUP_KNOT_BITS", 12)									#...wider ones get 2**this evenly spaced knots, interpolated between
+LOOKUP_SAMPLES = 64																		#readings checked against the exact formula when a table is built or loaded
+
+#===========================================================================================================
+#												LOOKUPTABLE:
+#===========================================================================================================
+class LookupTable:
+	"""
+	Converts integer readings from 0 to 2**bits - 1 by looking them up in a
+	table of formula(reading, float, coefficients). When bits is more than
+	LOOKUP_EXACT_BITS, the table holds evenly spaced knots instead, and
+	readings between them are interpolated by the cubic through the four
+	nearest (which is exact for the RTD polynomial of a reading). formula must
+	compute the same thing given Decimal in place of float: that is the
+	exact conversion, used for anything the table can't answer (readings
+	out of its range or not integers, or where the formula fails) and to
+	check the table, which is only used if it is within tolerance of it.
+	"""
+	def __init__(self, name, formula, coefficients, bits, tolerance):
+		self.name = name
+		self.formula = formula
+		self.coefficients = coefficients
+		self.bits = bits
+		self.size = 2**bits
+		self.tolerance = tolerance
+		if bits > LOOKUP_EXACT_BITS:
+			self.step = 2**(bits - LOOKUP_KNOT_BITS)										#readings between knots
+		else:
+			self.step = 1
+		key = repr((formula.__name__, hashlib.md5(repr(code_key(formula.__code__))).hexdigest(),
+			coefficients, bits, self.step))													#a table is only reused for the same formula (as compiled), coefficients and knots
+		self.path = os.path.join(LOOKUP_TABLE_PATH, name + "-" + hashlib.md5(key).hexdigest()[:12] + ".tbl")
+		self.table = None
+		self.usable = LOOKUP_TABLES
+
+	def exact(self, raw):
+		return self.formula(raw, Decimal, self.coefficients)
+
+	def convert(self, raw):
+		"""Returns the formula's value for raw, from the table where it can."""
+		if self.usable and isinstance(raw, (int, long, str)):
+			if self.table is None:
+				self.load()
+			try:
+				reading = int(raw)
+			except ValueError:
+				reading = -1
+			if self.usable and 0 <= reading < self.size:
+				value = self.lookup(reading)
+				if value == value:															#nan where the formula fails: let it fail in earnest
+					return value
+		return self.exact(raw)
+
+	def lookup(self, reading):
+		"""Returns the table's value for reading, which must be in range."""
+		if self.step == 1:
+			return self.table[reading]
+		knot, offset = divmod(reading, self.step)
+		if not offset:
+			return self.table[knot + 1]
+		y0, y1, y2, y3 = self.table[knot:knot + 4]											#the knots before and after reading and one more on each side
+		t = float(offset)/self.step
+		return (-y0*t*(t - 1)*(t - 2)/6 + y1*(t + 1)*(t - 1)*(t - 2)/2 -
+			y2*(t + 1)*t*(t - 2)/2 + y3*(t + 1)*t*(t - 1)/6)
+
+	def value(self, reading):
+		"""Returns the formula's value for reading in float, or nan where it fails."""
+		try:
+			return float(self.formula(reading, float, self.coefficients))
+		except (ArithmeticError, ValueError):
+			return float("nan")
+
+	def load(self):
+		"""
+		Reads the table from disk, or builds and saves it, then checks it. A
+		table read from disk that is out of tolerance (its formula calls
+		something that has since changed, say) is built again first.
+		"""
+		if self.step == 1:
+			readings = range(self.size)
+		else:
+			readings = range(-self.step, self.size + 2*self.step, self.step)				#a knot either side of the first and last to interpolate with
+		self.table = array('d')
+		try:
+			with open(self.path, 'rb') as saved:
+				self.table.fromfile(saved, len(readings))
+			errors.debug("Loaded lookup table " + self.path)
+			if self.worst() > self.tolerance:
+				errors.debug("Lookup table " + self.path + " no longer matches its formula, building it again.")
+				self.build(readings)
+		except (IOError, OSError, EOFError):
+			self.build(readings)
+		self.check()
+
+	def build(self, readings):
+		self.table = array('d', (self.value(reading) for reading in readings))
+		self.save()
+
+	def save(self):
+		try:
+			if not os.path.exists(LOOKUP_TABLE_PATH):
+				os.makedirs(LOOKUP_TABLE_PATH)
+			with open(self.path + ".new", 'wb') as saving:
+				self.table.tofile(saving)
+			os.rename(self.path + ".new", self.path)										#so that a table cut short by a crash is never loaded
+			errors.debug("Built lookup table " + self.path)
+		except (IOError, OSError):
+			errors.info("Unable to save lookup table " + self.path + "; it will be built again at next start. " +
+				"Error message: " + traceback.format_exc(Config.TRACEBACK_LIMIT))
+
+	def check(self):
+		"""If the table differs from the exact formula by more than tolerance (see worst()), alerts and stops using it."""
+		worst = self.worst()
+		if worst > self.tolerance:
+			self.usable = False
+			errors.error("Lookup table " + self.name + " differs from its formula by up to " + repr(worst) +
+				", more than its tolerance of " + repr(self.tolerance) + ". Converting by the formula instead.")
+		else:
+			errors.debug("Lookup table " + self.name + " is within " + repr(worst) + " of its formula.")
+
+	def worst(self):
+		"""
+		Returns the most the table differs from the exact formula at
+		LOOKUP_SAMPLES readings spread over its range, halfway between knots
+		where it interpolates.
+		"""
+		worst = 0.0
+		spacing = max(self.size//LOOKUP_SAMPLES, 1)
+		for reading in range(spacing//2, self.size, spacing):
+			if self.step > 1:
+				reading = (reading//self.step)*self.step + self.step//2
+			value = self.lookup(reading)
+			try:
+				exact = float(self.exact(reading))
+			except (ArithmeticError, ValueError):
+				continue																	#the formula fails here, so the table gives way to it
+			if value == value:
+				worst = max(worst, abs(value - exact))
+		return worst
+
+def code_key(code):
+	"""Returns the bytecode, constants and names of code, a function's __code__, with those of any function defined in it."""
+	consts = tuple(code_key(const) if isinstance(const, types.CodeType) else const for const in code.co_consts)
+	return (code.co_code, consts, code.co_names)
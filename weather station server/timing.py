@@ -0,0 +1,99 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Optional timing of each converter's safe_process,   *
+#* phase by phase, to find which converters and which phases  *
+#* take up the cycle. Turned on by CONVERTER_TIMING in        *
+#* Config.py, which makes DataConverter.timed_safe_process    *
+#* stand in for safe_process; with it off nothing is timed    *
+#* (see untimed()). Each converter's times are kept in fixed  *
+#* histograms (see PhaseTimer), summarised in daily_checks    *
+#* and written to CONVERTER_TIMING_PATH when main.py receives *
+#* SIGUSR2.                                                   *
+#**************************************************************
+
+import Config
+
+import time
+
+CONVERTER_TIMING = getattr(Config, "CONVERTER_TIMING", False)								#time every converter's safe_process. ConversionPlan then runs every converter by it
+CONVERTER_TIMING_PATH = getattr(Config, "CONVERTER_TIMING_PATH", "converter_timing")		#file the full histograms are written to on SIGUSR2
+TIMING_SUMMARY_TOP = getattr(Config, "TIMING_SUMMARY_TOP", 10)								#converters listed in the daily summary, slowest first
+
+PHASES = ["get", "process", "round", "check_range", "receive", "respond"]
+GET, PROCESS, ROUND, CHECK_RANGE, RECEIVE, RESPOND = range(len(PHASES))
+BUCKETS = 16																				#bucket 0 counts times under 1us, bucket i under 2**i us, and the last all slower
+
+clock = time.time
+
+def untimed(phase, start):
+	"""Stands in for PhaseTimer.lap when nothing is timed."""
+	return start
+
+#===========================================================================================================
+#												PHASETIMER:
+#===========================================================================================================
+class PhaseTimer:
+	"""Histograms of one converter's time in each phase of safe_process."""
+	def __init__(self):
+		self.reset()
+
+	def reset(self):
+		self.counts = [[0]*BUCKETS for phase in PHASES]
+		self.totals = [0.0]*len(PHASES)
+
+	def lap(self, phase, start):
+		"""Records the time since start in phase. Returns the time now, the start of the next phase."""
+		now = clock()
+		elapsed = now - start
+		self.totals[phase] += elapsed
+		self.counts[phase][min(int(elapsed*1000000).bit_length(), BUCKETS - 1)] += 1
+		return now
+
+	def total(self):
+		return sum(self.totals)
+
+	def calls(self):
+		return sum(self.counts[GET])
+
+def timers(converters):
+	"""Returns (conv label, PhaseTimer) for each converter that has been timed."""
+	return [(converter.conv_label, converter.timer) for converter in converters if getattr(converter, "timer", None) is not None]
+
+def summary(converters, reset=False):
+	"""
+	Returns lines giving the time spent in each phase by all converters, and
+	by each of the TIMING_SUMMARY_TOP slowest, since the last reset.
+	"""
+	timed = timers(converters)
+	if not timed:
+		return "No converter timings."
+	totals = [sum(timer.totals[phase] for label, timer in timed) for phase in range(len(PHASES))]
+	lines = ["Converter time by phase: " + ", ".join(PHASES[phase] + " " + str(round(totals[phase], 3)) + "s"
+		for phase in range(len(PHASES))) + "."]
+	timed.sort(key=lambda pair: pair[1].total(), reverse=True)
+	for label, timer in timed[:TIMING_SUMMARY_TOP]:
+		calls = timer.calls()
+		lines.append(label + ": " + str(round(timer.total(), 3)) + "s in " + str(calls) + " calls, mean " +
+			str(round(1000000*timer.total()/max(calls, 1), 1)) + "us (" + ", ".join(PHASES[phase] + " " +
+			str(round(1000000*timer.totals[phase]/max(calls, 1), 1)) + "us" for phase in range(len(PHASES))) + ").")
+	if reset:
+		for label, timer in timed:
+			timer.reset()
+	return "\n".join(lines)
+
+def dump(stations, path=CONVERTER_TIMING_PATH):
+	"""
+	Writes every converter's histograms to path, a tab separated line per
+	converter and phase: station, conv label, phase, calls, total seconds,
+	then the count in each bucket. stations is a list of (station name,
+	converters).
+	"""
+	with open(path, 'w') as out:
+		out.write("\t".join(["station", "label", "phase", "calls", "seconds"] +
+			["<" + str(2**bucket) + "us" for bucket in range(BUCKETS - 1)] + ["slower"]) + "\n")
+		for name, converters in stations:
+			for label, timer in timers(converters):
+				for phase in range(len(PHASES)):
+					out.write("\t".join([name, label, PHASES[phase], str(sum(timer.counts[phase])),
+						repr(timer.totals[phase])] + [str(count) for count in timer.counts[phase]]) + "\n")
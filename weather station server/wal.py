@@ -0,0 +1,234 @@
+#!/usr/bin/python
+
+#**************************************************************
+#* Notes: Holds WriteAheadLog, which every row a              *
+#* DataOutputter saves is appended to, numbered, before it is *
+#* written to any of the files it goes to (2UNIX, the flash   *
+#* and local backups). Each of those is a sink with a         *
+#* checkpoint, the number of the last row it has taken,       *
+#* recorded in the log. A sink that fails (or a drive that is *
+#* unmounted) is given the rows after its checkpoint once it  *
+#* works again, and after a crash each sink starts again from *
+#* its last recorded checkpoint, so that no row is lost and   *
+#* none but those of a cycle cut short are written twice.     *
+#* Once every sink has every row the log is emptied, leaving  *
+#* only the checkpoints. The log is synced to disk once a     *
+#* cycle, as the checkpoints are recorded, and a sink's       *
+#* checkpoint is only moved up to rows its file has synced    *
+#* (as often as OUTPUT_SYNC_ROWS and OUTPUT_SYNC_SECONDS      *
+#* say), so that a power cut loses nothing a checkpoint says  *
+#* was taken.                                                 *
+#**************************************************************
+
+import collections
+import os
+
+CHECKPOINT = "="																			#starts a line of checkpoints, where rows start with their number
+COMPACT_LINES = 100																			#lines the log holds that are no longer needed before it is rewritten without them...
+COMPACT_SHARE = 4																			#...once they are at least 1/COMPACT_SHARE of the rows still needed
+
+#===========================================================================================================
+#												WRITEAHEADLOG:
+#===========================================================================================================
+class WriteAheadLog:
+	"""
+	Rows numbered in order, each kept in file (an OutputFile) until every
+	one of sinks, the names of the places rows go, has taken it. A row is
+	a line, "<number>\\t<row>", and a checkpoint line "=\\t<sink>:<number>..."
+	for every sink. The log is read back when it is made, cutting off a
+	line left half written by a crash. A sink's checkpoint must only be
+	moved past rows it has synced to disk.
+	"""
+	def __init__(self, file, sinks):
+		self.file = file
+		self.path = file.path
+		self.sinks = list(sinks)
+		self.seq = 0																		#number of the last row appended
+		self.checkpoints = dict((sink, 0) for sink in self.sinks)							#number of the last row each sink has taken
+		self.offsets = collections.deque()													#(number, offset in the file) of each row in it still to be taken, oldest first
+		self.dead = 0																		#lines in the file no longer needed: rows every sink has taken and checkpoints since recorded again
+		self.last = None																	#(number, row) of the last row appended, which sinks are normally given
+		self.unlogged = collections.deque()													#(number, row) of each row that couldn't be written to the log, kept until every sink has taken it
+		self.torn = None																	#size of the log before a write that failed and couldn't be cut off, to be cut back to
+		self.existed = os.path.exists(self.path)
+		self.recover()
+
+	def recover(self):
+		"""Reads back the rows in the log and the sinks' last recorded checkpoints."""
+		if not self.existed:
+			return
+		recorded = None
+		offset = 0
+		with open(self.path, 'rb') as log:
+			for line in log:
+				try:
+					if not line.endswith('\n'):
+						raise ValueError("Line cut short.")
+					head, text = line.split('\t', 1)
+					if head == CHECKPOINT:
+						recorded = dict((sink, int(seq)) for sink, seq in
+							(pair.rsplit(':', 1) for pair in text.rstrip('\n').split('\t')))
+						self.seq = max([self.seq] + recorded.values())
+						self.dead += 1
+					else:
+						self.seq = int(head)
+						self.offsets.append((self.seq, offset))
+				except ValueError:																#a line left half written (or mangled): the log ends before it
+					break
+				offset += len(line)
+		if offset < os.path.getsize(self.path):
+			with open(self.path, 'r+b') as log:
+				log.truncate(offset)
+		if recorded is not None:															#a sink added since the checkpoints were recorded starts from now
+			for sink in self.sinks:
+				self.checkpoints[sink] = recorded.get(sink, self.seq)
+
+	def append(self, row):
+		"""
+		Numbers row (a line) and appends it to the log, to be synced to disk by
+		commit(). Raises IOError or OSError if it can't be written, though sinks
+		are still given it: it is kept in memory instead, until every sink has
+		taken it.
+		"""
+		self.seq += 1
+		self.last = (self.seq, row)
+		line = str(self.seq) + '\t' + row
+		try:
+			self.write(line)
+		except (IOError, OSError):
+			self.unlogged.append(self.last)
+			raise
+		self.offsets.append((self.seq, self.file.handle.tell() - len(line)))
+
+	def pending(self, sink, limit=None):
+		"""Returns (number, row) for every row after sink's checkpoint, oldest first, or the first limit of them."""
+		return self.after(self.checkpoints[sink], limit)
+
+	def after(self, seq, limit=None):
+		"""Returns (number, row) for every row after seq, oldest first, or the first limit of them."""
+		start = seq + 1
+		if start > self.seq:
+			return []
+		if self.last is not None and self.last[0] == start:								#the usual case: only the row just appended
+			return [self.last]
+		rows = self.read(start, limit)
+		if self.unlogged and self.unlogged[-1][0] >= start:								#with the rows that couldn't be logged, in their place
+			rows = sorted(rows + [(seq, row) for seq, row in self.unlogged if seq >= start])[:limit]
+		return rows
+
+	def read(self, start, limit=None):
+		"""Returns (number, row) for every row in the log numbered start or after, or the first limit of them."""
+		for seq, offset in self.offsets:
+			if seq >= start:
+				break
+		else:
+			return []
+		rows = []
+		with open(self.path, 'rb') as log:
+			log.seek(offset)
+			for line in log:
+				head, text = line.split('\t', 1)
+				if head != CHECKPOINT and int(head) >= start:
+					rows.append((int(head), text))
+					if len(rows) == limit:
+						break
+		return rows
+
+	def checkpoint(self, sink, seq):
+		"""Notes that sink has taken every row up to seq. It is recorded by commit()."""
+		self.checkpoints[sink] = seq
+
+	def commit(self):
+		"""
+		Records every sink's checkpoint in the log, syncing it to disk along with
+		the rows appended since it last was. If every sink has taken every row,
+		empties the log of them first. If only some rows remain to be taken (a
+		sink behind, as a thread may be, or one that keeps failing) rewrites the
+		log with just those once it holds COMPACT_LINES lines that aren't needed
+		and at least 1/COMPACT_SHARE as many as are, so that checkpoints don't
+		pile up however long a sink is behind, while rewriting no more than
+		about COMPACT_SHARE rows a cycle on average. Raises IOError or OSError
+		if it can't be written, in which case sinks may be given rows again
+		after a crash.
+		"""
+		line = CHECKPOINT + '\t' + '\t'.join(sink + ":" + str(self.checkpoints[sink]) for sink in self.sinks) + '\n'
+		oldest = min(self.checkpoints.values())
+		while self.unlogged and self.unlogged[0][0] <= oldest:
+			self.unlogged.popleft()
+		if oldest >= self.seq:
+			self.write(line, fresh=True)
+			self.file.sync()
+			self.offsets.clear()
+			self.dead = 0
+			return
+		while self.offsets and self.offsets[0][0] <= oldest:								#rows every sink has taken are never read again
+			self.offsets.popleft()
+			self.dead += 1
+		if self.dead >= COMPACT_LINES and len(self.offsets) <= COMPACT_SHARE*self.dead:
+			self.compact(line, oldest)
+		else:
+			self.write(line)
+			self.file.sync()
+			self.dead += 1																	#the checkpoint before it, or this one once it has been recorded again
+
+	def write(self, text, fresh=False):
+		"""
+		Writes text to the log (replacing what it holds with fresh). If it fails
+		part way (the disk filling up, say), cuts off what was written of it, so
+		that the next line doesn't run on from half a line, then raises IOError
+		or OSError. If that fails too, it is cut off before the next write.
+		"""
+		if self.torn is not None and not fresh:
+			with open(self.path, 'r+b') as log:
+				log.truncate(self.torn)
+		self.torn = None
+		size = os.path.getsize(self.path) if os.path.exists(self.path) and not fresh else 0
+		try:
+			self.file.write(text, fresh)
+		except (IOError, OSError):
+			self.cut(size)																	#in a function of its own, so that raise gives the write's error
+			raise
+
+	def cut(self, size):
+		"""Cuts the log back to size bytes, or notes that it is to be by the next write."""
+		try:
+			with open(self.path, 'r+b') as log:
+				log.truncate(size)
+		except (IOError, OSError):
+			self.torn = size
+
+	def compact(self, line, oldest):
+		"""
+		Rewrites the log as line followed by the rows after oldest, by way of a
+		new file renamed over it, so that a crash leaves one or the other. Rows
+		that couldn't be logged before are written with the rest.
+		"""
+		rows = self.after(oldest)
+		text = [line]
+		offsets = collections.deque()
+		offset = len(line)
+		for seq, row in rows:
+			text.append(str(seq) + '\t' + row)
+			offsets.append((seq, offset))
+			offset += len(text[-1])
+		with open(self.path + ".new", 'wb') as new:
+			new.write("".join(text))
+			new.flush()
+			os.fsync(new.fileno())
+		os.rename(self.path + ".new", self.path)											#self.file sees it is no longer what it has open and reopens it
+		self.offsets = offsets
+		self.unlogged.clear()
+		self.torn = None
+		self.dead = 0
+
+	def adopt(self, rows, sink):
+		"""
+		Appends rows that only sink has yet to take, such as those an older
+		version left in the local backup for the flash drive, and commits.
+		"""
+		for row in rows:
+			self.append(row)
+		for other in self.sinks:
+			if other != sink:
+				self.checkpoint(other, self.seq)
+		self.commit()